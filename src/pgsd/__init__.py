@@ -23,11 +23,27 @@ Example:
                          '--target-host', 'localhost', '--target-db', 'db2'])
 """
 
-from .core.analyzer import DiffResult
-from .config.schema import DatabaseConfig, PGSDConfiguration
-from .database.manager import DatabaseManager
-from .reports import create_reporter, ReportFormat
-from .cli import CLIManager
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.analyzer import DiffResult
+    from .config.schema import DatabaseConfig, PGSDConfiguration
+    from .database.manager import DatabaseManager
+    from .reports import create_reporter, ReportFormat
+    from .cli import CLIManager
+
+# Public names are imported from their submodules on first access, so that
+# importing the package (e.g. for the ``pgsd`` entry point) stays cheap
+_LAZY_EXPORTS = {
+    "DiffResult": ".core.analyzer",
+    "DatabaseConfig": ".config.schema",
+    "PGSDConfiguration": ".config.schema",
+    "DatabaseManager": ".database.manager",
+    "create_reporter": ".reports",
+    "ReportFormat": ".reports",
+    "CLIManager": ".cli",
+}
 
 # Version information
 __version__ = "1.0.0"
@@ -55,3 +71,19 @@ __all__ = [
     # CLI interface
     "CLIManager",
 ]
+
+
+def __getattr__(name):
+    """Import public names lazily from their submodules."""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -20,6 +20,7 @@ class ConnectionTimeout:
     DEFAULT_CONNECT_TIMEOUT = 30  # seconds
     DEFAULT_QUERY_TIMEOUT = 60  # seconds
     DEFAULT_HEALTH_CHECK_TIMEOUT = 10  # seconds
+    HEALTH_CACHE_TTL = 1.0  # seconds
     MAX_CONNECT_TIMEOUT = 300  # seconds
     MIN_CONNECT_TIMEOUT = 1  # seconds
 
@@ -35,6 +36,7 @@ class PoolConstants:
     DEFAULT_IDLE_TIMEOUT = 600  # seconds (10 minutes)
     DEFAULT_MAX_LIFETIME = 3600  # seconds (1 hour)
     HEALTH_CHECK_INTERVAL = 60  # seconds
+    VALIDATION_INTERVAL = 30  # seconds idle before a borrowed connection is re-tested
 
 
 class DatabaseConstants:
@@ -44,6 +46,7 @@ class DatabaseConstants:
     DEFAULT_SCHEMA = "public"
     MIN_SUPPORTED_VERSION = "13.0"
     RECOMMENDED_VERSION = "14.0"
+    VERSION_CACHE_TTL = 300.0  # seconds
 
     # Query constants
     MAX_QUERY_LENGTH = 1024 * 1024  # 1MB
@@ -115,6 +118,37 @@ class QueryConstants:
     # Health check queries
     HEALTH_CHECK_QUERY = "SELECT 1"
 
+    # Liveness, version and permission checks in a single round-trip
+    VERIFY_ALL_QUERY = """
+        SELECT
+            version() AS version,
+            EXISTS (
+                SELECT 1 FROM pg_database WHERE datname = current_database()
+            ) AS can_connect,
+            CASE WHEN EXISTS (
+                SELECT 1 FROM pg_namespace WHERE nspname = %(schema)s
+            )
+            THEN has_schema_privilege(current_user, %(schema)s, 'USAGE')
+            ELSE false END AS can_read_schema,
+            has_table_privilege(
+                current_user, 'information_schema.tables', 'SELECT'
+            ) AS can_read_tables,
+            has_table_privilege(
+                current_user, 'information_schema.views', 'SELECT'
+            ) AS can_read_views,
+            has_table_privilege(
+                current_user, 'information_schema.table_constraints', 'SELECT'
+            ) AS can_read_constraints,
+            ARRAY(
+                SELECT schema_name
+                FROM information_schema.schemata
+                WHERE schema_name NOT IN
+                    ('information_schema', 'pg_catalog', 'pg_toast')
+                AND has_schema_privilege(current_user, schema_name, 'USAGE')
+                ORDER BY schema_name
+            ) AS accessible_schemas
+    """
+
     CONNECTION_INFO_QUERY = """
         SELECT
             current_database() as database_name,
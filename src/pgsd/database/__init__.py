@@ -28,6 +28,10 @@ Usage:
     manager.return_source_connection(source_conn)
     manager.return_target_connection(target_conn)
 
+    # Or borrow with automatic return
+    async with manager.acquire_source() as conn:
+        ...
+
     # Cleanup
     await manager.close_all()
 """
@@ -32,6 +32,7 @@ from ..models.database import (
     DatabasePermissions,
     ConnectionInfo,
     ConnectionStatus,
+    VerificationResult,
 )
 from ..error_handling.retry import retry_on_error
 
@@ -365,6 +366,55 @@ class DatabaseConnector:
             self._connection_info.error_message = str(e)
             return False
 
+    async def verify_all(self) -> VerificationResult:
+        """Test connection, detect version and check permissions at once.
+
+        Sends a single query instead of separate health, version and
+        permission queries, so verification costs one round-trip.
+
+        Returns:
+            Combined verification result
+        """
+        try:
+            result = await self.execute_query(
+                QueryConstants.VERIFY_ALL_QUERY,
+                {"schema": self.db_config.schema or "public"},
+            )
+            row = result[0]
+
+            self._version_info = PostgreSQLVersion.parse(row["version"])
+            self._permissions = DatabasePermissions(
+                can_connect=bool(row["can_connect"]),
+                can_read_schema=bool(row["can_read_schema"]),
+                can_read_tables=bool(row["can_read_tables"]),
+                can_read_views=bool(row["can_read_views"]),
+                can_read_constraints=bool(row["can_read_constraints"]),
+                accessible_schemas=list(row["accessible_schemas"] or []),
+            )
+        except Exception as e:
+            self._connection_info.status = ConnectionStatus.ERROR
+            self._connection_info.error_message = str(e)
+            return VerificationResult(alive=False, error_message=str(e))
+
+        self._connection_info.status = ConnectionStatus.CONNECTED
+        self._connection_info.last_activity = datetime.now(timezone.utc)
+        self._connection_info.version = self._version_info
+        self._connection_info.permissions = self._permissions
+
+        self.logger.info(
+            LogMessages.VERSION_DETECTED,
+            extra={
+                "connection_id": self.connection_id,
+                "version": str(self._version_info),
+            },
+        )
+
+        return VerificationResult(
+            alive=True,
+            version=self._version_info,
+            permissions=self._permissions,
+        )
+
     async def get_connection_info(self) -> ConnectionInfo:
         """Get connection information.
 
@@ -1,11 +1,17 @@
 """Database manager for PGSD application."""
 
+import asyncio
+import functools
 import logging
-from typing import Optional, Dict, Any
+import time
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Dict, Any, Tuple
 from datetime import datetime
 
-from ..config.schema import PGSDConfiguration
-from ..constants.database import DatabaseConstants
+from ..config.schema import DatabaseConfig, PGSDConfiguration
+from ..constants.database import ConnectionTimeout, DatabaseConstants
 from ..exceptions.database import (
     DatabaseConnectionError,
     DatabaseVersionError,
@@ -15,6 +21,74 @@ from ..models.database import PostgreSQLVersion, ConnectionInfo, PoolHealth
 from .pool import ConnectionPool
 from .connector import DatabaseConnector
 
+# Pool names, in the order status results are reported
+_POOL_NAMES = ("source", "target")
+
+# Minimum supported server version, parsed once at import time
+_MIN_SUPPORTED_VERSION = PostgreSQLVersion.parse(
+    DatabaseConstants.MIN_SUPPORTED_VERSION
+)
+
+
+class _LazyStr:
+    """Defer ``str(value)`` until a log handler actually formats the record."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+def _close_pools(pools: Dict[str, ConnectionPool]) -> None:
+    """Close connection pools left open when a manager is garbage collected.
+
+    Args:
+        pools: Connection pools to close, keyed by name
+    """
+    for pool in list(pools.values()):
+        try:
+            pool.close()
+        except Exception:
+            pass
+
+
+def _ttl_cached(key: str, ttl: float = ConnectionTimeout.HEALTH_CACHE_TTL):
+    """Cache a status coroutine's result for a short time.
+
+    Concurrent callers for the same key wait on a per-key lock so only one
+    of them probes the databases; the rest reuse the stored result.
+
+    Args:
+        key: Cache key for the decorated method
+        ttl: Time-to-live of a cached result in seconds
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, use_cache: bool = True, **kwargs):
+            if not use_cache:
+                return await func(self, *args, **kwargs)
+
+            cached = self._health_cache.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return dict(cached[1])
+
+            async with self._health_locks[key]:
+                cached = self._health_cache.get(key)
+                if cached and time.monotonic() - cached[0] < ttl:
+                    return dict(cached[1])
+
+                result = await func(self, *args, **kwargs)
+                self._health_cache[key] = (time.monotonic(), result)
+                return dict(result)
+
+        return wrapper
+
+    return decorator
+
 
 class DatabaseManager:
     """High-level database connection management."""
@@ -28,74 +102,169 @@ class DatabaseManager:
         self.config = config
         self.logger = logging.getLogger(__name__)
 
-        # Connection pools
-        self.source_pool: Optional[ConnectionPool] = None
-        self.target_pool: Optional[ConnectionPool] = None
+        # Connection pools keyed by "source" / "target", created on first use
+        self.pools: Dict[str, ConnectionPool] = {}
+        self._pool_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
         # Initialization state
         self._initialized = False
         self._initialization_time: Optional[datetime] = None
+        self._init_monotonic: Optional[float] = None
+        self._closed = True
+        self._finalizer: Optional[weakref.finalize] = None
+        # Serializes initialize() and close_all(); created inside the event loop
+        self._init_lock: Optional[asyncio.Lock] = None
+
+        # Short-lived cache for status probes
+        self._health_cache: Dict[str, Tuple[float, Any]] = {}
+        self._health_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # Log context derived from configuration, built once
+        self._log_ctx = {
+            "source_host": config.source_db.host,
+            "source_database": config.source_db.database,
+            "target_host": config.target_db.host,
+            "target_database": config.target_db.database,
+        }
 
-        self.logger.info(
-            "Database manager initialized",
-            extra={
-                "source_host": config.source_db.host,
-                "source_database": config.source_db.database,
-                "target_host": config.target_db.host,
-                "target_database": config.target_db.database,
-            },
-        )
+        self.logger.info("Database manager initialized", extra=self._log_ctx)
+
+    @property
+    def source_pool(self) -> Optional[ConnectionPool]:
+        """Source database connection pool."""
+        return self.pools.get("source")
+
+    @source_pool.setter
+    def source_pool(self, pool: Optional[ConnectionPool]) -> None:
+        self._set_pool("source", pool)
+
+    @property
+    def target_pool(self) -> Optional[ConnectionPool]:
+        """Target database connection pool."""
+        return self.pools.get("target")
+
+    @target_pool.setter
+    def target_pool(self, pool: Optional[ConnectionPool]) -> None:
+        self._set_pool("target", pool)
+
+    def _set_pool(self, name: str, pool: Optional[ConnectionPool]) -> None:
+        """Store or drop a named connection pool.
+
+        Args:
+            name: Pool name ("source" or "target")
+            pool: Connection pool, or None to drop it
+        """
+        if pool is None:
+            self.pools.pop(name, None)
+        else:
+            self.pools[name] = pool
+
+    def _db_config(self, name: str) -> DatabaseConfig:
+        """Get database configuration for a named pool.
+
+        Args:
+            name: Pool name ("source" or "target")
+
+        Returns:
+            Database configuration
+        """
+        return self.config.source_db if name == "source" else self.config.target_db
 
     async def initialize(self) -> None:
-        """Initialize database connections and pools.
+        """Initialize database manager.
+
+        Connection pools are not opened here. Each pool is created and
+        verified the first time a connection to its database is requested,
+        so operations that only touch one database never connect to the
+        other.
+
+        Concurrent calls are serialized; only the first one initializes.
 
-        Raises:
-            DatabaseManagerError: If initialization fails
         """
+        async with self._get_init_lock():
+            await self._initialize()
+
+    async def _initialize(self) -> None:
+        """Initialize database manager while holding the init lock."""
         if self._initialized:
             self.logger.warning("Database manager already initialized")
             return
 
-        try:
-            self.logger.info("Initializing database connections")
+        self.logger.info("Initializing database connections")
 
-            # Create source connection pool
-            self.source_pool = ConnectionPool(
-                self.config.source_db,
-                max_connections=self.config.system.max_connections,
-            )
+        self._closed = False
 
-            # Create target connection pool
-            self.target_pool = ConnectionPool(
-                self.config.target_db,
-                max_connections=self.config.system.max_connections,
-            )
+        # Close pools if the manager is dropped without close_all()
+        self._finalizer = weakref.finalize(self, _close_pools, self.pools)
 
-            # Verify connections
-            await self._verify_initial_connections()
+        self._initialized = True
+        self._initialization_time = datetime.utcnow()
+        self._init_monotonic = time.monotonic()
+        self._health_cache.clear()
 
-            self._initialized = True
-            self._initialization_time = datetime.utcnow()
+        self.logger.info("Database manager initialized successfully")
 
-            self.logger.info("Database manager initialized successfully")
+    def _get_init_lock(self) -> asyncio.Lock:
+        """Get the lock guarding initialize() and close_all().
 
-        except Exception as e:
-            self.logger.error(
-                "Failed to initialize database manager", extra={"error": str(e)}
-            )
+        Returns:
+            Initialization lock
+        """
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        return self._init_lock
 
-            # Cleanup on failure
-            await self.close_all()
+    async def _ensure_pool(self, name: str) -> ConnectionPool:
+        """Get a named pool, creating and verifying it on first use.
 
-            raise DatabaseManagerError(
-                f"Database manager initialization failed: {str(e)}", original_error=e
+        Args:
+            name: Pool name ("source" or "target")
+
+        Returns:
+            Verified connection pool
+
+        Raises:
+            DatabaseManagerError: If the pool cannot be created or verified
+        """
+        pool = self.pools.get(name)
+        if pool:
+            return pool
+
+        async with self._pool_locks[name]:
+            pool = self.pools.get(name)
+            if pool:
+                return pool
+
+            pool = ConnectionPool(
+                self._db_config(name),
+                max_connections=self.config.system.max_connections,
             )
 
-    async def get_source_connection(self) -> DatabaseConnector:
-        """Get source database connection.
+            try:
+                await self._verify_initial_connection(name, pool)
+            except Exception:
+                await asyncio.to_thread(pool.close)
+                raise
+
+            # close_all() may have run while the pool was being verified;
+            # storing it now would leak it past the finalizer
+            if self._closed or not self._initialized:
+                await asyncio.to_thread(pool.close)
+                raise DatabaseManagerError(
+                    f"Database manager was closed while opening the {name} pool"
+                )
+
+            self.pools[name] = pool
+            return pool
+
+    async def _get_connection(self, name: str) -> DatabaseConnector:
+        """Get connection from a named pool.
+
+        Args:
+            name: Pool name ("source" or "target")
 
         Returns:
-            Database connector for source database
+            Database connector
 
         Raises:
             DatabaseManagerError: If connection cannot be obtained
@@ -103,19 +272,41 @@ class DatabaseManager:
         if not self._initialized:
             raise DatabaseManagerError("Database manager not initialized")
 
-        if not self.source_pool:
-            raise DatabaseManagerError("Source connection pool not available")
-
         try:
-            return self.source_pool.get_connection()
+            pool = await self._ensure_pool(name)
+            return pool.get_connection()
+        except DatabaseManagerError:
+            raise
         except Exception as e:
             self.logger.error(
-                "Failed to get source connection", extra={"error": str(e)}
+                "Failed to get %s connection", name, extra={"error": _LazyStr(e)}
             )
             raise DatabaseManagerError(
-                f"Failed to get source connection: {str(e)}", original_error=e
+                f"Failed to get {name} connection: {str(e)}", original_error=e
             )
 
+    def _return_connection(self, name: str, connector: DatabaseConnector) -> None:
+        """Return connection to a named pool.
+
+        Args:
+            name: Pool name ("source" or "target")
+            connector: Database connector to return
+        """
+        pool = self.pools.get(name)
+        if pool:
+            pool.return_connection(connector)
+
+    async def get_source_connection(self) -> DatabaseConnector:
+        """Get source database connection.
+
+        Returns:
+            Database connector for source database
+
+        Raises:
+            DatabaseManagerError: If connection cannot be obtained
+        """
+        return await self._get_connection("source")
+
     async def get_target_connection(self) -> DatabaseConnector:
         """Get target database connection.
 
@@ -125,21 +316,7 @@ class DatabaseManager:
         Raises:
             DatabaseManagerError: If connection cannot be obtained
         """
-        if not self._initialized:
-            raise DatabaseManagerError("Database manager not initialized")
-
-        if not self.target_pool:
-            raise DatabaseManagerError("Target connection pool not available")
-
-        try:
-            return self.target_pool.get_connection()
-        except Exception as e:
-            self.logger.error(
-                "Failed to get target connection", extra={"error": str(e)}
-            )
-            raise DatabaseManagerError(
-                f"Failed to get target connection: {str(e)}", original_error=e
-            )
+        return await self._get_connection("target")
 
     def return_source_connection(self, connector: DatabaseConnector) -> None:
         """Return source database connection to pool.
@@ -147,8 +324,7 @@ class DatabaseManager:
         Args:
             connector: Database connector to return
         """
-        if self.source_pool:
-            self.source_pool.return_connection(connector)
+        self._return_connection("source", connector)
 
     def return_target_connection(self, connector: DatabaseConnector) -> None:
         """Return target database connection to pool.
@@ -156,55 +332,109 @@ class DatabaseManager:
         Args:
             connector: Database connector to return
         """
-        if self.target_pool:
-            self.target_pool.return_connection(connector)
+        self._return_connection("target", connector)
+
+    @asynccontextmanager
+    async def _acquire(self, name: str) -> AsyncIterator[DatabaseConnector]:
+        """Borrow a connection from a named pool and always hand it back.
+
+        Args:
+            name: Pool name ("source" or "target")
+
+        Yields:
+            Database connector
+        """
+        connector = await self._get_connection(name)
+        try:
+            yield connector
+        finally:
+            self._return_connection(name, connector)
+
+    def acquire_source(self):
+        """Borrow a source database connection.
+
+        Usage:
+            async with manager.acquire_source() as conn:
+                ...
+
+        Returns:
+            Async context manager yielding a source database connector
+        """
+        return self._acquire("source")
+
+    def acquire_target(self):
+        """Borrow a target database connection.
+
+        Usage:
+            async with manager.acquire_target() as conn:
+                ...
+
+        Returns:
+            Async context manager yielding a target database connector
+        """
+        return self._acquire("target")
+
+    async def _gather(self, probe) -> Dict[str, Any]:
+        """Run a probe against every pool concurrently.
+
+        Args:
+            probe: Coroutine function taking a pool name
 
+        Returns:
+            Dictionary of probe results (or raised exceptions) by pool name
+        """
+        results = await asyncio.gather(
+            *(probe(name) for name in _POOL_NAMES), return_exceptions=True
+        )
+        return dict(zip(_POOL_NAMES, results))
+
+    @_ttl_cached("verify")
     async def verify_connections(self) -> Dict[str, bool]:
         """Verify all database connections.
 
+        Results are cached for a short time; pass ``use_cache=False`` to
+        force a fresh probe.
+
         Returns:
             Dictionary with connection verification results
         """
         if not self._initialized:
             return {"source": False, "target": False}
 
-        results = {}
+        async def _probe(name: str) -> bool:
+            async with self._acquire(name) as conn:
+                return await conn.test_connection()
 
-        # Test source connection
-        try:
-            source_conn = await self.get_source_connection()
-            results["source"] = await source_conn.test_connection()
-            self.return_source_connection(source_conn)
-        except Exception as e:
-            self.logger.error(
-                "Source connection verification failed", extra={"error": str(e)}
-            )
-            results["source"] = False
+        results = {}
+        for name, result in (await self._gather(_probe)).items():
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "%s connection verification failed",
+                    name.capitalize(),
+                    extra={"error": _LazyStr(result)},
+                )
+                results[name] = False
+            else:
+                results[name] = result
 
-        # Test target connection
-        try:
-            target_conn = await self.get_target_connection()
-            results["target"] = await target_conn.test_connection()
-            self.return_target_connection(target_conn)
-        except Exception as e:
-            self.logger.error(
-                "Target connection verification failed", extra={"error": str(e)}
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Connection verification completed",
+                extra={
+                    "source_healthy": results["source"],
+                    "target_healthy": results["target"],
+                },
             )
-            results["target"] = False
-
-        self.logger.info(
-            "Connection verification completed",
-            extra={
-                "source_healthy": results["source"],
-                "target_healthy": results["target"],
-            },
-        )
 
         return results
 
+    @_ttl_cached("versions")
     async def get_database_versions(self) -> Dict[str, Optional[PostgreSQLVersion]]:
         """Get PostgreSQL versions for both databases.
 
+        Results are cached for a short time; pass ``use_cache=False`` to
+        force a fresh probe.
+
         Returns:
             Dictionary with version information
         """
@@ -213,25 +443,19 @@ class DatabaseManager:
         if not self._initialized:
             return versions
 
-        # Get source version
-        try:
-            source_conn = await self.get_source_connection()
-            versions["source"] = await source_conn.get_version()
-            self.return_source_connection(source_conn)
-        except Exception as e:
-            self.logger.error(
-                "Failed to get source database version", extra={"error": str(e)}
-            )
+        async def _probe(name: str) -> PostgreSQLVersion:
+            async with self._acquire(name) as conn:
+                return await conn.get_version()
 
-        # Get target version
-        try:
-            target_conn = await self.get_target_connection()
-            versions["target"] = await target_conn.get_version()
-            self.return_target_connection(target_conn)
-        except Exception as e:
-            self.logger.error(
-                "Failed to get target database version", extra={"error": str(e)}
-            )
+        for name, result in (await self._gather(_probe)).items():
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "Failed to get %s database version",
+                    name,
+                    extra={"error": _LazyStr(result)},
+                )
+            else:
+                versions[name] = result
 
         return versions
 
@@ -246,25 +470,19 @@ class DatabaseManager:
         if not self._initialized:
             return info
 
-        # Get source connection info
-        try:
-            source_conn = await self.get_source_connection()
-            info["source"] = await source_conn.get_connection_info()
-            self.return_source_connection(source_conn)
-        except Exception as e:
-            self.logger.error(
-                "Failed to get source connection info", extra={"error": str(e)}
-            )
+        async def _probe(name: str) -> ConnectionInfo:
+            async with self._acquire(name) as conn:
+                return await conn.get_connection_info()
 
-        # Get target connection info
-        try:
-            target_conn = await self.get_target_connection()
-            info["target"] = await target_conn.get_connection_info()
-            self.return_target_connection(target_conn)
-        except Exception as e:
-            self.logger.error(
-                "Failed to get target connection info", extra={"error": str(e)}
-            )
+        for name, result in (await self._gather(_probe)).items():
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "Failed to get %s connection info",
+                    name,
+                    extra={"error": _LazyStr(result)},
+                )
+            else:
+                info[name] = result
 
         return info
 
@@ -276,11 +494,8 @@ class DatabaseManager:
         """
         health = {"source": None, "target": None}
 
-        if self.source_pool:
-            health["source"] = self.source_pool.health_check()
-
-        if self.target_pool:
-            health["target"] = self.target_pool.health_check()
+        for name, pool in self.pools.items():
+            health[name] = pool.health_check()
 
         return health
 
@@ -292,31 +507,71 @@ class DatabaseManager:
         """
         cleanup_counts = {"source": 0, "target": 0}
 
-        if self.source_pool:
-            cleanup_counts["source"] = self.source_pool.cleanup_stale_connections()
-
-        if self.target_pool:
-            cleanup_counts["target"] = self.target_pool.cleanup_stale_connections()
+        for name, pool in self.pools.items():
+            cleanup_counts[name] = pool.cleanup_stale_connections()
 
-        total_cleaned = cleanup_counts["source"] + cleanup_counts["target"]
+        total_cleaned = sum(cleanup_counts.values())
 
         if total_cleaned > 0:
             self.logger.info(
-                f"Cleaned up {total_cleaned} stale connections",
+                "Cleaned up %d stale connections",
+                total_cleaned,
                 extra={
-                    "source_cleaned": cleanup_counts["source"],
-                    "target_cleaned": cleanup_counts["target"],
+                    f"{name}_cleaned": count for name, count in cleanup_counts.items()
                 },
             )
 
         return cleanup_counts
 
+    async def _probe_full(self, name: str) -> Dict[str, Any]:
+        """Check health and version of one database over a single connection.
+
+        A successful version query also proves the connection is alive, so
+        one borrow and one round-trip answer both questions.
+
+        Args:
+            name: Pool name ("source" or "target")
+
+        Returns:
+            Dictionary with "healthy" flag and "version"
+        """
+        try:
+            async with self._acquire(name) as conn:
+                version = await conn.get_version()
+        except Exception as e:
+            self.logger.error(
+                "%s connection probe failed",
+                name.capitalize(),
+                extra={"error": _LazyStr(e)},
+            )
+            return {"healthy": False, "version": None}
+
+        return {"healthy": True, "version": version}
+
+    @_ttl_cached("probe")
+    async def _probe_all(self) -> Dict[str, Dict[str, Any]]:
+        """Probe health and version of every database concurrently.
+
+        Returns:
+            Dictionary of probe results by pool name
+        """
+        if not self._initialized:
+            return {name: {"healthy": False, "version": None} for name in _POOL_NAMES}
+
+        return await self._gather(self._probe_full)
+
     async def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive statistics for database manager.
 
         Returns:
             Dictionary with statistics
         """
+        probes, pool_health = await asyncio.gather(
+            self._probe_all(), self.get_pool_health()
+        )
+        connections = {name: probe["healthy"] for name, probe in probes.items()}
+        versions = {name: probe["version"] for name, probe in probes.items()}
+
         stats = {
             "initialized": self._initialized,
             "initialization_time": (
@@ -325,68 +580,71 @@ class DatabaseManager:
                 else None
             ),
             "uptime_seconds": (
-                (datetime.utcnow() - self._initialization_time).total_seconds()
-                if self._initialization_time
+                time.monotonic() - self._init_monotonic
+                if self._init_monotonic is not None
                 else 0
             ),
             "source_pool": None,
             "target_pool": None,
-            "connections": await self.verify_connections(),
-            "versions": await self.get_database_versions(),
-            "pool_health": await self.get_pool_health(),
+            "connections": connections,
+            "versions": versions,
+            "pool_health": pool_health,
         }
 
         # Add pool statistics
-        if self.source_pool:
-            stats["source_pool"] = self.source_pool.get_statistics()
-
-        if self.target_pool:
-            stats["target_pool"] = self.target_pool.get_statistics()
+        for name, pool in self.pools.items():
+            stats[f"{name}_pool"] = pool.get_statistics()
 
         return stats
 
-    async def _verify_initial_connections(self) -> None:
-        """Verify initial connections during initialization.
+    async def _verify_initial_connection(
+        self, name: str, pool: ConnectionPool
+    ) -> None:
+        """Verify a newly created pool before it is handed out.
+
+        Args:
+            name: Pool name ("source" or "target")
+            pool: Connection pool to verify
 
         Raises:
             DatabaseManagerError: If connection verification fails
         """
-        # Test source connection
+        label = name.capitalize()
+
         try:
-            # During initialization, get connection directly from pool
-            # to avoid the initialized check in get_source_connection()
-            if not self.source_pool:
-                raise DatabaseManagerError("Source connection pool not available")
-            source_conn = self.source_pool.get_connection()
+            # The pool is not registered yet, so borrow from it directly
+            conn = pool.get_connection()
+            try:
+                result = await conn.verify_all()
+            finally:
+                pool.return_connection(conn)
 
             # Test connection
-            if not await source_conn.test_connection():
-                raise DatabaseConnectionError("Source connection test failed")
+            if not result.alive:
+                raise DatabaseConnectionError(
+                    f"{label} connection test failed: {result.error_message}"
+                )
 
             # Check version
-            version = await source_conn.get_version()
-            min_version = PostgreSQLVersion.parse(
-                DatabaseConstants.MIN_SUPPORTED_VERSION
-            )
-
-            if version < min_version:
+            version = result.version
+            if version < _MIN_SUPPORTED_VERSION:
                 raise DatabaseVersionError(
-                    f"Source database version {version} is below minimum "
-                    f"supported version {min_version}"
+                    f"{label} database version {version} is below minimum "
+                    f"supported version {_MIN_SUPPORTED_VERSION}"
                 )
 
             # Check permissions
-            permissions = await source_conn.check_permissions()
+            permissions = result.permissions
             if not permissions.has_required_permissions():
                 missing = permissions.get_missing_permissions()
                 raise DatabaseConnectionError(
-                    f"Source database missing required permissions: {', '.join(missing)}"
+                    f"{label} database missing required permissions: "
+                    f"{', '.join(missing)}"
                 )
 
-            self.return_source_connection(source_conn)
-
             self.logger.info(
-                "Source database connection verified",
+                "%s database connection verified",
+                label,
                 extra={
                     "version": str(version),
                     "has_permissions": permissions.has_required_permissions(),
@@ -394,74 +652,46 @@ class DatabaseManager:
             )
 
         except Exception as e:
-            raise DatabaseManagerError(f"Source database verification failed: {str(e)}")
-
-        # Test target connection
-        try:
-            # During initialization, get connection directly from pool
-            # to avoid the initialized check in get_target_connection()
-            if not self.target_pool:
-                raise DatabaseManagerError("Target connection pool not available")
-            target_conn = self.target_pool.get_connection()
-
-            # Test connection
-            if not await target_conn.test_connection():
-                raise DatabaseConnectionError("Target connection test failed")
-
-            # Check version
-            version = await target_conn.get_version()
-            min_version = PostgreSQLVersion.parse(
-                DatabaseConstants.MIN_SUPPORTED_VERSION
+            raise DatabaseManagerError(
+                f"{label} database verification failed: {str(e)}"
             )
 
-            if version < min_version:
-                raise DatabaseVersionError(
-                    f"Target database version {version} is below minimum "
-                    f"supported version {min_version}"
-                )
-
-            # Check permissions
-            permissions = await target_conn.check_permissions()
-            if not permissions.has_required_permissions():
-                missing = permissions.get_missing_permissions()
-                raise DatabaseConnectionError(
-                    f"Target database missing required permissions: {', '.join(missing)}"
-                )
-
-            self.return_target_connection(target_conn)
+    async def close_all(self) -> None:
+        """Close all database connections and pools.
 
-            self.logger.info(
-                "Target database connection verified",
-                extra={
-                    "version": str(version),
-                    "has_permissions": permissions.has_required_permissions(),
-                },
-            )
+        Pools are closed concurrently. Calling this more than once is a no-op.
+        """
+        async with self._get_init_lock():
+            await self._close_all()
 
-        except Exception as e:
-            raise DatabaseManagerError(f"Target database verification failed: {str(e)}")
+    async def _close_all(self) -> None:
+        """Close all database connections and pools while holding the init lock."""
+        if self._closed:
+            return
+        self._closed = True
 
-    async def close_all(self) -> None:
-        """Close all database connections and pools."""
-        try:
-            # Close source pool
-            if self.source_pool:
-                self.source_pool.close()
-                self.source_pool = None
+        if self._finalizer:
+            self._finalizer.detach()
+            self._finalizer = None
 
-            # Close target pool
-            if self.target_pool:
-                self.target_pool.close()
-                self.target_pool = None
+        pools = list(self.pools.items())
+        self.pools.clear()
+        self._initialized = False
+        self._health_cache.clear()
 
-            self._initialized = False
+        results = await asyncio.gather(
+            *(asyncio.to_thread(pool.close) for _, pool in pools),
+            return_exceptions=True,
+        )
 
-            self.logger.info("All database connections closed")
+        for (name, _), result in zip(pools, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "Error closing database connections",
+                    extra={"pool": name, "error": _LazyStr(result)},
+                )
 
-        except Exception as e:
-            self.logger.error(
-                "Error closing database connections", extra={"error": str(e)}
-            )
+        self.logger.info("All database connections closed")
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -471,14 +701,3 @@ class DatabaseManager:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.close_all()
-
-    def __del__(self):
-        """Destructor - ensure connections are closed."""
-        try:
-            if self._initialized:
-                if self.source_pool:
-                    self.source_pool.close()
-                if self.target_pool:
-                    self.target_pool.close()
-        except Exception:
-            pass
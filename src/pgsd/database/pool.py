@@ -1,16 +1,11 @@
 """Connection pool for PGSD application."""
 
+import collections
 import logging
-import queue
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
-
-try:
-    import psycopg2
-except ImportError:
-    psycopg2 = None
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Deque, Dict, Any, Set
 
 from ..config.schema import DatabaseConfig
 from ..constants.database import (
@@ -23,9 +18,39 @@ from ..models.database import PoolHealth
 from .factory import ConnectionFactory
 from .connector import DatabaseConnector
 
+# Bound once so the borrow/return paths skip the time module attribute lookup
+_monotonic = time.monotonic
+
+# psycopg2 loads libpq on import, so it is only imported when the first pool
+# is created; None once loading has failed
+_NOT_LOADED = object()
+psycopg2 = _NOT_LOADED
+
+
+def _load_psycopg2():
+    """Import psycopg2 on first use.
+
+    Returns:
+        psycopg2 module, or None if it is not installed
+    """
+    global psycopg2
+    if psycopg2 is _NOT_LOADED:
+        try:
+            import psycopg2 as module
+        except ImportError:
+            module = None
+        psycopg2 = module
+    return psycopg2
+
 
 class PooledConnection:
-    """Wrapper for pooled database connections."""
+    """Wrapper for pooled database connections.
+
+    A pooled connection is owned by exactly one thread between
+    get_connection and return_connection, and by nobody while it sits in
+    the idle queue, so its attributes are never mutated concurrently and
+    need no lock of their own.
+    """
 
     def __init__(self, connection, created_at: datetime):
         """Initialize pooled connection.
@@ -36,17 +61,34 @@ class PooledConnection:
         """
         self.connection = connection
         self.created_at = created_at
-        self.last_used = created_at
+        # Age and idle checks run on every borrow/return, so they compare
+        # monotonic floats; the datetimes are only derived for reporting
+        now = _monotonic()
+        self.created_at_mono = now - (
+            datetime.now(timezone.utc) - created_at
+        ).total_seconds()
+        self.last_used_mono = self.created_at_mono
         self.in_use = False
         self.is_healthy = True
         self.use_count = 0
-        self.lock = threading.Lock()
+
+    @property
+    def last_used(self) -> datetime:
+        """Timestamp of the last borrow or return."""
+        return self.created_at + timedelta(
+            seconds=self.last_used_mono - self.created_at_mono
+        )
+
+    @last_used.setter
+    def last_used(self, value: datetime) -> None:
+        self.last_used_mono = (
+            self.created_at_mono + (value - self.created_at).total_seconds()
+        )
 
     def mark_used(self):
         """Mark connection as used."""
-        with self.lock:
-            self.last_used = datetime.now(timezone.utc)
-            self.use_count += 1
+        self.last_used_mono = _monotonic()
+        self.use_count += 1
 
     def is_expired(self, max_lifetime: int) -> bool:
         """Check if connection has expired.
@@ -57,7 +99,7 @@ class PooledConnection:
         Returns:
             True if connection has expired
         """
-        return (datetime.now(timezone.utc) - self.created_at).total_seconds() > max_lifetime
+        return _monotonic() - self.created_at_mono > max_lifetime
 
     def is_idle_too_long(self, idle_timeout: int) -> bool:
         """Check if connection has been idle too long.
@@ -68,10 +110,35 @@ class PooledConnection:
         Returns:
             True if connection has been idle too long
         """
-        return (datetime.now(timezone.utc) - self.last_used).total_seconds() > idle_timeout
+        return _monotonic() - self.last_used_mono > idle_timeout
+
+    def ping(self) -> bool:
+        """Check connection liveness without a server round trip.
+
+        Rolls back any transaction left open by the previous borrower so
+        the connection goes back into the pool idle.
+
+        Returns:
+            True if connection is usable
+        """
+        try:
+            if self.connection.closed:
+                self.is_healthy = False
+                return False
+
+            if (
+                self.connection.info.transaction_status
+                != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+            ):
+                self.connection.rollback()
+
+            return True
+        except Exception:
+            self.is_healthy = False
+            return False
 
     def test_health(self) -> bool:
-        """Test connection health.
+        """Test connection health with a SELECT 1 round trip.
 
         Returns:
             True if connection is healthy
@@ -105,33 +172,50 @@ class PooledConnection:
 class ConnectionPool:
     """Database connection pool."""
 
-    def __init__(self, db_config: DatabaseConfig, max_connections: int = None):
+    def __init__(
+        self,
+        db_config: DatabaseConfig,
+        max_connections: int = None,
+        min_connections: int = None,
+    ):
         """Initialize connection pool.
 
         Args:
             db_config: Database configuration
             max_connections: Maximum number of connections
+            min_connections: Number of idle connections to keep warm
         """
-        if psycopg2 is None:
+        if _load_psycopg2() is None:
             raise ImportError("psycopg2 is required for connection pooling")
 
         self.db_config = db_config
         self.max_connections = max_connections or PoolConstants.DEFAULT_MAX_CONNECTIONS
-        self.min_connections = PoolConstants.DEFAULT_MIN_CONNECTIONS
+        if min_connections is None:
+            min_connections = PoolConstants.DEFAULT_MIN_CONNECTIONS
+        self.min_connections = min(min_connections, self.max_connections)
         self.pool_timeout = PoolConstants.DEFAULT_POOL_TIMEOUT
         self.idle_timeout = PoolConstants.DEFAULT_IDLE_TIMEOUT
         self.max_lifetime = PoolConstants.DEFAULT_MAX_LIFETIME
+        self.validation_interval = PoolConstants.VALIDATION_INTERVAL
 
         self.logger = logging.getLogger(__name__)
         self.factory = ConnectionFactory()
 
         # Pool state
-        self._pool: queue.Queue = queue.Queue(maxsize=self.max_connections)
-        self._all_connections: List[PooledConnection] = []
+        # Idle connections; never longer than max_connections since every
+        # entry is also counted in _created_count
+        self._pool: Deque[PooledConnection] = collections.deque()
+        self._all_connections: Set[PooledConnection] = set()
+        # Pooled connections keyed by id() of their psycopg2 connection
+        self._by_conn_id: Dict[int, PooledConnection] = {}
         self._lock = threading.Lock()
+        self._cv = threading.Condition(self._lock)
         self._created_count = 0
         self._health_check_thread = None
+        self._warm_up_thread = None
         self._shutdown = False
+        # Set by close() to cut the health check thread's sleep short
+        self._shutdown_event = threading.Event()
 
         # Statistics
         self._stats = {
@@ -146,6 +230,10 @@ class ConnectionPool:
         # Start health check thread
         self._start_health_check_thread()
 
+        # Open min_connections in the background so the first callers
+        # don't each pay for a connection handshake
+        self._start_warm_up_thread()
+
         self.logger.info(
             LogMessages.POOL_CREATED,
             extra={
@@ -172,40 +260,62 @@ class ConnectionPool:
             raise DatabasePoolError("Connection pool is shutdown")
 
         timeout = timeout or self.pool_timeout
-        start_time = time.time()
+        deadline = _monotonic() + timeout
 
         try:
-            # Try to get existing connection from pool
-            try:
-                pooled_conn = self._pool.get(timeout=timeout)
-
-                # Test connection health
-                if pooled_conn.test_health():
-                    pooled_conn.mark_used()
-                    pooled_conn.in_use = True
-
-                    self._stats["total_borrowed"] += 1
-
-                    return DatabaseConnector(pooled_conn.connection, self.db_config)
-                else:
-                    # Connection is unhealthy, remove it
+            while True:
+                # Prefer an idle connection, then a new one, then wait for a
+                # return_connection/_remove_connection notification
+                with self._cv:
+                    while (
+                        not self._pool
+                        and self._created_count >= self.max_connections
+                    ):
+                        if self._shutdown:
+                            raise DatabasePoolError("Connection pool is shutdown")
+
+                        remaining_time = deadline - _monotonic()
+                        if remaining_time <= 0:
+                            raise DatabasePoolError(ErrorMessages.POOL_TIMEOUT)
+
+                        self._cv.wait(remaining_time)
+
+                    if self._pool:
+                        # Most recently returned first, so it rarely needs
+                        # re-validation and colder connections age out
+                        pooled_conn = self._pool.pop()
+                    else:
+                        if self._shutdown:
+                            raise DatabasePoolError("Connection pool is shutdown")
+                        # Reserve the slot before connecting outside the lock
+                        pooled_conn = None
+                        self._created_count += 1
+
+                if pooled_conn is None:
+                    try:
+                        return self._create_new_connection()
+                    except Exception:
+                        with self._cv:
+                            self._release_slot()
+                        raise
+
+                # Cheap local check on every borrow; only connections idle
+                # long enough for the server to have dropped them pay for a
+                # SELECT 1 round trip
+                if not pooled_conn.ping() or (
+                    pooled_conn.is_idle_too_long(self.validation_interval)
+                    and not pooled_conn.test_health()
+                ):
+                    # Connection is unhealthy, remove it and try again
                     self._remove_connection(pooled_conn)
+                    continue
 
-                    # Try to create new connection
-                    return self._create_new_connection()
+                pooled_conn.mark_used()
+                pooled_conn.in_use = True
 
-            except queue.Empty:
-                # No connections available, try to create new one
-                if self._created_count < self.max_connections:
-                    return self._create_new_connection()
-                else:
-                    # Pool is full, wait for available connection
-                    remaining_time = timeout - (time.time() - start_time)
-                    if remaining_time <= 0:
-                        raise DatabasePoolError(ErrorMessages.POOL_TIMEOUT)
+                self._stats["total_borrowed"] += 1
 
-                    # Recursive call with remaining timeout
-                    return self.get_connection(remaining_time)
+                return DatabaseConnector(pooled_conn.connection, self.db_config)
 
         except Exception as e:
             self.logger.error(
@@ -235,26 +345,19 @@ class ConnectionPool:
 
         try:
             # Find the pooled connection
-            pooled_conn = None
-            with self._lock:
-                for conn in self._all_connections:
-                    if conn.connection == connector.connection:
-                        pooled_conn = conn
-                        break
+            pooled_conn = self._by_conn_id.get(id(connector.connection))
 
             if pooled_conn:
-                # Test connection health before returning
-                if pooled_conn.test_health():
+                # Check connection liveness before returning
+                if pooled_conn.ping():
                     pooled_conn.in_use = False
                     pooled_conn.mark_used()
 
-                    # Return to pool
-                    try:
-                        self._pool.put(pooled_conn, block=False)
+                    # Return to pool and wake one waiting borrower
+                    with self._cv:
+                        self._pool.append(pooled_conn)
                         self._stats["total_returned"] += 1
-                    except queue.Full:
-                        # Pool is full, close connection
-                        self._remove_connection(pooled_conn)
+                        self._cv.notify()
                 else:
                     # Connection is unhealthy, remove it
                     self._remove_connection(pooled_conn)
@@ -273,6 +376,8 @@ class ConnectionPool:
     def _create_new_connection(self) -> DatabaseConnector:
         """Create new connection.
 
+        The caller must already have reserved a slot in _created_count.
+
         Returns:
             Database connector
 
@@ -289,8 +394,8 @@ class ConnectionPool:
 
             # Add to pool tracking
             with self._lock:
-                self._all_connections.append(pooled_conn)
-                self._created_count += 1
+                self._all_connections.add(pooled_conn)
+                self._by_conn_id[id(connection)] = pooled_conn
 
             self._stats["total_created"] += 1
             self._stats["total_borrowed"] += 1
@@ -309,10 +414,14 @@ class ConnectionPool:
         try:
             pooled_conn.close()
 
-            with self._lock:
+            with self._cv:
+                # Set membership keeps removal O(1) regardless of pool size
                 if pooled_conn in self._all_connections:
-                    self._all_connections.remove(pooled_conn)
+                    self._all_connections.discard(pooled_conn)
+                    self._by_conn_id.pop(id(pooled_conn.connection), None)
                     self._created_count -= 1
+                    # A slot opened up for a waiting borrower
+                    self._cv.notify()
 
             self._stats["total_destroyed"] += 1
 
@@ -336,40 +445,36 @@ class ConnectionPool:
     def health_check(self) -> PoolHealth:
         """Perform health check on pool.
 
+        The connection list is snapshotted under the pool lock and the
+        probes run outside it, so borrow/return never wait on server
+        round trips.
+
         Returns:
             Pool health information
         """
         with self._lock:
-            total_connections = len(self._all_connections)
-            active_connections = sum(1 for conn in self._all_connections if conn.in_use)
-            idle_connections = total_connections - active_connections
-
-            # Count healthy connections
-            healthy_connections = 0
-            failed_connections = 0
-
-            for conn in self._all_connections:
-                if conn.test_health():
-                    healthy_connections += 1
-                else:
-                    failed_connections += 1
-
-            # Calculate average connection time
-            if self._stats["total_created"] > 0:
-                avg_connection_time = (
-                    sum(
-                        (datetime.now(timezone.utc) - conn.created_at).total_seconds()
-                        for conn in self._all_connections
-                    )
-                    / len(self._all_connections)
-                    if self._all_connections
-                    else 0
-                )
-            else:
-                avg_connection_time = 0
+            connections = list(self._all_connections)
+
+        total_connections = len(connections)
+        active_connections = sum(1 for conn in connections if conn.in_use)
+        idle_connections = total_connections - active_connections
+
+        # Count healthy connections
+        healthy_connections = sum(1 for conn in connections if conn.test_health())
+        failed_connections = total_connections - healthy_connections
+
+        # Calculate average connection time
+        if self._stats["total_created"] > 0 and connections:
+            now = _monotonic()
+            avg_connection_time = (
+                sum(now - conn.created_at_mono for conn in connections)
+                / total_connections
+            )
+        else:
+            avg_connection_time = 0
 
-            self._stats["total_health_checks"] += 1
-            self._stats["total_health_failures"] += failed_connections
+        self._stats["total_health_checks"] += 1
+        self._stats["total_health_failures"] += failed_connections
 
         return PoolHealth(
             total_connections=total_connections,
@@ -388,40 +493,105 @@ class ConnectionPool:
         Returns:
             Number of connections cleaned up
         """
-        cleaned_up = 0
-
         with self._lock:
+            # Take stale connections out of the idle queue so no borrower
+            # can pick them up while they are being closed
             connections_to_remove = []
+            idle = collections.deque()
+            for conn in self._pool:
+                # Check if connection is expired or idle too long
+                if conn.is_expired(self.max_lifetime) or conn.is_idle_too_long(
+                    self.idle_timeout
+                ):
+                    connections_to_remove.append(conn)
+                else:
+                    idle.append(conn)
+            self._pool = idle
 
-            for conn in self._all_connections:
-                if not conn.in_use:
-                    # Check if connection is expired or idle too long
-                    if conn.is_expired(self.max_lifetime) or conn.is_idle_too_long(
-                        self.idle_timeout
-                    ):
-                        connections_to_remove.append(conn)
-
-            # Remove stale connections
-            for conn in connections_to_remove:
-                self._remove_connection(conn)
-                cleaned_up += 1
+        # Close outside the lock; _remove_connection takes it again itself
+        for conn in connections_to_remove:
+            self._remove_connection(conn)
+        cleaned_up = len(connections_to_remove)
 
         if cleaned_up > 0:
-            self.logger.info(f"Cleaned up {cleaned_up} stale connections")
+            self.logger.info("Cleaned up %d stale connections", cleaned_up)
 
         return cleaned_up
 
+    def _release_slot(self) -> None:
+        """Give back a creation slot reserved in _created_count.
+
+        The caller must hold the lock. close() resets the count to zero, so a
+        slot reserved before shutdown is already gone and is not released
+        again; that would drive the count negative.
+        """
+        if self._shutdown:
+            return
+        self._created_count -= 1
+        self._cv.notify()
+
+    def _ensure_min_connections(self) -> None:
+        """Open idle connections until min_connections exist."""
+        while not self._shutdown:
+            # Reserve the slot before connecting outside the lock
+            with self._lock:
+                if self._shutdown or self._created_count >= self.min_connections:
+                    return
+                self._created_count += 1
+
+            try:
+                connection = self.factory.create_connection(self.db_config)
+            except Exception as e:
+                with self._cv:
+                    self._release_slot()
+
+                self.logger.warning(
+                    "Failed to pre-warm connection pool", extra={"error": str(e)}
+                )
+                return
+
+            pooled_conn = PooledConnection(connection, datetime.now(timezone.utc))
+
+            with self._cv:
+                # close() may have run while the connection was being opened
+                closed_meanwhile = self._shutdown
+                if closed_meanwhile:
+                    self._release_slot()
+                else:
+                    self._all_connections.add(pooled_conn)
+                    self._by_conn_id[id(connection)] = pooled_conn
+                    self._pool.append(pooled_conn)
+                    self._stats["total_created"] += 1
+                    self._cv.notify()
+
+            if closed_meanwhile:
+                pooled_conn.close()
+
+    def _start_warm_up_thread(self):
+        """Start pool warm-up thread."""
+        if self.min_connections <= 0:
+            return
+
+        self._warm_up_thread = threading.Thread(
+            target=self._ensure_min_connections,
+            daemon=True,
+            name="pgsd-pool-warm-up",
+        )
+        self._warm_up_thread.start()
+
     def _start_health_check_thread(self):
         """Start health check thread."""
 
         def health_check_worker():
             while not self._shutdown:
                 try:
-                    time.sleep(PoolConstants.HEALTH_CHECK_INTERVAL)
+                    if self._shutdown_event.wait(PoolConstants.HEALTH_CHECK_INTERVAL):
+                        break
 
                     if not self._shutdown:
                         health = self.health_check()
                         self.cleanup_stale_connections()
+                        self._ensure_min_connections()
 
                         self.logger.debug(
                             LogMessages.POOL_HEALTH_CHECK,
@@ -447,25 +617,26 @@ class ConnectionPool:
     def close(self):
         """Close connection pool."""
         self._shutdown = True
+        self._shutdown_event.set()
 
         # Wait for health check thread to finish
         if self._health_check_thread and self._health_check_thread.is_alive():
             self._health_check_thread.join(timeout=5)
 
-        # Close all connections
+        # Detach everything in one step, then close sockets outside the lock
         with self._lock:
-            for conn in self._all_connections:
-                conn.close()
+            connections = list(self._all_connections)
 
             self._all_connections.clear()
+            self._by_conn_id.clear()
+            self._pool.clear()
             self._created_count = 0
 
-        # Clear pool queue
-        while not self._pool.empty():
-            try:
-                self._pool.get_nowait()
-            except queue.Empty:
-                break
+            # Wake blocked borrowers so they see the shutdown
+            self._cv.notify_all()
+
+        for conn in connections:
+            conn.close()
 
         self.logger.info(
             LogMessages.POOL_DESTROYED,
@@ -480,20 +651,25 @@ class ConnectionPool:
     def get_statistics(self) -> Dict[str, Any]:
         """Get pool statistics.
 
+        Reads a snapshot of the pool state without taking the pool lock, so
+        callers on the event loop never wait behind borrow/return traffic.
+
         Returns:
             Dictionary of pool statistics
         """
-        with self._lock:
-            return {
-                **self._stats,
-                "current_connections": len(self._all_connections),
-                "active_connections": sum(
-                    1 for conn in self._all_connections if conn.in_use
-                ),
-                "max_connections": self.max_connections,
-                "pool_utilization": (len(self._all_connections) / self.max_connections)
-                * 100,
-            }
+        # len() and dict copies are single operations under the GIL; every
+        # tracked connection not sitting idle is checked out
+        current_connections = len(self._all_connections)
+        idle_connections = len(self._pool)
+        stats = dict(self._stats)
+
+        return {
+            **stats,
+            "current_connections": current_connections,
+            "active_connections": max(current_connections - idle_connections, 0),
+            "max_connections": self.max_connections,
+            "pool_utilization": (current_connections / self.max_connections) * 100,
+        }
 
     def __enter__(self):
         """Context manager entry."""
@@ -504,8 +680,13 @@ class ConnectionPool:
         self.close()
 
     def __del__(self):
-        """Destructor - ensure pool is closed."""
+        """Destructor - stop background work without closing connections.
+
+        Finalizers can run during interpreter shutdown, when taking the pool
+        lock or joining threads may hang, so this only flags the shutdown.
+        Use close() or the context manager to release connections.
+        """
         try:
-            self.close()
+            self._shutdown = True
         except Exception:
             pass
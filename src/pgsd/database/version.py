@@ -1,12 +1,63 @@
 """PostgreSQL version management for PGSD application."""
 
+import bisect
+import functools
 import logging
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Tuple
 
 from ..constants.database import DatabaseConstants
 from ..exceptions.database import DatabaseVersionError
 from ..models.database import PostgreSQLVersion
 
+# Feature set assumed for versions older than every entry in the table
+_MINIMAL_FEATURES = MappingProxyType(
+    {
+        "partitioned_tables": False,
+        "generated_columns": False,
+        "b_tree_deduplication": False,
+        "incremental_sorting": False,
+        "multirange_types": False,
+    }
+)
+
+# Capability bit for each feature table flag
+_FEATURE_BITS = {
+    "partitioned_tables": 1 << 0,
+    "generated_columns": 1 << 1,
+    "b_tree_deduplication": 1 << 2,
+    "incremental_sorting": 1 << 3,
+    "multirange_types": 1 << 4,
+    "merge_command": 1 << 5,
+}
+
+# Capability required by each version-gated operation
+_OPERATION_CAPS = {
+    "partitioned_table_info": _FEATURE_BITS["partitioned_tables"],
+    "generated_column_info": _FEATURE_BITS["generated_columns"],
+    "multirange_type_info": _FEATURE_BITS["multirange_types"],
+    "merge_command_info": _FEATURE_BITS["merge_command"],
+}
+
+# Changelog entries for crossing into each major version
+_CHANGELOG_14 = (
+    "Added incremental sorting support",
+    "Added multirange types",
+    "Improved performance for partitioned tables",
+    "Enhanced JSON functionality",
+)
+_CHANGELOG_15 = (
+    "Added MERGE command support",
+    "Improved logical replication",
+    "Enhanced security features",
+    "Better query performance",
+)
+
+
+def _version_tuple(version: PostgreSQLVersion) -> Tuple[int, int, int]:
+    """Hashable (major, minor, patch) key for a version."""
+    return (version.major, version.minor, version.patch)
+
 
 class VersionManager:
     """PostgreSQL version management and compatibility checking."""
@@ -49,6 +100,41 @@ class VersionManager:
             },
         }
 
+        # Entries are shared read-only views, so lookups never copy them
+        self._feature_support = {
+            key: MappingProxyType(features)
+            for key, features in self._feature_support.items()
+        }
+
+        # Feature table as parallel arrays sorted by (major, minor) for bisect
+        entries = sorted(
+            (tuple(int(part) for part in key.split(".")[:2]), features)
+            for key, features in self._feature_support.items()
+        )
+        self._ver_tuples = [version for version, _ in entries]
+        self._ver_values = [features for _, features in entries]
+        self._ver_caps = [
+            sum(bit for name, bit in _FEATURE_BITS.items() if features.get(name))
+            for _, features in entries
+        ]
+
+        # Per-instance caches keyed on plain version tuples rather than the
+        # hashable PostgreSQLVersion: feature support only depends on
+        # (major, minor), so patch releases share one entry, and the other
+        # builders work on the (major, minor, patch) tuple directly
+        self._cached_feature_support = functools.lru_cache(maxsize=64)(
+            self._lookup_feature_support
+        )
+        self._cached_compatibility = functools.lru_cache(maxsize=32)(
+            self._build_version_compatibility
+        )
+        self._cached_recommendations = functools.lru_cache(maxsize=32)(
+            self._build_version_recommendations
+        )
+        self._cached_changelog = functools.lru_cache(maxsize=32)(
+            self._build_version_changelog
+        )
+
     def check_version_compatibility(self, version: PostgreSQLVersion) -> Dict[str, Any]:
         """Check version compatibility with PGSD requirements.
 
@@ -58,94 +144,114 @@ class VersionManager:
         Returns:
             Dictionary with compatibility information
         """
-        compatibility = {
-            "is_supported": False,
-            "is_recommended": False,
-            "warnings": [],
-            "features": {},
-            "upgrade_recommendation": None,
+        compatibility = self._cached_compatibility(_version_tuple(version))
+
+        # Fresh containers so callers can extend the result without touching
+        # the cached entry
+        return {
+            **compatibility,
+            "warnings": list(compatibility["warnings"]),
+            "features": dict(compatibility["features"]),
         }
 
+    def _build_version_compatibility(
+        self, version: Tuple[int, int, int]
+    ) -> Dict[str, Any]:
+        """Build compatibility information for a (major, minor, patch) version.
+
+        Args:
+            version: Version tuple
+
+        Returns:
+            Dictionary with compatibility information
+        """
+        version_str = "%d.%d.%d" % version
+        warnings = []
+        upgrade_recommendation = None
+
         # Check minimum version support
-        if version >= self.min_supported_version:
-            compatibility["is_supported"] = True
-        else:
-            compatibility["warnings"].append(
-                f"Version {version} is below minimum supported version {self.min_supported_version}"
+        is_supported = version >= _version_tuple(self.min_supported_version)
+        if not is_supported:
+            warnings.append(
+                f"Version {version_str} is below minimum supported version {self.min_supported_version}"
             )
 
         # Check recommended version
-        if version >= self.recommended_version:
-            compatibility["is_recommended"] = True
-        else:
-            compatibility["warnings"].append(
-                f"Version {version} is below recommended version {self.recommended_version}"
+        is_recommended = version >= _version_tuple(self.recommended_version)
+        if not is_recommended:
+            warnings.append(
+                f"Version {version_str} is below recommended version {self.recommended_version}"
             )
-            compatibility["upgrade_recommendation"] = (
+            upgrade_recommendation = (
                 f"Consider upgrading to PostgreSQL {self.recommended_version} or later"
             )
 
-        # Get feature support
-        compatibility["features"] = self.get_feature_support(version)
-
         # Version-specific warnings
-        if version.major < 14:
-            compatibility["warnings"].append(
+        if version[0] < 14:
+            warnings.append(
                 "This PostgreSQL version may have limited schema comparison features"
             )
 
         self.logger.debug(
             "Version compatibility check completed",
             extra={
-                "version": str(version),
-                "is_supported": compatibility["is_supported"],
-                "is_recommended": compatibility["is_recommended"],
-                "warnings_count": len(compatibility["warnings"]),
+                "version": version_str,
+                "is_supported": is_supported,
+                "is_recommended": is_recommended,
+                "warnings_count": len(warnings),
             },
         )
 
-        return compatibility
+        return {
+            "is_supported": is_supported,
+            "is_recommended": is_recommended,
+            "warnings": tuple(warnings),
+            "features": self._cached_feature_support(version[0], version[1]),
+            "upgrade_recommendation": upgrade_recommendation,
+        }
 
-    def get_feature_support(self, version: PostgreSQLVersion) -> Dict[str, bool]:
+    def get_feature_support(self, version: PostgreSQLVersion) -> Mapping[str, bool]:
         """Get feature support for specific version.
 
         Args:
             version: PostgreSQL version
 
         Returns:
-            Dictionary of feature support
+            Read-only mapping of feature support; use dict() to modify it
         """
-        # Find closest supported version
-        version_key = f"{version.major}.{version.minor}"
-
-        # Try exact match first
-        if version_key in self._feature_support:
-            return self._feature_support[version_key].copy()
-
-        # Try major version match
-        major_key = f"{version.major}.0"
-        if major_key in self._feature_support:
-            return self._feature_support[major_key].copy()
-
-        # Fall back to closest lower version
-        available_versions = sorted(
-            [PostgreSQLVersion.parse(v) for v in self._feature_support.keys()],
-            reverse=True,
-        )
+        return self._cached_feature_support(version.major, version.minor)
 
-        for available_version in available_versions:
-            if version >= available_version:
-                version_key = f"{available_version.major}.{available_version.minor}"
-                return self._feature_support[version_key].copy()
+    def _lookup_feature_support(self, major: int, minor: int) -> Mapping[str, bool]:
+        """Resolve the feature table entry for a major/minor version.
+
+        Args:
+            major: Major version number
+            minor: Minor version number
+
+        Returns:
+            Dictionary of feature support
+        """
+        # Closest table entry at or below the version; an exact or
+        # same-major entry is simply the nearest one
+        idx = bisect.bisect_right(self._ver_tuples, (major, minor)) - 1
+        if idx >= 0:
+            return self._ver_values[idx]
 
         # Default minimal feature set
-        return {
-            "partitioned_tables": False,
-            "generated_columns": False,
-            "b_tree_deduplication": False,
-            "incremental_sorting": False,
-            "multirange_types": False,
-        }
+        return _MINIMAL_FEATURES
+
+    def _caps_for(self, major: int, minor: int) -> int:
+        """Get the capability bitmask for a major/minor version.
+
+        Args:
+            major: Major version number
+            minor: Minor version number
+
+        Returns:
+            Bitwise OR of the supported _FEATURE_BITS
+        """
+        idx = bisect.bisect_right(self._ver_tuples, (major, minor)) - 1
+        return self._ver_caps[idx] if idx >= 0 else 0
 
     def compare_versions(
         self, version1: PostgreSQLVersion, version2: PostgreSQLVersion
@@ -159,15 +265,19 @@ class VersionManager:
         Returns:
             Dictionary with comparison results
         """
+        # Plain int tuples compare in C without PostgreSQLVersion dispatch
+        t1 = (version1.major, version1.minor, version1.patch)
+        t2 = (version2.major, version2.minor, version2.patch)
+
         comparison = {
             "version1": str(version1),
             "version2": str(version2),
-            "are_equal": version1 == version2,
-            "version1_newer": version1 > version2,
-            "version2_newer": version2 > version1,
-            "major_version_diff": version1.major != version2.major,
-            "minor_version_diff": version1.minor != version2.minor,
-            "patch_version_diff": version1.patch != version2.patch,
+            "are_equal": t1 == t2,
+            "version1_newer": t1 > t2,
+            "version2_newer": t1 < t2,
+            "major_version_diff": t1[0] != t2[0],
+            "minor_version_diff": t1[1] != t2[1],
+            "patch_version_diff": t1[2] != t2[2],
             "compatibility_concerns": [],
         }
 
@@ -177,19 +287,23 @@ class VersionManager:
                 "Major version difference may cause schema comparison issues"
             )
 
-        if abs(version1.major - version2.major) > 2:
+        if abs(t1[0] - t2[0]) > 2:
             comparison["compatibility_concerns"].append(
                 "Large version gap may cause significant compatibility issues"
             )
 
-        # Feature support comparison
-        features1 = self.get_feature_support(version1)
-        features2 = self.get_feature_support(version2)
+        # Feature support comparison; the table is keyed on major/minor only
+        if t1[:2] == t2[:2]:
+            feature_diff = []
+        else:
+            features1 = self.get_feature_support(version1)
+            features2 = self.get_feature_support(version2)
 
-        feature_diff = []
-        for feature in features1:
-            if features1[feature] != features2.get(feature, False):
-                feature_diff.append(feature)
+            feature_diff = [
+                feature
+                for feature, supported in features1.items()
+                if supported != features2.get(feature, False)
+            ]
 
         comparison["feature_differences"] = feature_diff
 
@@ -204,38 +318,51 @@ class VersionManager:
         Returns:
             List of recommendations
         """
+        return list(self._cached_recommendations(_version_tuple(version)))
+
+    def _build_version_recommendations(
+        self, version: Tuple[int, int, int]
+    ) -> Tuple[str, ...]:
+        """Build recommendations for a (major, minor, patch) version.
+
+        Args:
+            version: Version tuple
+
+        Returns:
+            Tuple of recommendations
+        """
         recommendations = []
 
         # Basic version recommendations
-        if version < self.min_supported_version:
+        if version < _version_tuple(self.min_supported_version):
             recommendations.append(
                 f"Upgrade to PostgreSQL {self.min_supported_version} or later for full PGSD support"
             )
-        elif version < self.recommended_version:
+        elif version < _version_tuple(self.recommended_version):
             recommendations.append(
                 f"Consider upgrading to PostgreSQL {self.recommended_version} for optimal performance"
             )
 
         # Feature-specific recommendations
-        features = self.get_feature_support(version)
+        caps = self._caps_for(version[0], version[1])
 
-        if not features.get("incremental_sorting", False):
+        if not caps & _FEATURE_BITS["incremental_sorting"]:
             recommendations.append(
                 "Upgrade to PostgreSQL 14+ for improved query performance with incremental sorting"
             )
 
-        if not features.get("multirange_types", False):
+        if not caps & _FEATURE_BITS["multirange_types"]:
             recommendations.append(
                 "Upgrade to PostgreSQL 14+ for multirange type support"
             )
 
         # Security recommendations
-        if version.major < 14:
+        if version[0] < 14:
             recommendations.append(
                 "Consider upgrading for latest security patches and improvements"
             )
 
-        return recommendations
+        return tuple(recommendations)
 
     def validate_version_for_operation(
         self, version: PostgreSQLVersion, operation: str
@@ -249,31 +376,12 @@ class VersionManager:
         Returns:
             True if version supports the operation
         """
-        # Basic operations supported by all versions
-        basic_operations = [
-            "schema_info",
-            "table_info",
-            "column_info",
-            "constraint_info",
-            "index_info",
-        ]
-
-        if operation in basic_operations:
-            return version >= self.min_supported_version
-
-        # Advanced operations with version requirements
-        advanced_operations = {
-            "partitioned_table_info": "13.0",
-            "generated_column_info": "13.0",
-            "multirange_type_info": "14.0",
-            "merge_command_info": "15.0",
-        }
-
-        if operation in advanced_operations:
-            required_version = PostgreSQLVersion.parse(advanced_operations[operation])
-            return version >= required_version
+        # Version-gated operations need the matching capability
+        required_caps = _OPERATION_CAPS.get(operation)
+        if required_caps is not None:
+            return bool(self._caps_for(version.major, version.minor) & required_caps)
 
-        # Unknown operation - require minimum version
+        # Basic and unknown operations require the minimum version
         return version >= self.min_supported_version
 
     def get_version_changelog(
@@ -288,35 +396,39 @@ class VersionManager:
         Returns:
             List of changes between versions
         """
+        return list(
+            self._cached_changelog(
+                _version_tuple(from_version), _version_tuple(to_version)
+            )
+        )
+
+    def _build_version_changelog(
+        self, from_version: Tuple[int, int, int], to_version: Tuple[int, int, int]
+    ) -> Tuple[str, ...]:
+        """Build changelog between two (major, minor, patch) versions.
+
+        Args:
+            from_version: Starting version tuple
+            to_version: Target version tuple
+
+        Returns:
+            Tuple of changes between versions
+        """
         if from_version >= to_version:
-            return []
+            return ()
 
-        changelog = []
+        changelog = ()
 
         # Major version changes
-        if from_version.major < 14 and to_version.major >= 14:
-            changelog.extend(
-                [
-                    "Added incremental sorting support",
-                    "Added multirange types",
-                    "Improved performance for partitioned tables",
-                    "Enhanced JSON functionality",
-                ]
-            )
+        if from_version[0] < 14 and to_version[0] >= 14:
+            changelog += _CHANGELOG_14
 
-        if from_version.major < 15 and to_version.major >= 15:
-            changelog.extend(
-                [
-                    "Added MERGE command support",
-                    "Improved logical replication",
-                    "Enhanced security features",
-                    "Better query performance",
-                ]
-            )
+        if from_version[0] < 15 and to_version[0] >= 15:
+            changelog += _CHANGELOG_15
 
         # Minor version changes (example)
-        if from_version.minor < to_version.minor:
-            changelog.append("Bug fixes and performance improvements")
+        if from_version[1] < to_version[1]:
+            changelog += ("Bug fixes and performance improvements",)
 
         return changelog
 
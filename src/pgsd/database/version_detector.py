@@ -1,8 +1,11 @@
 """PostgreSQL version detection functionality for PGSD application."""
 
+import asyncio
+import copy
 import logging
+import time
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 
 from ..constants.database import DatabaseConstants
 from ..exceptions.database import DatabaseVersionError
@@ -28,6 +31,17 @@ class VersionDetector:
         self._source_version: Optional[PostgreSQLVersion] = None
         self._target_version: Optional[PostgreSQLVersion] = None
         self._last_detection_time: Optional[datetime] = None
+        self._last_detection_mono = 0.0
+        self._cache_ttl = DatabaseConstants.VERSION_CACHE_TTL
+        self._cache_deadline = 0.0
+
+        # Assembled version report, valid until the version cache expires
+        self._report_cache: Optional[Dict[str, Any]] = None
+        self._report_deadline = 0.0
+
+        # Single-flight guard for concurrent detect_versions() callers
+        self._detect_lock: Optional[asyncio.Lock] = None
+        self._inflight: Optional[asyncio.Future] = None
 
         # Detection results
         self._detection_results: Dict[str, Any] = {}
@@ -48,69 +62,104 @@ class VersionDetector:
         Raises:
             DatabaseVersionError: If version detection fails
         """
-        try:
-            # Check if we need to refresh the cache
-            if not force_refresh and self._source_version and self._target_version:
-                cache_age = (
-                    datetime.utcnow() - self._last_detection_time
-                ).total_seconds()
-                if cache_age < 300:  # 5 minutes cache
-                    self.logger.debug("Using cached version information")
-                    return {
-                        "source": self._source_version,
-                        "target": self._target_version,
-                    }
+        # Check if we need to refresh the cache
+        if not force_refresh and self._has_fresh_versions():
+            self.logger.debug("Using cached version information")
+            return {"source": self._source_version, "target": self._target_version}
 
-            self.logger.info("Detecting PostgreSQL versions")
+        # Share a detection that is already running instead of starting another
+        if not force_refresh and self._inflight is not None:
+            return dict(await asyncio.shield(self._inflight))
 
-            # Detect source version
-            try:
-                source_conn = await self.database_manager.get_source_connection()
-                self._source_version = await source_conn.get_version()
-                self.database_manager.return_source_connection(source_conn)
-
-                self.logger.info(
-                    "Source database version detected",
-                    extra={
-                        "version": str(self._source_version),
-                        "database": self.database_manager.config.source_db.database,
-                    },
-                )
+        async with self._get_detect_lock():
+            # Another caller may have refreshed the cache while we waited
+            if not force_refresh and self._has_fresh_versions():
+                return {
+                    "source": self._source_version,
+                    "target": self._target_version,
+                }
 
+            inflight = asyncio.get_running_loop().create_future()
+            self._inflight = inflight
+            try:
+                versions = await self._refresh_versions()
+            except asyncio.CancelledError:
+                inflight.cancel()
+                raise
             except Exception as e:
-                self.logger.error(
-                    "Failed to detect source database version", extra={"error": str(e)}
-                )
-                raise DatabaseVersionError(
-                    f"Source database version detection failed: {str(e)}",
-                    original_error=e,
-                )
+                inflight.set_exception(e)
+                # Mark retrieved so an unawaited future does not log it again
+                inflight.exception()
+                raise
+            else:
+                inflight.set_result(versions)
+                return versions
+            finally:
+                self._inflight = None
 
-            # Detect target version
-            try:
-                target_conn = await self.database_manager.get_target_connection()
-                self._target_version = await target_conn.get_version()
-                self.database_manager.return_target_connection(target_conn)
-
-                self.logger.info(
-                    "Target database version detected",
-                    extra={
-                        "version": str(self._target_version),
-                        "database": self.database_manager.config.target_db.database,
-                    },
-                )
+    def _has_fresh_versions(self) -> bool:
+        """Check whether cached versions are still within the cache TTL.
 
-            except Exception as e:
-                self.logger.error(
-                    "Failed to detect target database version", extra={"error": str(e)}
-                )
-                raise DatabaseVersionError(
-                    f"Target database version detection failed: {str(e)}",
-                    original_error=e,
-                )
+        Returns:
+            True if both versions are cached and not expired
+        """
+        return (
+            self._source_version is not None
+            and self._target_version is not None
+            and time.monotonic() < self._cache_deadline
+        )
+
+    def _get_detect_lock(self) -> asyncio.Lock:
+        """Get the lock serializing version detection.
+
+        Returns:
+            Detection lock
+        """
+        if self._detect_lock is None:
+            self._detect_lock = asyncio.Lock()
+        return self._detect_lock
+
+    async def _refresh_versions(self) -> Dict[str, PostgreSQLVersion]:
+        """Query both databases and update the version cache.
+
+        Returns:
+            Dictionary with source and target versions
+
+        Raises:
+            DatabaseVersionError: If version detection fails
+        """
+        try:
+            self.logger.info("Detecting PostgreSQL versions")
 
-            # Update cache timestamp
+            # Source and target are independent servers, so query both at once
+            source_result, target_result = await asyncio.gather(
+                self._detect_one("source"),
+                self._detect_one("target"),
+                return_exceptions=True,
+            )
+
+            for name, result in (("source", source_result), ("target", target_result)):
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        "Failed to detect %s database version",
+                        name,
+                        extra={"error": str(result)},
+                    )
+                    raise DatabaseVersionError(
+                        f"{name.capitalize()} database version detection failed: "
+                        f"{str(result)}",
+                        original_error=result,
+                    )
+
+            self._source_version = source_result
+            self._target_version = target_result
+
+            # Update cache timestamp; the deadline uses the monotonic clock so
+            # wall-clock adjustments cannot stretch or shorten the TTL
             self._last_detection_time = datetime.utcnow()
+            self._last_detection_mono = time.monotonic()
+            self._cache_deadline = self._last_detection_mono + self._cache_ttl
+            self._report_cache = None
 
             # Store detection results
             self._detection_results = {
@@ -131,6 +180,34 @@ class VersionDetector:
                     f"Version detection failed: {str(e)}", original_error=e
                 )
 
+    async def _detect_one(self, name: str) -> PostgreSQLVersion:
+        """Detect the PostgreSQL version of one database.
+
+        Args:
+            name: Database name ("source" or "target")
+
+        Returns:
+            Detected PostgreSQL version
+        """
+        conn = await getattr(self.database_manager, f"get_{name}_connection")()
+        try:
+            version = await conn.get_version()
+        finally:
+            getattr(self.database_manager, f"return_{name}_connection")(conn)
+
+        self.logger.info(
+            "%s database version detected",
+            name.capitalize(),
+            extra={
+                "version": str(version),
+                "database": getattr(
+                    self.database_manager.config, f"{name}_db"
+                ).database,
+            },
+        )
+
+        return version
+
     async def check_compatibility(
         self,
         source_version: Optional[PostgreSQLVersion] = None,
@@ -151,6 +228,22 @@ class VersionDetector:
             source_version = source_version or versions["source"]
             target_version = target_version or versions["target"]
 
+        compatibility, _ = self._check_compatibility(source_version, target_version)
+        return compatibility
+
+    def _check_compatibility(
+        self, source_version: PostgreSQLVersion, target_version: PostgreSQLVersion
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Check compatibility and keep the per-database lookups it made.
+
+        Args:
+            source_version: Source database version
+            target_version: Target database version
+
+        Returns:
+            Tuple of the compatibility information and, per database name,
+            its is_supported, features and recommendations
+        """
         compatibility = {
             "source_version": str(source_version),
             "target_version": str(target_version),
@@ -185,17 +278,24 @@ class VersionDetector:
                 )
                 compatibility["is_compatible"] = False
 
+            # Warnings and recommendations are collected as dict keys, which
+            # drops duplicates while keeping first-seen order
+            warnings: Dict[str, None] = {}
+            recommendations: Dict[str, None] = {}
+
             # Add version-specific warnings
-            compatibility["warnings"].extend(source_compat["warnings"])
-            compatibility["warnings"].extend(target_compat["warnings"])
+            warnings.update(dict.fromkeys(source_compat["warnings"]))
+            warnings.update(dict.fromkeys(target_compat["warnings"]))
 
             # Add recommendations
-            compatibility["recommendations"].extend(
-                self.version_manager.get_version_recommendations(source_version)
+            source_recommendations = self.version_manager.get_version_recommendations(
+                source_version
             )
-            compatibility["recommendations"].extend(
-                self.version_manager.get_version_recommendations(target_version)
+            target_recommendations = self.version_manager.get_version_recommendations(
+                target_version
             )
+            recommendations.update(dict.fromkeys(source_recommendations))
+            recommendations.update(dict.fromkeys(target_recommendations))
 
             # Compare versions
             version_comparison = self.version_manager.compare_versions(
@@ -204,38 +304,35 @@ class VersionDetector:
             compatibility["version_comparison"] = version_comparison
 
             # Check for compatibility concerns
-            if version_comparison["compatibility_concerns"]:
-                compatibility["warnings"].extend(
-                    version_comparison["compatibility_concerns"]
-                )
+            warnings.update(dict.fromkeys(version_comparison["compatibility_concerns"]))
 
             # Check for feature differences
-            source_features = self.version_manager.get_feature_support(source_version)
-            target_features = self.version_manager.get_feature_support(target_version)
+            source_features = source_compat["features"]
+            target_features = target_compat["features"]
 
+            # One pass over the source items with a single target probe each;
+            # feature key sets differ between versions so no fixed key tuple
             feature_differences = []
-            for feature in source_features:
-                if source_features[feature] != target_features.get(feature, False):
+            for feature, source_support in source_features.items():
+                target_support = target_features.get(feature, False)
+                if source_support != target_support:
                     feature_differences.append(
                         {
                             "feature": feature,
-                            "source_support": source_features[feature],
-                            "target_support": target_features.get(feature, False),
+                            "source_support": source_support,
+                            "target_support": target_support,
                         }
                     )
 
             compatibility["feature_differences"] = feature_differences
 
             if feature_differences:
-                compatibility["warnings"].append(
+                warnings[
                     f"Found {len(feature_differences)} feature differences between versions"
-                )
+                ] = None
 
-            # Remove duplicate warnings and recommendations
-            compatibility["warnings"] = list(set(compatibility["warnings"]))
-            compatibility["recommendations"] = list(
-                set(compatibility["recommendations"])
-            )
+            compatibility["warnings"] = list(warnings)
+            compatibility["recommendations"] = list(recommendations)
 
             self.logger.info(
                 "Version compatibility check completed",
@@ -248,7 +345,20 @@ class VersionDetector:
                 },
             )
 
-            return compatibility
+            details = {
+                "source": {
+                    "is_supported": source_compat["is_supported"],
+                    "features": source_features,
+                    "recommendations": source_recommendations,
+                },
+                "target": {
+                    "is_supported": target_compat["is_supported"],
+                    "features": target_features,
+                    "recommendations": target_recommendations,
+                },
+            }
+
+            return compatibility, details
 
         except Exception as e:
             self.logger.error(
@@ -264,68 +374,42 @@ class VersionDetector:
         Returns:
             Dictionary with version report information
         """
+        if self._report_cache is not None and time.monotonic() < self._report_deadline:
+            return self._copy_report(self._report_cache)
+
         try:
             # Detect versions if not already done
             versions = await self.detect_versions()
+            src = versions["source"]
+            tgt = versions["target"]
 
-            # Check compatibility
-            compatibility = await self.check_compatibility()
+            # Check compatibility, keeping the lookups it already made for
+            # the per-database details below
+            compatibility, details = self._check_compatibility(src, tgt)
 
             # Get database connection info
             connection_info = await self.database_manager.get_connection_info()
 
             # Build comprehensive report
             report = {
-                "report_timestamp": datetime.utcnow().isoformat(),
+                "report_timestamp": None,  # set on every copy handed out
                 "detection_results": self._detection_results,
                 "version_details": {
-                    "source": {
-                        "version": str(versions["source"]),
-                        "major": versions["source"].major,
-                        "minor": versions["source"].minor,
-                        "patch": versions["source"].patch,
-                        "server_version_num": versions["source"].server_version_num,
-                        "full_version": versions["source"].full_version,
-                        "is_supported": self.version_manager.is_version_supported(
-                            versions["source"]
-                        ),
-                        "features": self.version_manager.get_feature_support(
-                            versions["source"]
-                        ),
-                        "recommendations": self.version_manager.get_version_recommendations(
-                            versions["source"]
-                        ),
-                    },
-                    "target": {
-                        "version": str(versions["target"]),
-                        "major": versions["target"].major,
-                        "minor": versions["target"].minor,
-                        "patch": versions["target"].patch,
-                        "server_version_num": versions["target"].server_version_num,
-                        "full_version": versions["target"].full_version,
-                        "is_supported": self.version_manager.is_version_supported(
-                            versions["target"]
-                        ),
-                        "features": self.version_manager.get_feature_support(
-                            versions["target"]
-                        ),
-                        "recommendations": self.version_manager.get_version_recommendations(
-                            versions["target"]
-                        ),
-                    },
+                    name: {
+                        "version": str(version),
+                        "major": version.major,
+                        "minor": version.minor,
+                        "patch": version.patch,
+                        "server_version_num": version.server_version_num,
+                        "full_version": version.full_version,
+                        **details[name],
+                    }
+                    for name, version in versions.items()
                 },
                 "compatibility": compatibility,
                 "connection_info": {
-                    "source": (
-                        connection_info["source"].to_dict()
-                        if connection_info["source"]
-                        else None
-                    ),
-                    "target": (
-                        connection_info["target"].to_dict()
-                        if connection_info["target"]
-                        else None
-                    ),
+                    name: info.to_dict() if info else None
+                    for name, info in connection_info.items()
                 },
                 "supported_version_range": self.version_manager.get_supported_version_range(),
                 "pgsd_requirements": {
@@ -335,19 +419,15 @@ class VersionDetector:
             }
 
             # Add version changelog if versions are different
-            if versions["source"] != versions["target"]:
-                if versions["source"] < versions["target"]:
-                    report["version_changelog"] = (
-                        self.version_manager.get_version_changelog(
-                            versions["source"], versions["target"]
-                        )
-                    )
-                else:
-                    report["version_changelog"] = (
-                        self.version_manager.get_version_changelog(
-                            versions["target"], versions["source"]
-                        )
-                    )
+            if src != tgt:
+                older, newer = (src, tgt) if src < tgt else (tgt, src)
+                report["version_changelog"] = (
+                    self.version_manager.get_version_changelog(older, newer)
+                )
+
+            # Reuse the report for as long as the detected versions are cached
+            self._report_cache = report
+            self._report_deadline = self._cache_deadline
 
             self.logger.info(
                 "Version report generated",
@@ -358,7 +438,7 @@ class VersionDetector:
                 },
             )
 
-            return report
+            return self._copy_report(report)
 
         except Exception as e:
             self.logger.error(
@@ -368,6 +448,23 @@ class VersionDetector:
                 f"Version report generation failed: {str(e)}", original_error=e
             )
 
+    @staticmethod
+    def _copy_report(report: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a caller-owned copy of a cached report.
+
+        Nested sections are copied as well so callers cannot change the cache,
+        and the timestamp records when this copy was handed out.
+
+        Args:
+            report: Cached version report
+
+        Returns:
+            Independent copy of the report
+        """
+        report = copy.deepcopy(report)
+        report["report_timestamp"] = datetime.utcnow().isoformat()
+        return report
+
     async def validate_operation_support(self, operation: str) -> Dict[str, bool]:
         """Validate if both databases support a specific operation.
 
@@ -403,6 +500,10 @@ class VersionDetector:
         self._source_version = None
         self._target_version = None
         self._last_detection_time = None
+        self._last_detection_mono = 0.0
+        self._cache_deadline = 0.0
+        self._report_cache = None
+        self._report_deadline = 0.0
         self._detection_results = {}
 
         self.logger.info("Version cache cleared")
@@ -421,7 +522,7 @@ class VersionDetector:
                 else None
             ),
             "cache_age_seconds": (
-                (datetime.utcnow() - self._last_detection_time).total_seconds()
+                time.monotonic() - self._last_detection_mono
                 if self._last_detection_time
                 else None
             ),
@@ -2,6 +2,8 @@
 
 from enum import IntEnum
 
+from ..exceptions.base import PGSDError
+
 
 class ExitCode(IntEnum):
     """Standard exit codes for PGSD application."""
@@ -53,15 +55,19 @@ class ExitCode(IntEnum):
         Returns:
             Appropriate exit code
         """
-        from ..exceptions.base import PGSDError
-
         if isinstance(exception, PGSDError):
             return exception.get_exit_code()
-        elif isinstance(exception, KeyboardInterrupt):
-            return cls.KEYBOARD_INTERRUPT
-        elif isinstance(exception, MemoryError):
-            return cls.INSUFFICIENT_MEMORY
-        elif isinstance(exception, OSError):
-            return cls.SYSTEM_ERROR
-        else:
-            return cls.GENERAL_ERROR
+
+        for exception_type, exit_code in _EXCEPTION_EXIT_CODES:
+            if isinstance(exception, exception_type):
+                return exit_code
+
+        return cls.GENERAL_ERROR
+
+
+# Exit codes for non-PGSD exceptions, checked in order
+_EXCEPTION_EXIT_CODES = (
+    (KeyboardInterrupt, ExitCode.KEYBOARD_INTERRUPT),
+    (MemoryError, ExitCode.INSUFFICIENT_MEMORY),
+    (OSError, ExitCode.SYSTEM_ERROR),
+)
@@ -5,14 +5,18 @@ import functools
 import random
 import time
 from typing import Any, Callable, Optional, Tuple, Type
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..exceptions.base import PGSDError
 
 
-@dataclass
+@dataclass(frozen=True)
 class RetryConfig:
-    """Configuration for retry behavior."""
+    """Configuration for retry behavior.
+
+    Instances are immutable, so the backoff schedule computed at construction
+    stays valid for the lifetime of the configuration.
+    """
 
     max_attempts: int = 3
     base_delay: float = 1.0
@@ -23,9 +27,12 @@ class RetryConfig:
     retriable_exceptions: Tuple[Type[Exception], ...] = (PGSDError,)
     retry_on_result: Optional[Callable[[Any], bool]] = None
     before_retry: Optional[Callable[[int, Exception], None]] = None
+    _base_delays: Tuple[float, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
 
     def __post_init__(self):
-        """Validate configuration parameters."""
+        """Validate configuration parameters and precompute the backoff schedule."""
         if self.max_attempts < 1:
             raise ValueError("max_attempts must be at least 1")
         if self.base_delay < 0:
@@ -35,6 +42,28 @@ class RetryConfig:
         if self.backoff_factor < 1:
             raise ValueError("backoff_factor must be >= 1")
 
+        object.__setattr__(
+            self,
+            "_base_delays",
+            tuple(
+                self.backoff_delay(attempt)
+                for attempt in range(1, self.max_attempts + 1)
+            ),
+        )
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Calculate the capped exponential delay before jitter.
+
+        Args:
+            attempt: Attempt number (starting from 1)
+
+        Returns:
+            Delay in seconds
+        """
+        return min(
+            self.base_delay * (self.backoff_factor ** (attempt - 1)), self.max_delay
+        )
+
 
 class RetryManager:
     """Manages retry logic and execution."""
@@ -49,6 +78,9 @@ class RetryManager:
         self.config = config
         self.logger = logger
 
+        # With the default retriable set one isinstance check decides everything
+        self._only_pgsd = config.retriable_exceptions == (PGSDError,)
+
     def calculate_delay(self, attempt: int) -> float:
         """Calculate delay for given attempt number.
 
@@ -61,17 +93,19 @@ class RetryManager:
         if attempt <= 0:
             return 0
 
-        # Calculate exponential backoff
-        delay = self.config.base_delay * (self.config.backoff_factor ** (attempt - 1))
+        config = self.config
 
-        # Apply maximum delay cap
-        delay = min(delay, self.config.max_delay)
+        # Capped exponential backoff, precomputed for the configured attempts
+        base_delays = config._base_delays
+        if attempt <= len(base_delays):
+            delay = base_delays[attempt - 1]
+        else:
+            delay = config.backoff_delay(attempt)
 
         # Apply jitter if enabled
-        if self.config.jitter:
-            jitter_min, jitter_max = self.config.jitter_range
-            jitter_factor = random.uniform(jitter_min, jitter_max)
-            delay *= jitter_factor
+        if config.jitter:
+            jitter_min, jitter_max = config.jitter_range
+            delay *= jitter_min + (jitter_max - jitter_min) * random.random()
 
         return delay
 
@@ -89,6 +123,9 @@ class RetryManager:
         if attempt >= self.config.max_attempts:
             return False
 
+        if self._only_pgsd:
+            return isinstance(error, PGSDError) and error.is_retriable()
+
         # Check if exception type is retriable
         if not isinstance(error, self.config.retriable_exceptions):
             return False
@@ -160,6 +197,67 @@ class RetryManager:
         # All retries exhausted
         raise last_exception
 
+    async def execute_with_retry_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Execute async function with retry logic.
+
+        Args:
+            func: Async function to execute
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            Last exception if all retries exhausted
+        """
+        last_exception = None
+
+        for attempt in range(1, self.config.max_attempts + 1):
+            try:
+                result = await func(*args, **kwargs)
+
+                # Check if result should trigger retry
+                if self.config.retry_on_result and self.config.retry_on_result(result):
+                    if attempt < self.config.max_attempts:
+                        delay = self.calculate_delay(attempt)
+                        if self.logger:
+                            self.logger.info(
+                                f"Result triggered retry, attempt {attempt + 1} in {delay:.2f}s"
+                            )
+                        await asyncio.sleep(delay)
+                        continue
+
+                return result
+
+            except Exception as e:
+                last_exception = e
+
+                if not self.should_retry(e, attempt):
+                    raise
+
+                # Call before_retry callback if provided
+                if self.config.before_retry:
+                    try:
+                        self.config.before_retry(attempt, e)
+                    except Exception:
+                        # Don't let callback failure stop retry
+                        if self.logger:
+                            self.logger.warning(
+                                "before_retry callback failed", exc_info=True
+                            )
+
+                if attempt < self.config.max_attempts:
+                    delay = self.calculate_delay(attempt)
+                    if self.logger:
+                        self.logger.info(
+                            f"Retrying after {type(e).__name__}, attempt {attempt + 1} in {delay:.2f}s"
+                        )
+                    await asyncio.sleep(delay)
+
+        # All retries exhausted
+        raise last_exception
+
 
 def retry_on_error(
     max_attempts: int = 3,
@@ -201,9 +299,10 @@ def retry_on_error(
     )
 
     def decorator(func: Callable) -> Callable:
+        manager = RetryManager(config)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            manager = RetryManager(config)
             return manager.execute_with_retry(func, *args, **kwargs)
 
         return wrapper
@@ -251,43 +350,11 @@ def async_retry_on_error(
     )
 
     def decorator(func: Callable) -> Callable:
+        manager = RetryManager(config)
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            manager = RetryManager(config)
-            last_exception = None
-
-            for attempt in range(1, config.max_attempts + 1):
-                try:
-                    result = await func(*args, **kwargs)
-
-                    # Check if result should trigger retry
-                    if config.retry_on_result and config.retry_on_result(result):
-                        if attempt < config.max_attempts:
-                            delay = manager.calculate_delay(attempt)
-                            await asyncio.sleep(delay)
-                            continue
-
-                    return result
-
-                except Exception as e:
-                    last_exception = e
-
-                    if not manager.should_retry(e, attempt):
-                        raise
-
-                    # Call before_retry callback if provided
-                    if config.before_retry:
-                        try:
-                            config.before_retry(attempt, e)
-                        except Exception:
-                            pass  # Don't let callback failure stop retry
-
-                    if attempt < config.max_attempts:
-                        delay = manager.calculate_delay(attempt)
-                        await asyncio.sleep(delay)
-
-            # All retries exhausted
-            raise last_exception
+            return await manager.execute_with_retry_async(func, *args, **kwargs)
 
         return async_wrapper
 
@@ -1,12 +1,92 @@
 """Base exception classes for PGSD application."""
 
 import json
+import sys
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from types import GetSetDescriptorType
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple, cast
 from enum import Enum
 
 
+# Bound once so error construction and timestamp conversion skip the
+# module attribute lookups
+_UTC = timezone.utc
+_time_ns = time.time_ns
+
+_ISO_SECONDS_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _iso_from_ns(timestamp_ns: int) -> str:
+    """Format epoch nanoseconds like ``datetime.isoformat()`` for UTC.
+
+    Builds the string straight from the clock reading so serializing an error
+    does not need to materialise a datetime first.
+    """
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    formatted = time.strftime(_ISO_SECONDS_FORMAT, time.gmtime(seconds))
+    microseconds = nanoseconds // 1000
+    if microseconds:
+        return f"{formatted}.{microseconds:06d}+00:00"
+    return f"{formatted}+00:00"
+
+
+_RETRY_DELAY_TABLE_SIZE = 32
+
+
+def _build_retry_delays(
+    base_delay: float, backoff_factor: float, max_delay: float
+) -> Tuple[float, ...]:
+    """Precompute capped exponential retry delays for attempts 1..N."""
+    return tuple(
+        min(base_delay * backoff_factor**exponent, max_delay)
+        for exponent in range(_RETRY_DELAY_TABLE_SIZE)
+    )
+
+
+def _build_dict_template(
+    error_type: str, error_code: str, severity: str, category: str
+) -> Dict[str, Any]:
+    """Build the serialized skeleton of an error class in ``to_dict`` key order.
+
+    Per-instance fields are placeholders that ``to_dict`` fills in after
+    copying the template.
+    """
+    return {
+        "id": None,
+        "error_type": error_type,
+        "error_code": error_code,
+        "severity": severity,
+        "category": category,
+        "message": None,
+        "technical_details": None,
+        "recovery_suggestions": None,
+        "user_action_required": True,
+        "context": None,
+        "timestamp": None,
+        "original_error": None,
+    }
+
+
+def _json_default(value: Any) -> str:
+    """Serialize values the JSON encoder does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _datetime_from_ns(timestamp_ns: int) -> datetime:
+    """Convert epoch nanoseconds to an aware UTC datetime.
+
+    Microseconds are truncated the same way ``datetime.now()`` truncates them.
+    """
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, _UTC).replace(
+        microsecond=nanoseconds // 1000
+    )
+
+
 class ErrorSeverity(Enum):
     """Error severity levels."""
 
@@ -29,6 +109,16 @@ class ErrorCategory(Enum):
     USER_INPUT = "user_input"
 
 
+# BaseException's own args descriptor; PGSDError.args wraps it
+_BASE_ARGS = cast(GetSetDescriptorType, BaseException.__dict__["args"])
+
+
+class _DetailsRecord(Protocol):
+    """``NamedTuple`` record a subclass keeps its technical details in."""
+
+    def _asdict(self) -> Dict[str, Any]: ...
+
+
 class PGSDError(Exception):
     """Base exception class for PGSD application.
 
@@ -36,6 +126,29 @@ class PGSDError(Exception):
     recovery suggestions, and proper logging support.
     """
 
+    # The named fields below live in slots instead of the instance dict that
+    # every BaseException still carries; subclasses declare their own
+    # (possibly empty) __slots__ so their fields are slotted as well
+    __slots__ = (
+        "_message",
+        "_message_args",
+        "error_code",
+        "_severity",
+        "_severity_value",
+        "_category",
+        "_category_value",
+        "_technical_details",
+        "_details_record",
+        "_recovery_suggestions",
+        "user_action_required",
+        "original_error",
+        "_context",
+        "_id",
+        "_timestamp",
+        "_timestamp_ns",
+        "exit_code",
+    )
+
     # Default values for subclasses
     default_error_code: str = "PGSD_ERROR"
     default_severity: ErrorSeverity = ErrorSeverity.MEDIUM
@@ -48,14 +161,51 @@ class PGSDError(Exception):
     max_retry_delay: float = 60.0
     retry_backoff_factor: float = 2.0
 
+    # Serialized forms of the defaults and the retry delay schedule,
+    # refreshed for every subclass; the schedule remembers the
+    # (base, factor, max) settings it was built from
+    _default_severity_value: str = default_severity.value
+    _default_category_value: str = default_category.value
+    _retry_delay_settings: Tuple[float, float, float] = (
+        base_retry_delay,
+        retry_backoff_factor,
+        max_retry_delay,
+    )
+    _retry_delays: Tuple[float, ...] = _build_retry_delays(*_retry_delay_settings)
+    _dict_template: Dict[str, Any] = _build_dict_template(
+        "PGSDError",
+        default_error_code,
+        _default_severity_value,
+        _default_category_value,
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute serialized defaults and retry delays for the subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.default_error_code = sys.intern(cls.default_error_code)
+        cls._default_severity_value = cls.default_severity.value
+        cls._default_category_value = cls.default_category.value
+        cls._retry_delay_settings = (
+            cls.base_retry_delay,
+            cls.retry_backoff_factor,
+            cls.max_retry_delay,
+        )
+        cls._retry_delays = _build_retry_delays(*cls._retry_delay_settings)
+        cls._dict_template = _build_dict_template(
+            cls.__name__,
+            cls.default_error_code,
+            cls._default_severity_value,
+            cls._default_category_value,
+        )
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str],
         error_code: Optional[str] = None,
         severity: Optional[ErrorSeverity] = None,
         category: Optional[ErrorCategory] = None,
         technical_details: Optional[Dict[str, Any]] = None,
-        recovery_suggestions: Optional[List[str]] = None,
+        recovery_suggestions: Optional[Sequence[str]] = None,
         user_action_required: bool = True,
         original_error: Optional[Exception] = None,
         context: Optional[Dict[str, Any]] = None,
@@ -63,65 +213,273 @@ class PGSDError(Exception):
         """Initialize PGSD error.
 
         Args:
-            message: Human-readable error message
+            message: Human-readable error message, or None when the subclass
+                formats it later through ``_defer_message()``
             error_code: Unique error identifier
             severity: Error severity level
             category: Error category for classification
             technical_details: Technical information for debugging
-            recovery_suggestions: List of recovery suggestions
+            recovery_suggestions: Sequence of recovery suggestions
             user_action_required: Whether user action is needed
             original_error: Original exception if this is a wrapper
             context: Additional context information
         """
-        super().__init__(message)
-
-        self.message = message
-        self.error_code = error_code or self.default_error_code
-        self.severity = severity or self.default_severity
-        self.category = category or self.default_category
-        self.technical_details = technical_details or {}
-        self.recovery_suggestions = recovery_suggestions or []
+        # Subclasses may pass message=None and defer formatting through
+        # _defer_message(); the text is then only built when first read
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+
+        self._message: Optional[str] = message
+        self._message_args: Optional[Tuple[str, Tuple[Any, ...]]] = None
+        # Interned so code comparisons and lookups can short-circuit on identity
+        self.error_code = (
+            sys.intern(error_code) if error_code else self.default_error_code
+        )
+        if severity:
+            self.severity = severity
+        else:
+            self._severity = self.default_severity
+            self._severity_value = self._default_severity_value
+        if category:
+            self.category = category
+        else:
+            self._category = self.default_category
+            self._category_value = self._default_category_value
+        # Empty containers are only allocated once something reads them
+        self._technical_details = technical_details or None
+        self._details_record: Optional[_DetailsRecord] = None
+        # Shared class-level suggestion tuples are stored as-is and only
+        # copied into a list once something reads or extends them
+        self._recovery_suggestions = recovery_suggestions or None
         self.user_action_required = user_action_required
         self.original_error = original_error
-        self.context = context or {}
+        self._context = context or None
+
+        # Unique error ID and timestamp are materialised on first access;
+        # only the raw clock reading is taken here
+        self._id: Optional[str] = None
+        self._timestamp: Optional[datetime] = None
+        self._timestamp_ns = _time_ns()
+
+        # Add original error information to technical details; without
+        # explicit details this happens when the dict is first built
+        if original_error is not None and self._technical_details is not None:
+            self._add_original_error_details(self._technical_details)
+
+    @property
+    def id(self) -> str:
+        """Unique identifier of this error, generated on first access."""
+        if self._id is None:
+            self._id = uuid.uuid4().hex
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
+
+    @property
+    def message(self) -> str:
+        """Human-readable error message."""
+        message = self._message
+        if message is None:
+            message = self._format_deferred_message()
+        return message
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+        self._message_args = None
+
+    def _defer_message(self, template: str, params: Tuple[Any, ...]) -> None:
+        """Format the message from a %-template only when it is first read.
+
+        Args:
+            template: %-style message template
+            params: Values substituted into the template
+        """
+        self._message = None
+        self._message_args = (template, params)
+
+    def _format_deferred_message(self) -> str:
+        """Format the deferred message and store it as the exception args.
 
-        # Generate unique error ID and timestamp
-        self.id = str(uuid.uuid4())
-        self.timestamp = datetime.now(timezone.utc)
-
-        # Add original error information to technical details
-        if original_error:
-            self.technical_details.update(
-                {
-                    "original_error_type": type(original_error).__name__,
-                    "original_error_message": str(original_error),
-                }
+        Returns:
+            Formatted message (empty if no message was ever given)
+        """
+        message = ""
+        if self._message_args is not None:
+            template, params = self._message_args
+            message = template % params
+            self._message_args = None
+        self._message = message
+        # Deferred errors were created without args; filling them in keeps
+        # args, repr() and pickling in line with an eagerly built message
+        _BASE_ARGS.__set__(self, (message,))
+        return message
+
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        """Exception arguments, formatting a deferred message first."""
+        if self._message is None:
+            self._format_deferred_message()
+        args: Tuple[Any, ...] = _BASE_ARGS.__get__(self)
+        return args
+
+    @args.setter
+    def args(self, value: Tuple[Any, ...]) -> None:
+        _BASE_ARGS.__set__(self, value)
+
+    @property
+    def technical_details(self) -> Dict[str, Any]:
+        """Technical information for debugging."""
+        if self._technical_details is None:
+            details = self._build_technical_details()
+            if self.original_error is not None:
+                self._add_original_error_details(details)
+            self._technical_details = details
+        return self._technical_details
+
+    @technical_details.setter
+    def technical_details(self, value: Dict[str, Any]) -> None:
+        self._technical_details = value
+
+    @property
+    def recovery_suggestions(self) -> List[str]:
+        """Suggestions for recovering from this error."""
+        suggestions = self._recovery_suggestions
+        if suggestions is None:
+            suggestions = self._recovery_suggestions = (
+                self._build_recovery_suggestions()
             )
+        elif not isinstance(suggestions, list):
+            suggestions = self._recovery_suggestions = list(suggestions)
+        return suggestions
+
+    @recovery_suggestions.setter
+    def recovery_suggestions(self, value: List[str]) -> None:
+        self._recovery_suggestions = value
+
+    def _build_technical_details(self) -> Dict[str, Any]:
+        """Build the default technical details on first access.
+
+        Subclasses store their details as a ``NamedTuple`` record in
+        ``_details_record``; it is only turned into a dict here, so nothing
+        is allocated for errors that are only logged by message.
+
+        Returns:
+            New technical details dictionary
+        """
+        record = self._details_record
+        return record._asdict() if record is not None else {}
+
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build the default recovery suggestions on first access.
+
+        Returns:
+            New list of recovery suggestions
+        """
+        return []
+
+    def _add_original_error_details(self, details: Dict[str, Any]) -> None:
+        """Record the wrapped exception in a technical details dictionary."""
+        details["original_error_type"] = type(self.original_error).__name__
+        details["original_error_message"] = str(self.original_error)
+
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Additional context information."""
+        if self._context is None:
+            self._context = {}
+        return self._context
+
+    @context.setter
+    def context(self, value: Dict[str, Any]) -> None:
+        self._context = value
+
+    @property
+    def severity(self) -> ErrorSeverity:
+        """Severity level of this error."""
+        return self._severity
+
+    @severity.setter
+    def severity(self, value: ErrorSeverity) -> None:
+        self._severity = value
+        self._severity_value = value.value
+
+    @property
+    def category(self) -> ErrorCategory:
+        """Category of this error."""
+        return self._category
+
+    @category.setter
+    def category(self, value: ErrorCategory) -> None:
+        self._category = value
+        self._category_value = value.value
+
+    @property
+    def timestamp(self) -> datetime:
+        """UTC time the error was created."""
+        if self._timestamp is None:
+            self._timestamp = _datetime_from_ns(self._timestamp_ns)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
 
     def __str__(self) -> str:
         """Return string representation of the error."""
         return self.message
 
+    def __repr__(self) -> str:
+        """Return the standard exception repr, formatting a deferred message."""
+        if self._message is None:
+            self._format_deferred_message()
+        return super().__repr__()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Include slot values so copies and pickles keep the full error state."""
+        if self._message is None:
+            self._format_deferred_message()
+        # BaseException omits the state entry while __dict__ is empty
+        reduced = cast(Tuple[Any, ...], super().__reduce__())
+        state = dict(reduced[2]) if len(reduced) > 2 else {}
+        # Errors whose message was replaced before it was formatted have no args
+        args = reduced[1] or (self.message,)
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return reduced[0], args, state
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary for serialization.
 
         Returns:
             Dictionary representation of the error
         """
-        return {
-            "id": self.id,
-            "error_type": type(self).__name__,
-            "error_code": self.error_code,
-            "severity": self.severity.value,
-            "category": self.category.value,
-            "message": self.message,
-            "technical_details": self.technical_details,
-            "recovery_suggestions": self.recovery_suggestions,
-            "user_action_required": self.user_action_required,
-            "context": self.context,
-            "timestamp": self.timestamp.isoformat(),
-            "original_error": str(self.original_error) if self.original_error else None,
-        }
+        # Copying the class template keeps the key order and the static
+        # fields; everything an instance can override is written over it
+        data = dict(self._dict_template)
+        data["id"] = self.id
+        data["error_code"] = self.error_code
+        data["severity"] = self._severity_value
+        data["category"] = self._category_value
+        data["message"] = self.message
+        data["technical_details"] = self.technical_details
+        data["recovery_suggestions"] = self.recovery_suggestions
+        data["user_action_required"] = self.user_action_required
+        data["context"] = self.context
+        data["timestamp"] = (
+            self._timestamp.isoformat()
+            if self._timestamp is not None
+            else _iso_from_ns(self._timestamp_ns)
+        )
+        if self.original_error:
+            data["original_error"] = str(self.original_error)
+        return data
 
     def to_json(self, indent: Optional[int] = None) -> str:
         """Convert error to JSON string.
@@ -132,17 +490,10 @@ class PGSDError(Exception):
         Returns:
             JSON string representation
         """
-        try:
-            return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
-        except TypeError:
-            # Fallback for non-serializable objects
-            safe_dict = self.to_dict()
-            for key, value in safe_dict.items():
-                if not isinstance(
-                    value, (str, int, float, bool, list, dict, type(None))
-                ):
-                    safe_dict[key] = str(value)
-            return json.dumps(safe_dict, indent=indent, ensure_ascii=False)
+        # Non-serializable values are converted where they occur, in one pass
+        return json.dumps(
+            self.to_dict(), indent=indent, ensure_ascii=False, default=_json_default
+        )
 
     def get_exit_code(self) -> int:
         """Get exit code for CLI integration.
@@ -167,8 +518,9 @@ class PGSDError(Exception):
         Args:
             suggestion: Recovery suggestion text
         """
-        if suggestion not in self.recovery_suggestions:
-            self.recovery_suggestions.append(suggestion)
+        suggestions = self.recovery_suggestions
+        if suggestion not in suggestions:
+            suggestions.append(suggestion)
 
     def is_retriable(self) -> bool:
         """Check if this error should be retried.
@@ -190,6 +542,19 @@ class PGSDError(Exception):
         if attempt <= 0:
             return 0
 
+        # The table is only valid for the settings it was built from; an
+        # instance override or a later change to the class is computed directly
+        settings = (
+            self.base_retry_delay,
+            self.retry_backoff_factor,
+            self.max_retry_delay,
+        )
+        if (
+            attempt <= _RETRY_DELAY_TABLE_SIZE
+            and settings == self._retry_delay_settings
+        ):
+            return self._retry_delays[attempt - 1]
+
         delay = self.base_retry_delay * (self.retry_backoff_factor ** (attempt - 1))
         return min(delay, self.max_retry_delay)
 
@@ -201,6 +566,8 @@ class PGSDWarning(UserWarning):
     but should be brought to user attention.
     """
 
+    __slots__ = ("message", "context", "_timestamp", "_timestamp_ns")
+
     def __init__(self, message: str, context: Optional[Dict[str, Any]] = None) -> None:
         """Initialize PGSD warning.
 
@@ -211,7 +578,19 @@ class PGSDWarning(UserWarning):
         super().__init__(message)
         self.message = message
         self.context = context or {}
-        self.timestamp = datetime.now(timezone.utc)
+        self._timestamp: Optional[datetime] = None
+        self._timestamp_ns = _time_ns()
+
+    @property
+    def timestamp(self) -> datetime:
+        """UTC time the warning was created."""
+        if self._timestamp is None:
+            self._timestamp = _datetime_from_ns(self._timestamp_ns)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
 
     def __str__(self) -> str:
         """Return string representation of the warning."""
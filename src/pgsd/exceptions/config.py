@@ -9,6 +9,8 @@ from .base import PGSDError, ErrorSeverity, ErrorCategory
 class ConfigurationError(PGSDError):
     """Base class for configuration-related errors."""
 
+    __slots__ = ()
+
     default_error_code = "CONFIGURATION_ERROR"
     default_severity = ErrorSeverity.HIGH
     default_category = ErrorCategory.CONFIGURATION
@@ -19,9 +21,16 @@ class ConfigurationError(PGSDError):
 class InvalidConfigurationError(ConfigurationError):
     """Raised when configuration contains invalid values."""
 
+    __slots__ = ()
+
     default_error_code = "INVALID_CONFIGURATION"
     default_exit_code = 21
 
+    _STATIC_SUGGESTIONS = (
+        "Check configuration file syntax and structure",
+        "Refer to documentation for valid configuration options",
+    )
+
     def __init__(
         self,
         config_key: str,
@@ -53,13 +62,10 @@ class InvalidConfigurationError(ConfigurationError):
         # Recovery suggestions
         recovery_suggestions = [
             f"Update '{config_key}' to a valid value: {expected_type_or_values}",
-            "Check configuration file syntax and structure",
-            "Refer to documentation for valid configuration options",
+            *self._STATIC_SUGGESTIONS,
+            *((f"Edit configuration file: {config_file}",) if config_file else ()),
         ]
 
-        if config_file:
-            recovery_suggestions.append(f"Edit configuration file: {config_file}")
-
         super().__init__(
             message=message,
             technical_details=technical_details,
@@ -70,9 +76,13 @@ class InvalidConfigurationError(ConfigurationError):
 class MissingConfigurationError(ConfigurationError):
     """Raised when required configuration is missing."""
 
+    __slots__ = ()
+
     default_error_code = "MISSING_CONFIGURATION"
     default_exit_code = 22
 
+    _STATIC_SUGGESTIONS = ("Check configuration file completeness",)
+
     def __init__(
         self,
         missing_keys: List[str],
@@ -107,28 +117,24 @@ class MissingConfigurationError(ConfigurationError):
         }
 
         # Recovery suggestions
+        if not config_file:
+            file_suggestion = "Create a configuration file with required settings"
+        elif config_file.exists():
+            file_suggestion = f"Edit existing configuration file: {config_file}"
+        else:
+            file_suggestion = f"Create configuration file: {config_file}"
+
         recovery_suggestions = [
             f"Add missing configuration keys: {', '.join(missing_keys)}",
-            "Check configuration file completeness",
+            *self._STATIC_SUGGESTIONS,
+            file_suggestion,
+            *(
+                (f"Ensure section '[{config_section}]' exists in configuration",)
+                if config_section
+                else ()
+            ),
         ]
 
-        if config_file:
-            if config_file.exists():
-                recovery_suggestions.append(
-                    f"Edit existing configuration file: {config_file}"
-                )
-            else:
-                recovery_suggestions.append(f"Create configuration file: {config_file}")
-        else:
-            recovery_suggestions.append(
-                "Create a configuration file with required settings"
-            )
-
-        if config_section:
-            recovery_suggestions.append(
-                f"Ensure section '[{config_section}]' exists in configuration"
-            )
-
         super().__init__(
             message=message,
             technical_details=technical_details,
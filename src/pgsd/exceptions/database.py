@@ -1,12 +1,6 @@
 """Database-related exception classes."""
 
-from typing import Any, List, Optional
-
-try:
-    import psycopg2
-except ImportError:
-    # Handle missing psycopg2 gracefully for testing
-    psycopg2 = None
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from .base import PGSDError, ErrorSeverity, ErrorCategory
 
@@ -14,6 +8,8 @@ from .base import PGSDError, ErrorSeverity, ErrorCategory
 class DatabaseError(PGSDError):
     """Base class for database-related errors."""
 
+    __slots__ = ()
+
     default_error_code = "DATABASE_ERROR"
     default_severity = ErrorSeverity.HIGH
     default_category = ErrorCategory.CONNECTION
@@ -22,7 +18,7 @@ class DatabaseError(PGSDError):
     base_retry_delay = 2.0
     max_retry_delay = 30.0
 
-    def __init__(self, message: str, **kwargs):
+    def __init__(self, message: Optional[str], **kwargs: Any) -> None:
         """Initialize database error with flexible arguments."""
         # Extract connection_id if provided and add to context
         connection_id = kwargs.pop('connection_id', None)
@@ -37,14 +33,37 @@ class DatabaseError(PGSDError):
 class DatabaseConnectionError(DatabaseError):
     """Raised when database connection fails."""
 
+    __slots__ = ("_extra_details",)
+
     default_error_code = "DB_CONNECTION_FAILED"
     default_severity = ErrorSeverity.CRITICAL
     default_exit_code = 11
 
+    _STATIC_SUGGESTIONS = (
+        "Verify that PostgreSQL server is running and accessible",
+        "Verify network connectivity to the database server",
+        "Check firewall settings and security groups",
+        "Ensure database credentials are correct",
+    )
+    _MSG_WITH_USER = (
+        "Failed to connect to PostgreSQL database '%s' at %s:%s as user '%s'"
+    )
+    _MSG_NO_USER = "Failed to connect to PostgreSQL database '%s' at %s:%s"
+
+    class _Details(NamedTuple):
+        host: str
+        port: int
+        database: str
+        user: Optional[str]
+        connection_type: str = "postgresql"
+
+    _details_record: Optional[_Details]
+    _extra_details: Optional[Dict[str, Any]]
+
     def __init__(
         self,
-        *args,
-        **kwargs
+        *args: Any,
+        **kwargs: Any
     ) -> None:
         """Initialize database connection error.
 
@@ -55,52 +74,62 @@ class DatabaseConnectionError(DatabaseError):
         if len(args) == 1 and isinstance(args[0], str):
             # Message-based initialization
             message = args[0]
+            self._extra_details = None
             super().__init__(message, **kwargs)
             return
 
         # Parameter-based initialization (legacy)
-        host, port, database = args[0], args[1], args[2]
-        user = args[3] if len(args) > 3 else None
-        original_error = args[4] if len(args) > 4 else None
+        self._init_from_parameters(*args[:5])
 
-        # Construct error message
-        connection_info = f"{host}:{port}"
-        if user:
-            message = (
-                f"Failed to connect to PostgreSQL database '{database}' "
-                f"at {connection_info} as user '{user}'"
-            )
-        else:
-            message = (
-                f"Failed to connect to PostgreSQL database '{database}' "
-                f"at {connection_info}"
-            )
+    def _init_from_parameters(
+        self,
+        host: str,
+        port: int,
+        database: str,
+        user: Optional[str] = None,
+        original_error: Optional[Exception] = None,
+        extra_details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Initialize from connection parameters.
 
-        # Technical details
-        technical_details = {
-            "host": host,
-            "port": port,
-            "database": database,
-            "user": user,
-            "connection_type": "postgresql",
-        }
+        Args:
+            host: Database host
+            port: Database port
+            database: Database name
+            user: Database user (optional)
+            original_error: Original exception (optional)
+            extra_details: Additional technical details (optional)
+        """
+        super().__init__(message=None, original_error=original_error)
 
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Verify that PostgreSQL server is running and accessible",
-            f"Check if host '{host}' and port {port} are correct",
-            "Verify network connectivity to the database server",
-            "Check firewall settings and security groups",
-            "Ensure database credentials are correct",
-            f"Verify that database '{database}' exists on the server",
-        ]
+        # Only the raw parameters are kept; details and suggestions are
+        # built from them when first read
+        self._details_record = self._Details(host, port, database, user)
+        self._extra_details = extra_details
 
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            original_error=original_error,
-        )
+        # The message is only formatted if something reads it
+        if user:
+            self._defer_message(self._MSG_WITH_USER, (database, host, port, user))
+        else:
+            self._defer_message(self._MSG_NO_USER, (database, host, port))
+
+    def _build_technical_details(self) -> Dict[str, Any]:
+        """Build connection details from the stored parameters."""
+        details = super()._build_technical_details()
+        if self._extra_details:
+            details.update(self._extra_details)
+        return details
+
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build connection suggestions from the stored parameters."""
+        record = self._details_record
+        if record is None:
+            return super()._build_recovery_suggestions()
+        return [
+            *self._STATIC_SUGGESTIONS,
+            f"Check if host '{record.host}' and port {record.port} are correct",
+            f"Verify that database '{record.database}' exists on the server",
+        ]
 
     @classmethod
     def from_psycopg2_error(
@@ -123,25 +152,41 @@ class DatabaseConnectionError(DatabaseError):
         Returns:
             DatabaseConnectionError instance
         """
-        instance = cls(host, port, database, user, error)
-
-        # Add PostgreSQL-specific technical details
-        if hasattr(error, "pgcode"):
-            instance.technical_details["postgres_error_code"] = error.pgcode
-        if hasattr(error, "pgerror"):
-            instance.technical_details["postgres_error_message"] = error.pgerror
-
+        # PostgreSQL-specific technical details, when the driver reported them
+        extra_details = {}
+        pgcode = getattr(error, "pgcode", None)
+        if pgcode is not None:
+            extra_details["postgres_error_code"] = pgcode
+        pgerror = getattr(error, "pgerror", None)
+        if pgerror is not None:
+            extra_details["postgres_error_message"] = pgerror
+
+        # Build the instance in one pass instead of patching it afterwards
+        instance = cls.__new__(cls)
+        instance._init_from_parameters(host, port, database, user, error, extra_details)
         return instance
 
 
 class SchemaNotFoundError(DatabaseError):
     """Raised when specified schema does not exist."""
 
+    __slots__ = ()
+
     default_error_code = "SCHEMA_NOT_FOUND"
     default_severity = ErrorSeverity.MEDIUM
     default_exit_code = 12
     retriable = False
 
+    _STATIC_SUGGESTIONS = (
+        "Check schema name spelling and case sensitivity",
+        "Ensure you have proper permissions to access the schema",
+    )
+
+    class _Details(NamedTuple):
+        schema_name: str
+        database: str
+        available_schemas: Tuple[str, ...]
+
     def __init__(
         self,
         schema_name: str,
@@ -157,18 +202,10 @@ class SchemaNotFoundError(DatabaseError):
         """
         message = f"Schema '{schema_name}' not found in database '{database}'"
 
-        # Technical details
-        technical_details = {
-            "schema_name": schema_name,
-            "database": database,
-            "available_schemas": available_schemas or [],
-        }
-
         # Recovery suggestions
         recovery_suggestions = [
             f"Verify that schema '{schema_name}' exists in the database",
-            "Check schema name spelling and case sensitivity",
-            "Ensure you have proper permissions to access the schema",
+            *self._STATIC_SUGGESTIONS,
         ]
 
         # Add available schemas to suggestions if provided
@@ -176,22 +213,51 @@ class SchemaNotFoundError(DatabaseError):
             available_list = ", ".join(available_schemas)
             recovery_suggestions.append(f"Available schemas: {available_list}")
 
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
+        super().__init__(message=message, recovery_suggestions=recovery_suggestions)
+        # Snapshot the caller's list so later changes to it do not leak in
+        self._details_record = self._Details(
+            schema_name, database, tuple(available_schemas) if available_schemas else ()
         )
 
+    def _build_technical_details(self) -> Dict[str, Any]:
+        """Build schema details, exposing the available schemas as a list."""
+        details = super()._build_technical_details()
+        details["available_schemas"] = list(details["available_schemas"])
+        return details
+
 
 class InsufficientPrivilegesError(DatabaseError):
     """Raised when user lacks required database privileges."""
 
+    __slots__ = ()
+
     default_error_code = "INSUFFICIENT_PRIVILEGES"
     default_severity = ErrorSeverity.HIGH
     default_category = ErrorCategory.AUTHORIZATION
     default_exit_code = 13
     retriable = False
 
+    _STATIC_SUGGESTIONS = (
+        "Contact database administrator for privilege escalation",
+        "Verify that user has proper role assignments",
+    )
+    _MESSAGES = {
+        # Keyed on (user given, object name given)
+        (True, True): (
+            "User '{user}' lacks privileges to {operation} "
+            "on '{object_name}'"
+        ),
+        (True, False): "User '{user}' lacks privileges to {operation}",
+        (False, True): "Insufficient privileges to {operation} on '{object_name}'",
+        (False, False): "Insufficient privileges to {operation}",
+    }
+
+    class _Details(NamedTuple):
+        operation: str
+        required_privileges: List[str]
+        user: Optional[str]
+        object_name: Optional[str]
+
     def __init__(
         self,
         operation: str,
@@ -207,32 +273,15 @@ class InsufficientPrivilegesError(DatabaseError):
             user: Database user (optional)
             object_name: Name of the database object (optional)
         """
-        # Construct error message
-        if object_name and user:
-            message = (
-                f"User '{user}' lacks privileges to {operation} on '{object_name}'"
-            )
-        elif user:
-            message = f"User '{user}' lacks privileges to {operation}"
-        elif object_name:
-            message = f"Insufficient privileges to {operation} on '{object_name}'"
-        else:
-            message = f"Insufficient privileges to {operation}"
-
-        # Technical details
-        technical_details = {
-            "operation": operation,
-            "required_privileges": required_privileges,
-            "user": user,
-            "object_name": object_name,
-        }
+        message = self._MESSAGES[bool(user), bool(object_name)].format(
+            user=user, operation=operation, object_name=object_name
+        )
 
         # Recovery suggestions
         privileges_str = ", ".join(required_privileges)
         recovery_suggestions = [
             f"Grant required privileges: {privileges_str}",
-            "Contact database administrator for privilege escalation",
-            "Verify that user has proper role assignments",
+            *self._STATIC_SUGGESTIONS,
         ]
 
         if object_name:
@@ -240,21 +289,39 @@ class InsufficientPrivilegesError(DatabaseError):
                 f"Check object-level permissions on '{object_name}'"
             )
 
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
+        super().__init__(message=message, recovery_suggestions=recovery_suggestions)
+        self._details_record = self._Details(
+            operation, required_privileges, user, object_name
         )
 
 
 class QueryExecutionError(DatabaseError):
     """Raised when SQL query execution fails."""
 
+    __slots__ = ()
+
     default_error_code = "QUERY_EXECUTION_FAILED"
     default_severity = ErrorSeverity.MEDIUM
     default_exit_code = 14
     retriable = True
 
+    _STATIC_SUGGESTIONS = (
+        "Check SQL query syntax and structure",
+        "Verify that referenced tables and columns exist",
+        "Ensure query permissions are sufficient",
+        "Check for data type compatibility issues",
+    )
+
+    class _Details(NamedTuple):
+        query: str
+        error_message: str
+        postgres_error_code: Optional[str]
+
+    _details_record: _Details
+
+    _MAX_QUERY_LENGTH = 500
+    _MSG = "Query execution failed: %s"
+
     def __init__(
         self,
         query: str,
@@ -270,333 +337,349 @@ class QueryExecutionError(DatabaseError):
             postgres_error_code: PostgreSQL error code (optional)
             original_error: Original exception (optional)
         """
-        message = f"Query execution failed: {error_message}"
-
-        # Truncate very long queries for readability
-        truncated_query = query if len(query) <= 500 else query[:500] + "..."
-
-        # Technical details
-        technical_details = {
-            "query": truncated_query,
-            "error_message": error_message,
-            "postgres_error_code": postgres_error_code,
-        }
-
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Check SQL query syntax and structure",
-            "Verify that referenced tables and columns exist",
-            "Ensure query permissions are sufficient",
-            "Check for data type compatibility issues",
+        super().__init__(message=None, original_error=original_error)
+
+        # Retry loops usually swallow these errors, so the message, details
+        # and suggestions are only assembled from the raw arguments on demand.
+        # The full query is referenced, not copied; it is truncated when the
+        # technical details are built
+        self._defer_message(self._MSG, (error_message,))
+        self._details_record = self._Details(query, error_message, postgres_error_code)
+
+    def _build_technical_details(self) -> Dict[str, Any]:
+        """Build query details, truncating very long queries for readability."""
+        details = super()._build_technical_details()
+        query = details["query"]
+        if len(query) > self._MAX_QUERY_LENGTH:
+            details["query"] = query[: self._MAX_QUERY_LENGTH] + "..."
+        return details
+
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build query suggestions, pointing at the PostgreSQL error code."""
+        postgres_error_code = self._details_record.postgres_error_code
+        if not postgres_error_code:
+            return list(self._STATIC_SUGGESTIONS)
+        return [
+            *self._STATIC_SUGGESTIONS,
+            f"Refer to PostgreSQL error code documentation for "
+            f"'{postgres_error_code}'",
         ]
 
-        if postgres_error_code:
-            recovery_suggestions.append(
-                f"Refer to PostgreSQL error code documentation for "
-                f"'{postgres_error_code}'"
-            )
-
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            original_error=original_error,
-        )
-
 
 class SchemaCollectionError(DatabaseError):
     """Raised when schema information collection fails."""
 
+    __slots__ = ("schema", "database_type")
+
     default_error_code = "SCHEMA_COLLECTION_FAILED"
     default_severity = ErrorSeverity.MEDIUM
     default_exit_code = 15
 
+    _STATIC_SUGGESTIONS = (
+        "Verify schema exists and is accessible",
+        "Check database connection permissions",
+        "Ensure schema privileges are sufficient",
+        "Verify PostgreSQL version compatibility",
+    )
+
+    class _Details(NamedTuple):
+        schema: Optional[str]
+        database_type: Optional[str]
+
     def __init__(
         self,
         message: str,
         schema: Optional[str] = None,
         database_type: Optional[str] = None,
-        **kwargs,
-    ):
+        **kwargs: Any,
+    ) -> None:
         self.schema = schema
         self.database_type = database_type
 
-        # Technical details
-        technical_details = {"schema": schema, "database_type": database_type}
+        super().__init__(message=message, **kwargs)
+        self._details_record = self._Details(schema, database_type)
 
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Verify schema exists and is accessible",
-            "Check database connection permissions",
-            "Ensure schema privileges are sufficient",
-            "Verify PostgreSQL version compatibility",
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build schema collection suggestions from the stored schema."""
+        if not self.schema:
+            return list(self._STATIC_SUGGESTIONS)
+        return [
+            *self._STATIC_SUGGESTIONS,
+            f"Confirm schema '{self.schema}' exists in the database",
         ]
 
-        if schema:
-            recovery_suggestions.append(
-                f"Confirm schema '{schema}' exists in the database"
-            )
-
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            **kwargs,
-        )
-
 
 class DatabaseVersionError(DatabaseError):
     """Raised when PostgreSQL version detection or compatibility check fails."""
 
+    __slots__ = ("version", "minimum_required")
+
     default_error_code = "VERSION_ERROR"
     default_severity = ErrorSeverity.MEDIUM
     default_exit_code = 16
 
+    _STATIC_SUGGESTIONS = (
+        "Check PostgreSQL server version",
+        "Upgrade PostgreSQL if version is too old",
+        "Verify version detection query permissions",
+    )
+
+    class _Details(NamedTuple):
+        detected_version: Optional[str]
+        minimum_required: Optional[str]
+
     def __init__(
         self,
         message: str,
         version: Optional[str] = None,
         minimum_required: Optional[str] = None,
-        **kwargs,
-    ):
+        **kwargs: Any,
+    ) -> None:
         self.version = version
         self.minimum_required = minimum_required
 
-        # Technical details
-        technical_details = {
-            "detected_version": version,
-            "minimum_required": minimum_required,
-        }
+        super().__init__(message=message, **kwargs)
+        self._details_record = self._Details(version, minimum_required)
 
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Check PostgreSQL server version",
-            "Upgrade PostgreSQL if version is too old",
-            "Verify version detection query permissions",
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build version suggestions from the stored minimum version."""
+        if not self.minimum_required:
+            return list(self._STATIC_SUGGESTIONS)
+        return [
+            *self._STATIC_SUGGESTIONS,
+            f"Ensure PostgreSQL version is {self.minimum_required} or higher",
         ]
 
-        if minimum_required:
-            recovery_suggestions.append(
-                f"Ensure PostgreSQL version is {minimum_required} or higher"
-            )
-
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            **kwargs,
-        )
-
 
 class DatabaseManagerError(DatabaseError):
     """Raised when database manager operations fail."""
 
+    __slots__ = ("operation",)
+
     default_error_code = "MANAGER_ERROR"
     default_severity = ErrorSeverity.HIGH
     default_exit_code = 17
 
-    def __init__(self, message: str, operation: Optional[str] = None, **kwargs):
-        self.operation = operation
+    _STATIC_SUGGESTIONS = (
+        "Check database configuration",
+        "Verify connection pool status",
+        "Review database manager initialization",
+        "Check for resource exhaustion",
+    )
 
-        # Technical details
-        technical_details = {"operation": operation}
+    class _Details(NamedTuple):
+        operation: Optional[str]
 
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Check database configuration",
-            "Verify connection pool status",
-            "Review database manager initialization",
-            "Check for resource exhaustion",
-        ]
+    def __init__(
+        self, message: str, operation: Optional[str] = None, **kwargs: Any
+    ) -> None:
+        self.operation = operation
 
-        if operation:
-            recovery_suggestions.append(f"Retry the '{operation}' operation")
+        super().__init__(message=message, **kwargs)
+        self._details_record = self._Details(operation)
 
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            **kwargs,
-        )
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build manager suggestions from the stored operation."""
+        if not self.operation:
+            return list(self._STATIC_SUGGESTIONS)
+        return [*self._STATIC_SUGGESTIONS, f"Retry the '{self.operation}' operation"]
 
 
 class DatabasePoolError(DatabaseError):
     """Raised when database connection pool operations fail."""
 
+    __slots__ = ("pool_size", "active_connections")
+
     default_error_code = "POOL_ERROR"
     default_severity = ErrorSeverity.HIGH
     default_exit_code = 18
 
+    _STATIC_SUGGESTIONS = (
+        "Check connection pool configuration",
+        "Verify database server availability",
+        "Check for connection leaks",
+        "Consider increasing pool size if needed",
+        "Review connection timeout settings",
+    )
+
+    class _Details(NamedTuple):
+        pool_size: Optional[int]
+        active_connections: Optional[int]
+
     def __init__(
         self,
         message: str,
         pool_size: Optional[int] = None,
         active_connections: Optional[int] = None,
-        **kwargs,
-    ):
+        **kwargs: Any,
+    ) -> None:
         self.pool_size = pool_size
         self.active_connections = active_connections
 
-        # Technical details
-        technical_details = {
-            "pool_size": pool_size,
-            "active_connections": active_connections,
-        }
-
         # Recovery suggestions
-        recovery_suggestions = [
-            "Check connection pool configuration",
-            "Verify database server availability",
-            "Check for connection leaks",
-            "Consider increasing pool size if needed",
-            "Review connection timeout settings",
-        ]
+        recovery_suggestions: Sequence[str] = self._STATIC_SUGGESTIONS
 
         if pool_size and active_connections:
             if active_connections >= pool_size:
-                recovery_suggestions.append("Pool is exhausted - wait or increase size")
+                recovery_suggestions = [
+                    *recovery_suggestions,
+                    "Pool is exhausted - wait or increase size",
+                ]
 
         super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            **kwargs,
+            message=message, recovery_suggestions=recovery_suggestions, **kwargs
         )
+        self._details_record = self._Details(pool_size, active_connections)
 
 
 class DatabaseQueryError(DatabaseError):
     """Raised when database query operations fail."""
 
+    __slots__ = ("query",)
+
     default_error_code = "QUERY_ERROR"
     default_severity = ErrorSeverity.MEDIUM
     default_exit_code = 19
 
+    _STATIC_SUGGESTIONS = (
+        "Check SQL query syntax",
+        "Verify database permissions",
+        "Check database connection status",
+        "Review query parameters",
+    )
+
+    class _Details(NamedTuple):
+        query: Optional[str]
+        error_code: Optional[str]
+
     def __init__(
         self,
         message: str,
         query: Optional[str] = None,
         error_code: Optional[str] = None,
-        **kwargs,
-    ):
+        **kwargs: Any,
+    ) -> None:
         self.query = query
-        self.error_code = error_code
 
-        # Technical details
-        technical_details = {"query": query, "error_code": error_code}
+        # error_code is only reported in the technical details; the error
+        # itself keeps the class default code
+        super().__init__(message=message, **kwargs)
+        self._details_record = self._Details(query, error_code)
 
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Check SQL query syntax",
-            "Verify database permissions",
-            "Check database connection status",
-            "Review query parameters",
-        ]
-
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            **kwargs,
-        )
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build the static query suggestions."""
+        return list(self._STATIC_SUGGESTIONS)
 
 
 class DatabaseConfigurationError(DatabaseError):
     """Raised when database configuration is invalid."""
 
+    __slots__ = ("config_field", "config_value")
+
     default_error_code = "CONFIG_ERROR"
     default_severity = ErrorSeverity.HIGH
     default_exit_code = 20
 
+    _STATIC_SUGGESTIONS = (
+        "Check database configuration file",
+        "Verify configuration values are correct",
+        "Review environment variables",
+        "Check configuration file permissions",
+    )
+
+    class _Details(NamedTuple):
+        config_field: Optional[str]
+        config_value: Optional[str]
+
     def __init__(
         self,
         message: str,
         config_field: Optional[str] = None,
         config_value: Optional[str] = None,
-        **kwargs,
-    ):
+        **kwargs: Any,
+    ) -> None:
         self.config_field = config_field
         self.config_value = config_value
 
-        # Technical details
-        technical_details = {
-            "config_field": config_field,
-            "config_value": config_value,
-        }
+        super().__init__(message=message, **kwargs)
+        self._details_record = self._Details(config_field, config_value)
 
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Check database configuration file",
-            "Verify configuration values are correct",
-            "Review environment variables",
-            "Check configuration file permissions",
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build configuration suggestions from the stored field name."""
+        if not self.config_field:
+            return list(self._STATIC_SUGGESTIONS)
+        return [
+            *self._STATIC_SUGGESTIONS,
+            f"Verify '{self.config_field}' configuration",
         ]
 
-        if config_field:
-            recovery_suggestions.append(f"Verify '{config_field}' configuration")
-
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            **kwargs,
-        )
-
 
 class DatabasePermissionError(DatabaseError):
     """Raised when database permission checks fail."""
 
+    __slots__ = ("operation", "object_name")
+
     default_error_code = "PERMISSION_ERROR"
     default_severity = ErrorSeverity.HIGH
     default_exit_code = 21
 
+    _STATIC_SUGGESTIONS = (
+        "Check database user permissions",
+        "Verify role assignments",
+        "Contact database administrator",
+        "Review object-level permissions",
+    )
+
+    class _Details(NamedTuple):
+        operation: Optional[str]
+        object_name: Optional[str]
+
     def __init__(
         self,
         message: str,
         operation: Optional[str] = None,
         object_name: Optional[str] = None,
-        **kwargs,
-    ):
+        **kwargs: Any,
+    ) -> None:
         self.operation = operation
         self.object_name = object_name
 
-        # Technical details
-        technical_details = {"operation": operation, "object_name": object_name}
+        super().__init__(message=message, **kwargs)
+        self._details_record = self._Details(operation, object_name)
 
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Check database user permissions",
-            "Verify role assignments",
-            "Contact database administrator",
-            "Review object-level permissions",
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build permission suggestions from the stored operation."""
+        if not self.operation:
+            return list(self._STATIC_SUGGESTIONS)
+        return [
+            *self._STATIC_SUGGESTIONS,
+            f"Grant permissions for '{self.operation}' operation",
         ]
 
-        if operation:
-            recovery_suggestions.append(
-                f"Grant permissions for '{operation}' operation"
-            )
-
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-            **kwargs,
-        )
-
 
 class DatabaseHealthError(DatabaseError):
     """Raised when database health checks fail."""
 
+    __slots__ = ("health_status", "failed_checks")
+
     default_error_code = "HEALTH_ERROR"
     default_severity = ErrorSeverity.MEDIUM
     default_exit_code = 22
 
+    _STATIC_SUGGESTIONS = (
+        "Check database server status",
+        "Verify connection pool health",
+        "Review database resource utilization",
+        "Check database logs for errors",
+    )
+
     def __init__(
         self,
         message: str,
         health_status: Optional[str] = None,
         failed_checks: Optional[List[str]] = None,
-        **kwargs,
-    ):
+        **kwargs: Any,
+    ) -> None:
         self.health_status = health_status
         self.failed_checks = failed_checks or []
 
@@ -607,16 +690,13 @@ class DatabaseHealthError(DatabaseError):
         }
 
         # Recovery suggestions
-        recovery_suggestions = [
-            "Check database server status",
-            "Verify connection pool health",
-            "Review database resource utilization",
-            "Check database logs for errors",
-        ]
+        recovery_suggestions: Sequence[str] = self._STATIC_SUGGESTIONS
 
         if failed_checks:
-            for check in failed_checks:
-                recovery_suggestions.append(f"Address failed health check: {check}")
+            recovery_suggestions = [
+                *recovery_suggestions,
+                *(f"Address failed health check: {check}" for check in failed_checks),
+            ]
 
         super().__init__(
             message=message,
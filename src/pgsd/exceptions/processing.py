@@ -9,6 +9,8 @@ from .base import PGSDError, ErrorSeverity, ErrorCategory
 class ProcessingError(PGSDError):
     """Base class for processing-related errors."""
 
+    __slots__ = ()
+
     default_error_code = "PROCESSING_ERROR"
     default_severity = ErrorSeverity.MEDIUM
     default_category = ErrorCategory.PROCESSING
@@ -21,10 +23,28 @@ class ProcessingError(PGSDError):
 class SchemaParsingError(ProcessingError):
     """Raised when schema parsing fails."""
 
+    __slots__ = ()
+
     default_error_code = "SCHEMA_PARSING_FAILED"
     default_exit_code = 41
     retriable = False
 
+    _STATIC_SUGGESTIONS = (
+        "Check schema definition syntax and structure",
+        "Verify SQL dump format is valid and complete",
+        "Ensure schema was generated with compatible pg_dump version",
+    )
+    _MESSAGES = {
+        # Keyed on (line number given, source file given)
+        (True, True): (
+            "Failed to parse schema '{schema_name}' at line {line_number} "
+            "in {source_file}"
+        ),
+        (True, False): "Failed to parse schema '{schema_name}' at line {line_number}",
+        (False, True): "Failed to parse schema '{schema_name}' from {source_file}",
+        (False, False): "Failed to parse schema '{schema_name}'",
+    }
+
     def __init__(
         self,
         schema_name: str,
@@ -40,34 +60,28 @@ class SchemaParsingError(ProcessingError):
             line_number: Line number where error occurred (optional)
             source_file: Source file being parsed (optional)
         """
-        message = f"Failed to parse schema '{schema_name}'"
+        # Path.__str__ builds a new string on every call, so convert once
+        source_path = str(source_file) if source_file else None
 
-        if line_number and source_file:
-            message += f" at line {line_number} in {source_file}"
-        elif line_number:
-            message += f" at line {line_number}"
-        elif source_file:
-            message += f" from {source_file}"
+        message = self._MESSAGES[bool(line_number), bool(source_path)].format(
+            schema_name=schema_name, line_number=line_number, source_file=source_path
+        )
 
         # Technical details
         technical_details = {
             "schema_name": schema_name,
             "parsing_errors": parsing_errors,
             "line_number": line_number,
-            "source_file": str(source_file) if source_file else None,
+            "source_file": source_path,
             "error_count": len(parsing_errors),
         }
 
         # Recovery suggestions
-        recovery_suggestions = [
-            "Check schema definition syntax and structure",
-            "Verify SQL dump format is valid and complete",
-            "Ensure schema was generated with compatible pg_dump version",
-        ]
+        recovery_suggestions = list(self._STATIC_SUGGESTIONS)
 
-        if source_file:
+        if source_path:
             recovery_suggestions.append(
-                f"Review source file for syntax errors: {source_file}"
+                f"Review source file for syntax errors: {source_path}"
             )
 
         if line_number:
@@ -90,9 +104,28 @@ class SchemaParsingError(ProcessingError):
 class ComparisonError(ProcessingError):
     """Raised when schema comparison fails."""
 
+    __slots__ = ()
+
     default_error_code = "COMPARISON_FAILED"
     default_exit_code = 42
 
+    _STATIC_SUGGESTIONS = (
+        "Verify both schemas are valid and accessible",
+        "Check that schemas have compatible structures",
+        "Ensure sufficient memory for comparison operation",
+    )
+    _MESSAGES = {
+        # Keyed on whether error details were given
+        True: (
+            "Failed to compare schemas '{source_schema}' and '{target_schema}' "
+            "during {comparison_step}: {error_details}"
+        ),
+        False: (
+            "Failed to compare schemas '{source_schema}' and '{target_schema}' "
+            "during {comparison_step}"
+        ),
+    }
+
     def __init__(
         self,
         source_schema: str,
@@ -108,10 +141,12 @@ class ComparisonError(ProcessingError):
             comparison_step: Step where comparison failed
             error_details: Additional error details (optional)
         """
-        message = f"Failed to compare schemas '{source_schema}' and '{target_schema}' during {comparison_step}"
-
-        if error_details:
-            message += f": {error_details}"
+        message = self._MESSAGES[bool(error_details)].format(
+            source_schema=source_schema,
+            target_schema=target_schema,
+            comparison_step=comparison_step,
+            error_details=error_details,
+        )
 
         # Technical details
         technical_details = {
@@ -123,9 +158,7 @@ class ComparisonError(ProcessingError):
 
         # Recovery suggestions
         recovery_suggestions = [
-            "Verify both schemas are valid and accessible",
-            "Check that schemas have compatible structures",
-            "Ensure sufficient memory for comparison operation",
+            *self._STATIC_SUGGESTIONS,
             f"Review {comparison_step} logic and implementation",
         ]
 
@@ -151,9 +184,35 @@ class ComparisonError(ProcessingError):
 class ReportGenerationError(ProcessingError):
     """Raised when report generation fails."""
 
+    __slots__ = ()
+
     default_error_code = "REPORT_GENERATION_FAILED"
     default_exit_code = 43
 
+    _STATIC_SUGGESTIONS = (
+        "Check available disk space and write permissions",
+        "Ensure comparison data is complete and valid",
+    )
+    _MESSAGES = {
+        # Keyed on (generation step given, error details given)
+        (True, True): (
+            "Failed to generate {report_format} report during "
+            "{generation_step}: {error_details}"
+        ),
+        (True, False): (
+            "Failed to generate {report_format} report during "
+            "{generation_step}"
+        ),
+        (False, True): "Failed to generate {report_format} report: {error_details}",
+        (False, False): "Failed to generate {report_format} report",
+    }
+    _FORMAT_SUGGESTIONS = {
+        "html": "Verify HTML template syntax and CSS resources",
+        "json": "Check for circular references in comparison data",
+        "xml": "Verify XML schema and namespace definitions",
+        "markdown": "Check Markdown template syntax and formatting",
+    }
+
     def __init__(
         self,
         report_format: str,
@@ -169,18 +228,18 @@ class ReportGenerationError(ProcessingError):
             generation_step: Step where generation failed (optional)
             error_details: Additional error details (optional)
         """
-        message = f"Failed to generate {report_format} report"
-
-        if generation_step:
-            message += f" during {generation_step}"
+        message = self._MESSAGES[bool(generation_step), bool(error_details)].format(
+            report_format=report_format,
+            generation_step=generation_step,
+            error_details=error_details,
+        )
 
-        if error_details:
-            message += f": {error_details}"
+        output_str = str(output_path) if output_path else None
 
         # Technical details
         technical_details = {
             "report_format": report_format,
-            "output_path": str(output_path) if output_path else None,
+            "output_path": output_str,
             "generation_step": generation_step,
             "error_details": error_details,
         }
@@ -188,30 +247,19 @@ class ReportGenerationError(ProcessingError):
         # Recovery suggestions
         recovery_suggestions = [
             f"Verify {report_format} format template is valid",
-            "Check available disk space and write permissions",
-            "Ensure comparison data is complete and valid",
+            *self._STATIC_SUGGESTIONS,
         ]
 
         if output_path:
-            parent_dir = output_path.parent
-            recovery_suggestions.extend(
-                [
-                    f"Verify output directory exists: {parent_dir}",
-                    f"Check write permissions for: {output_path}",
-                ]
+            recovery_suggestions.append(
+                f"Verify output directory exists: {output_path.parent}"
             )
+            recovery_suggestions.append(f"Check write permissions for: {output_str}")
 
         # Add format-specific suggestions
-        if report_format.lower() == "html":
-            recovery_suggestions.append("Verify HTML template syntax and CSS resources")
-        elif report_format.lower() == "json":
-            recovery_suggestions.append(
-                "Check for circular references in comparison data"
-            )
-        elif report_format.lower() == "xml":
-            recovery_suggestions.append("Verify XML schema and namespace definitions")
-        elif report_format.lower() == "markdown":
-            recovery_suggestions.append("Check Markdown template syntax and formatting")
+        format_suggestion = self._FORMAT_SUGGESTIONS.get(report_format.lower())
+        if format_suggestion:
+            recovery_suggestions.append(format_suggestion)
 
         super().__init__(
             message=message,
@@ -1,6 +1,6 @@
 """Validation-related exception classes."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from .base import PGSDError, ErrorSeverity, ErrorCategory
 
@@ -8,6 +8,8 @@ from .base import PGSDError, ErrorSeverity, ErrorCategory
 class ValidationError(PGSDError):
     """Base class for validation-related errors."""
 
+    __slots__ = ()
+
     default_error_code = "VALIDATION_ERROR"
     default_severity = ErrorSeverity.MEDIUM
     default_category = ErrorCategory.VALIDATION
@@ -18,9 +20,27 @@ class ValidationError(PGSDError):
 class InvalidSchemaError(ValidationError):
     """Raised when schema structure is invalid or corrupted."""
 
+    __slots__ = ()
+
     default_error_code = "INVALID_SCHEMA"
     default_exit_code = 31
 
+    _STATIC_SUGGESTIONS = (
+        "Review schema structure and fix validation errors",
+        "Check for corrupted or incomplete schema definitions",
+        "Verify schema was properly migrated or created",
+    )
+
+    class _Details(NamedTuple):
+        schema_name: str
+        database: Optional[str]
+        validation_errors: Tuple[str, ...]
+
+    _details_record: _Details
+
+    _MSG = "Schema '%s' failed validation"
+    _MSG_WITH_DATABASE = "Schema '%s' in database '%s' failed validation"
+
     def __init__(
         self,
         schema_name: str,
@@ -34,57 +54,76 @@ class InvalidSchemaError(ValidationError):
             validation_errors: List of specific validation errors
             database: Database name (optional)
         """
+        super().__init__(message=None)
+
+        # Validators often raise and catch these while probing, so the
+        # message, details and suggestions are built from the raw arguments
+        # only when something reads them
         if database:
-            message = (
-                f"Schema '{schema_name}' in database '{database}' failed validation"
-            )
+            self._defer_message(self._MSG_WITH_DATABASE, (schema_name, database))
         else:
-            message = f"Schema '{schema_name}' failed validation"
-
-        # Technical details
-        technical_details = {
-            "schema_name": schema_name,
-            "database": database,
-            "validation_errors": validation_errors,
-            "error_count": len(validation_errors),
-        }
+            self._defer_message(self._MSG, (schema_name,))
+        # Snapshot the caller's list so later changes to it do not leak in
+        self._details_record = self._Details(
+            schema_name, database, tuple(validation_errors)
+        )
 
-        # Recovery suggestions
-        recovery_suggestions = [
-            "Review schema structure and fix validation errors",
-            "Check for corrupted or incomplete schema definitions",
-            "Verify schema was properly migrated or created",
-        ]
+    def _build_technical_details(self) -> Dict[str, Any]:
+        """Build schema details, including the number of validation errors."""
+        details = super()._build_technical_details()
+        details["validation_errors"] = list(details["validation_errors"])
+        details["error_count"] = len(details["validation_errors"])
+        return details
+
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build suggestions, adding hints matched in the validation errors."""
+        recovery_suggestions = list(self._STATIC_SUGGESTIONS)
+
+        # Lowercase each error once and stop as soon as every hint has matched
+        has_missing = has_constraint = has_reference = False
+        for error in self._details_record.validation_errors:
+            lowered = error.lower()
+            has_missing = has_missing or "missing" in lowered
+            has_constraint = has_constraint or "constraint" in lowered
+            has_reference = (
+                has_reference or "reference" in lowered or "foreign" in lowered
+            )
+            if has_missing and has_constraint and has_reference:
+                break
 
-        # Add specific suggestions based on validation errors
-        if any("missing" in error.lower() for error in validation_errors):
+        if has_missing:
             recovery_suggestions.append("Restore missing schema objects or constraints")
 
-        if any("constraint" in error.lower() for error in validation_errors):
+        if has_constraint:
             recovery_suggestions.append("Review and fix constraint definitions")
 
-        if any(
-            "reference" in error.lower() or "foreign" in error.lower()
-            for error in validation_errors
-        ):
+        if has_reference:
             recovery_suggestions.append(
                 "Check foreign key references and relationships"
             )
 
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-        )
+        return recovery_suggestions
 
 
 class UnsupportedFeatureError(ValidationError):
     """Raised when encountering unsupported PostgreSQL features."""
 
+    __slots__ = ("_workaround_suggestion",)
+
     default_error_code = "UNSUPPORTED_FEATURE"
     default_severity = ErrorSeverity.LOW
     default_exit_code = 32
 
+    class _Details(NamedTuple):
+        feature_name: str
+        feature_type: str
+        min_supported_version: Optional[str]
+
+    _details_record: _Details
+
+    _MSG = "Unsupported %s: '%s'"
+    _MSG_WITH_VERSION = "Unsupported %s: '%s' (requires PostgreSQL %s or higher)"
+
     def __init__(
         self,
         feature_name: str,
@@ -100,38 +139,39 @@ class UnsupportedFeatureError(ValidationError):
             min_supported_version: Minimum version that supports this feature (optional)
             workaround_suggestion: Suggested workaround (optional)
         """
-        message = f"Unsupported {feature_type}: '{feature_name}'"
+        super().__init__(message=None)
 
         if min_supported_version:
-            message += f" (requires PostgreSQL {min_supported_version} or higher)"
-
-        # Technical details
-        technical_details = {
-            "feature_name": feature_name,
-            "feature_type": feature_type,
-            "min_supported_version": min_supported_version,
-        }
+            self._defer_message(
+                self._MSG_WITH_VERSION,
+                (feature_type, feature_name, min_supported_version),
+            )
+        else:
+            self._defer_message(self._MSG, (feature_type, feature_name))
+        self._details_record = self._Details(
+            feature_name, feature_type, min_supported_version
+        )
+        self._workaround_suggestion = workaround_suggestion
 
-        # Recovery suggestions
+    def _build_recovery_suggestions(self) -> List[str]:
+        """Build suggestions for the feature type, version and workaround."""
+        record = self._details_record
         recovery_suggestions = [
-            f"Consider alternative implementations for {feature_type}",
+            f"Consider alternative implementations for {record.feature_type}",
             "Review PostgreSQL version compatibility requirements",
         ]
 
-        if min_supported_version:
+        if record.min_supported_version:
             recovery_suggestions.append(
-                f"Upgrade PostgreSQL to version {min_supported_version} or higher"
+                f"Upgrade PostgreSQL to version {record.min_supported_version} "
+                f"or higher"
             )
 
-        if workaround_suggestion:
-            recovery_suggestions.append(f"Workaround: {workaround_suggestion}")
+        if self._workaround_suggestion:
+            recovery_suggestions.append(f"Workaround: {self._workaround_suggestion}")
         else:
             recovery_suggestions.append(
                 "Check documentation for alternative approaches"
             )
 
-        super().__init__(
-            message=message,
-            technical_details=technical_details,
-            recovery_suggestions=recovery_suggestions,
-        )
+        return recovery_suggestions
@@ -5,40 +5,51 @@ all PGSD components including CLI, configuration, logging, and error handling.
 """
 
 import sys
-import logging
-import signal
-import atexit
-from typing import Optional, List
-from pathlib import Path
+from typing import Any, Callable, Dict, Optional, List
 
-from .cli.main import CLIManager
-from .utils.log_config import get_default_config
-from .exceptions.base import PGSDError
-from .exceptions.config import ConfigurationError
-from . import __version__
+# Everything else (CLI, exceptions, logging, signal handling) is imported
+# where it is used, so importing this module for the entry point stays cheap
 
 
-# Global state for cleanup
-_cleanup_callbacks = []
+def __getattr__(name):
+    """Import CLIManager on first access instead of at module import."""
+    if name == "CLIManager":
+        from .cli.main import CLIManager
+
+        globals()["CLIManager"] = CLIManager
+        return CLIManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Global state for cleanup; an insertion-ordered dict doubles as an ordered set
+_cleanup_callbacks: Dict[Callable[[], Any], None] = {}
 
 
 def register_cleanup(callback):
     """Register cleanup callback."""
-    if callback not in _cleanup_callbacks:
-        _cleanup_callbacks.append(callback)
+    _cleanup_callbacks[callback] = None
 
 
 def cleanup():
-    """Execute all cleanup callbacks."""
-    for callback in _cleanup_callbacks:
-        try:
-            callback()
-        except Exception as e:
+    """Execute all cleanup callbacks.
+
+    Callbacks are removed from the registry before they run, so each one runs
+    at most once even though cleanup is reached from the signal handler,
+    ``main``'s ``finally`` block and ``atexit``; later calls are no-ops.
+    """
+    # Drain in batches so callbacks registered while running still get called
+    while _cleanup_callbacks:
+        callbacks = list(_cleanup_callbacks)
+        _cleanup_callbacks.clear()
+        for callback in callbacks:
             try:
-                print(f"Warning: Cleanup error: {e}", file=sys.stderr)
-            except Exception:
-                # If stderr write fails, silently continue
-                pass
+                callback()
+            except Exception as e:
+                try:
+                    print(f"Warning: Cleanup error: {e}", file=sys.stderr)
+                except Exception:
+                    # If stderr write fails, silently continue
+                    pass
 
 
 def signal_handler(signum, frame):
@@ -59,8 +70,10 @@ def signal_handler(signum, frame):
 def setup_signal_handlers():
     """Setup signal handlers for graceful shutdown."""
     try:
-        # Signal handlers only work in main thread
+        import signal
         import threading
+
+        # Signal handlers only work in main thread
         if threading.current_thread() is threading.main_thread():
             signal.signal(signal.SIGINT, signal_handler)
             signal.signal(signal.SIGTERM, signal_handler)
@@ -71,6 +84,9 @@ def setup_signal_handlers():
 
 def setup_application():
     """Setup application environment."""
+    import atexit
+    import logging
+
     # Register cleanup to run on exit
     try:
         atexit.register(cleanup)
@@ -85,9 +101,7 @@ def setup_application():
     
     # Setup basic logging (CLI will configure detailed logging)
     try:
-        log_config = get_default_config()
-        log_config.level = "WARNING"
-        logging.basicConfig(level=getattr(logging, log_config.level))
+        logging.basicConfig(level=logging.WARNING)
     except Exception:
         pass  # Continue if logging setup fails
 
@@ -104,12 +118,24 @@ def main(args: Optional[List[str]] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    # "pgsd --version" needs none of the CLI wiring; argparse would print the
+    # same line and stop as soon as it reached the flag
+    if (args if args is not None else sys.argv[1:])[:1] == ["--version"]:
+        from . import __version__
+
+        print(f"pgsd {__version__}")
+        return 0
+
+    from .exceptions.base import PGSDError
+    from .exceptions.config import ConfigurationError
+
     try:
         # Setup application environment
         setup_application()
         
-        # Initialize and run CLI
-        cli_manager = CLIManager()
+        # Initialize and run CLI (looked up on the module so it is imported
+        # lazily and can still be replaced)
+        cli_manager = sys.modules[__name__].CLIManager()
         exit_code = cli_manager.run(args)
         
         return exit_code
@@ -8,6 +8,7 @@ Components:
 - ConnectionPool: Database connection pooling
 - PostgreSQLVersion: Version information model
 - DatabasePermissions: Permission checking model
+- VerificationResult: Combined connection verification result
 - ConnectionInfo: Connection configuration model
 - PoolHealth: Connection pool health monitoring
 - SchemaInfo: Schema information data model
@@ -44,6 +45,7 @@ from .database import (
     ConnectionStatus,
     PostgreSQLVersion,
     DatabasePermissions,
+    VerificationResult,
     ConnectionInfo,
     PoolHealth,
 )
@@ -71,6 +73,7 @@ __all__ = [
     "ConnectionStatus",
     "PostgreSQLVersion",
     "DatabasePermissions",
+    "VerificationResult",
     "ConnectionInfo",
     "PoolHealth",
     # Schema models
@@ -1,11 +1,73 @@
 """Database models for PGSD application."""
 
-from dataclasses import dataclass
-from typing import Dict, Optional, List, Any
+import re
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 from enum import Enum
 from datetime import datetime
 
 
+# Leading "major.minor[.patch]" of a server version string
+_PG_VERSION_RE = re.compile(r"(\d+)\.(\d+)(?:\.(\d+))?")
+
+_T = TypeVar("_T")
+
+
+def _frozen_getstate(self: Any) -> Tuple[Any, ...]:
+    """Return field values for pickling a frozen slotted dataclass."""
+    return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def _frozen_setstate(self: Any, state: Tuple[Any, ...]) -> None:
+    """Restore field values, bypassing the frozen ``__setattr__``."""
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
+
+
+def _with_slots(cls: Type[_T]) -> Type[_T]:
+    """Rebuild a dataclass with ``__slots__`` for its fields.
+
+    Equivalent to ``dataclass(slots=True)``, which needs Python 3.10. Models
+    are created per connection and per health poll, so dropping the instance
+    ``__dict__`` saves memory and speeds up attribute reads.
+
+    Unlike ``dataclass(slots=True)`` on Python 3.12+, the ``__class__`` cell
+    of methods is not rebound to the rebuilt class, so decorated classes must
+    not use zero-argument ``super()`` or ``__class__``.
+    """
+    dataclass_cls: Any = cls
+    field_names = tuple(f.name for f in fields(dataclass_cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    # Field defaults live in the generated __init__; as class attributes they
+    # would clash with the slot descriptors
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted: Any = type(dataclass_cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    if dataclass_cls.__dataclass_params__.frozen:
+        # The default slot pickling restores state through __setattr__
+        slotted.__getstate__ = _frozen_getstate
+        slotted.__setstate__ = _frozen_setstate
+    return cast(Type[_T], slotted)
+
+
 class DatabaseType(Enum):
     """Database type enumeration."""
 
@@ -21,32 +83,44 @@ class ConnectionStatus(Enum):
     CONNECTING = "connecting"
 
 
-@dataclass
+@_with_slots
+@dataclass(frozen=True, order=True)
 class PostgreSQLVersion:
-    """PostgreSQL version information."""
+    """PostgreSQL version information.
+
+    Instances are immutable, so ``parse`` can hand out cached ones. Equality,
+    ordering and hashing use ``server_version_num`` only.
+    """
 
-    major: int
-    minor: int
-    patch: int
-    full_version: str
+    major: int = field(compare=False)
+    minor: int = field(compare=False)
+    patch: int = field(compare=False)
+    full_version: str = field(compare=False)
     server_version_num: int
 
     @classmethod
     def parse(cls, version_string: str) -> "PostgreSQLVersion":
         """Parse version string to PostgreSQLVersion.
 
+        Results are memoized per version string.
+
         Args:
             version_string: Version string like "14.5" or "PostgreSQL 14.5"
 
         Returns:
             PostgreSQLVersion instance
         """
+        # mypy does not accept class objects as Hashable cache keys
+        return _parse_version(cast(Hashable, cls), version_string)
+
+    @classmethod
+    def _parse_uncached(cls, version_string: str) -> "PostgreSQLVersion":
+        """Parse a version string without consulting the cache."""
         # Remove "PostgreSQL" prefix if present and extract version number
-        clean_version = version_string.replace("PostgreSQL", "").strip()
-        
+        clean_version = version_string.strip().removeprefix("PostgreSQL").strip()
+
         # Extract version number before any additional info (e.g., "(Ubuntu ...")
-        import re
-        version_match = re.match(r'(\d+)\.(\d+)(?:\.(\d+))?', clean_version)
+        version_match = _PG_VERSION_RE.match(clean_version)
         if not version_match:
             raise ValueError(f"Unable to parse PostgreSQL version from: {version_string}")
         
@@ -78,40 +152,28 @@ class PostgreSQLVersion:
         Returns:
             True if compatible, False otherwise
         """
-        min_ver = self.parse(min_version)
-        return self.server_version_num >= min_ver.server_version_num
-
-    def __eq__(self, other) -> bool:
-        """Equality comparison."""
-        if not isinstance(other, PostgreSQLVersion):
-            return False
-        return self.server_version_num == other.server_version_num
-
-    def __lt__(self, other) -> bool:
-        """Less than comparison."""
-        if not isinstance(other, PostgreSQLVersion):
-            return NotImplemented
-        return self.server_version_num < other.server_version_num
-
-    def __le__(self, other) -> bool:
-        """Less than or equal comparison."""
-        if not isinstance(other, PostgreSQLVersion):
-            return NotImplemented
-        return self.server_version_num <= other.server_version_num
-
-    def __gt__(self, other) -> bool:
-        """Greater than comparison."""
-        if not isinstance(other, PostgreSQLVersion):
-            return NotImplemented
-        return self.server_version_num > other.server_version_num
-
-    def __ge__(self, other) -> bool:
-        """Greater than or equal comparison."""
-        if not isinstance(other, PostgreSQLVersion):
-            return NotImplemented
-        return self.server_version_num >= other.server_version_num
+        return self.server_version_num >= self.parse(min_version).server_version_num
+
+
+@lru_cache(maxsize=256)
+def _parse_version(
+    cls: Type[PostgreSQLVersion], version_string: str
+) -> PostgreSQLVersion:
+    """Memoized ``PostgreSQLVersion.parse`` keyed on class and input string."""
+    return cls._parse_uncached(version_string)
+
 
+# Required permission flags and the privilege reported when one is missing
+_REQUIRED_PERMISSIONS = (
+    ("can_connect", "CONNECT"),
+    ("can_read_schema", "USAGE on schema"),
+    ("can_read_tables", "SELECT on tables"),
+    ("can_read_views", "SELECT on views"),
+    ("can_read_constraints", "SELECT on constraints"),
+)
 
+
+@_with_slots
 @dataclass
 class DatabasePermissions:
     """Database permissions information."""
@@ -137,13 +199,7 @@ class DatabasePermissions:
         Returns:
             True if all required permissions are available
         """
-        return (
-            self.can_connect
-            and self.can_read_schema
-            and self.can_read_tables
-            and self.can_read_views
-            and self.can_read_constraints
-        )
+        return all(getattr(self, attr) for attr, _ in _REQUIRED_PERMISSIONS)
 
     def get_missing_permissions(self) -> List[str]:
         """Get list of missing permissions.
@@ -151,21 +207,52 @@ class DatabasePermissions:
         Returns:
             List of missing permission names
         """
-        missing = []
-        if not self.can_connect:
-            missing.append("CONNECT")
-        if not self.can_read_schema:
-            missing.append("USAGE on schema")
-        if not self.can_read_tables:
-            missing.append("SELECT on tables")
-        if not self.can_read_views:
-            missing.append("SELECT on views")
-        if not self.can_read_constraints:
-            missing.append("SELECT on constraints")
+        return [
+            label for attr, label in _REQUIRED_PERMISSIONS if not getattr(self, attr)
+        ]
+
+
+@_with_slots
+@dataclass
+class VerificationResult:
+    """Combined liveness, version and permission check result."""
+
+    alive: bool
+    version: Optional[PostgreSQLVersion] = None
+    permissions: Optional[DatabasePermissions] = None
+    error_message: Optional[str] = None
+
 
-        return missing
+@lru_cache(maxsize=4)
+def _endpoint_fields(
+    database_name: str, host: str, port: int, username: str, schema: str
+) -> Mapping[str, Any]:
+    """Build the static endpoint part of a serialized ConnectionInfo.
+
+    Pool endpoints rarely change, so the same read-only mapping is shared by
+    every connection pointing at one database.
+    """
+    return MappingProxyType(
+        {
+            "database_name": database_name,
+            "host": host,
+            "port": port,
+            "username": username,
+            "schema": schema,
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _connection_string(
+    database_name: str, host: str, port: int, username: str, mask_password: bool
+) -> str:
+    """Build the display connection string once per endpoint and masking mode."""
+    password_display = "***" if mask_password else "<password>"
+    return f"postgresql://{username}:{password_display}@{host}:{port}/{database_name}"
 
 
+@_with_slots
 @dataclass
 class ConnectionInfo:
     """Connection information and metadata."""
@@ -205,8 +292,9 @@ class ConnectionInfo:
         Returns:
             Connection string
         """
-        password_display = "***" if mask_password else "<password>"
-        return f"postgresql://{self.username}:{password_display}@{self.host}:{self.port}/{self.database_name}"
+        return _connection_string(
+            self.database_name, self.host, self.port, self.username, mask_password
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation.
@@ -216,11 +304,9 @@ class ConnectionInfo:
         """
         return {
             "connection_id": self.connection_id,
-            "database_name": self.database_name,
-            "host": self.host,
-            "port": self.port,
-            "username": self.username,
-            "schema": self.schema,
+            **_endpoint_fields(
+                self.database_name, self.host, self.port, self.username, self.schema
+            ),
             "status": self.status.value,
             "version": str(self.version) if self.version else None,
             "permissions": {
@@ -246,9 +332,14 @@ class ConnectionInfo:
         }
 
 
-@dataclass
+@_with_slots
+@dataclass(frozen=True)
 class PoolHealth:
-    """Connection pool health information."""
+    """Connection pool health information.
+
+    Snapshots are immutable, so the utilization percentage is computed once
+    when the snapshot is created.
+    """
 
     total_connections: int
     active_connections: int
@@ -258,6 +349,15 @@ class PoolHealth:
     failed_connections: int
     average_connection_time: float
     last_health_check: datetime
+    _utilization: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the utilization percentage for this snapshot."""
+        if self.max_connections == 0:
+            utilization = 0.0
+        else:
+            utilization = (self.active_connections / self.max_connections) * 100
+        object.__setattr__(self, "_utilization", utilization)
 
     def utilization_percentage(self) -> float:
         """Calculate pool utilization percentage.
@@ -265,9 +365,7 @@ class PoolHealth:
         Returns:
             Utilization percentage (0-100)
         """
-        if self.max_connections == 0:
-            return 0.0
-        return (self.active_connections / self.max_connections) * 100
+        return self._utilization
 
     def is_healthy(self) -> bool:
         """Check if pool is healthy.
@@ -278,7 +376,7 @@ class PoolHealth:
         return (
             self.failed_connections == 0
             and self.healthy_connections == self.total_connections
-            and self.utilization_percentage() < 90  # Not overloaded
+            and self._utilization < 90  # Not overloaded
         )
 
     def get_status_summary(self) -> str:
@@ -291,7 +389,7 @@ class PoolHealth:
             return f"Healthy ({self.active_connections}/{self.max_connections} active)"
         elif self.failed_connections > 0:
             return f"Unhealthy ({self.failed_connections} failed connections)"
-        elif self.utilization_percentage() >= 90:
-            return f"Overloaded ({self.utilization_percentage():.1f}% utilization)"
+        elif self._utilization >= 90:
+            return f"Overloaded ({self._utilization:.1f}% utilization)"
         else:
             return f"Degraded ({self.healthy_connections}/{self.total_connections} healthy)"
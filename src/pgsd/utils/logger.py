@@ -110,6 +110,15 @@ class PGSDLogger:
 _logger_registry: Dict[str, PGSDLogger] = {}
 _is_configured = False
 
+# Level names accepted by LogConfig and their standard library values
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 def get_logger(name: str) -> PGSDLogger:
     """Get logger instance for the given name.
@@ -169,8 +178,9 @@ def setup_logging(config: Optional[LogConfig] = None) -> None:
     )
 
     # Configure standard library logging
+    level = _LEVELS[config.level.upper()]
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, config.level.upper()))
+    root_logger.setLevel(level)
 
     # Clear existing handlers
     root_logger.handlers.clear()
@@ -189,7 +199,7 @@ def setup_logging(config: Optional[LogConfig] = None) -> None:
     # Console handler
     if config.console_output:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, config.level.upper()))
+        console_handler.setLevel(level)
         if formatter:
             console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
@@ -203,7 +213,7 @@ def setup_logging(config: Optional[LogConfig] = None) -> None:
             backupCount=config.backup_count,
             encoding="utf-8",
         )
-        file_handler.setLevel(getattr(logging, config.level.upper()))
+        file_handler.setLevel(level)
         if formatter:
             file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
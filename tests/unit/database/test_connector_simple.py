@@ -186,6 +186,55 @@ class TestDatabaseConnector:
                 assert version == mock_version
                 assert connector._version_info == mock_version
 
+    @pytest.mark.asyncio
+    async def test_verify_all_success(self):
+        """Test combined verification in a single query."""
+        config = self.create_test_config()
+        mock_connection = self.create_mock_connection()
+
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.fetchall.return_value = [{
+            "version": "PostgreSQL 15.4 on x86_64",
+            "can_connect": True,
+            "can_read_schema": True,
+            "can_read_tables": True,
+            "can_read_views": True,
+            "can_read_constraints": True,
+            "accessible_schemas": ["public"],
+        }]
+
+        with patch('pgsd.database.connector.psycopg2', Mock()):
+            connector = DatabaseConnector(mock_connection, config)
+
+            result = await connector.verify_all()
+
+            assert result.alive is True
+            assert result.version.major == 15
+            assert result.permissions.has_required_permissions()
+            assert result.permissions.accessible_schemas == ["public"]
+            assert connector._version_info is result.version
+            assert connector._permissions is result.permissions
+            # SET statement_timeout + the combined query only
+            assert mock_cursor.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_all_failure(self):
+        """Test combined verification when the query fails."""
+        config = self.create_test_config()
+        mock_connection = self.create_mock_connection()
+
+        with patch('pgsd.database.connector.psycopg2', Mock()):
+            connector = DatabaseConnector(mock_connection, config)
+
+            with patch.object(
+                connector, 'execute_query', side_effect=Exception("down")
+            ):
+                result = await connector.verify_all()
+
+            assert result.alive is False
+            assert result.error_message == "down"
+            assert connector._connection_info.status == ConnectionStatus.ERROR
+
     @pytest.mark.asyncio
     async def test_get_version_cached(self):
         """Test getting cached version."""
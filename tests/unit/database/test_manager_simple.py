@@ -0,0 +1,226 @@
+"""Simple tests for database manager."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from pgsd.config.schema import DatabaseConfig, PGSDConfiguration
+from pgsd.database.manager import DatabaseManager
+from pgsd.exceptions.database import DatabaseManagerError
+from pgsd.models.database import (
+    PostgreSQLVersion,
+    DatabasePermissions,
+    VerificationResult,
+)
+
+
+class TestDatabaseManager:
+    """Test cases for DatabaseManager class."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create an initialized manager backed by mock pools."""
+        config = PGSDConfiguration(
+            source_db=DatabaseConfig(
+                host="source", database="source_db", username="user"
+            ),
+            target_db=DatabaseConfig(
+                host="target", database="target_db", username="user"
+            ),
+        )
+        manager = DatabaseManager(config)
+        manager._initialized = True
+        manager.source_pool = Mock()
+        manager.target_pool = Mock()
+        return manager
+
+    def create_connector(self, healthy=True):
+        """Create mock connector."""
+        connector = Mock()
+        connector.test_connection = AsyncMock(return_value=healthy)
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_verify_connections(self, manager):
+        """Test verification of both connections."""
+        manager.source_pool.get_connection.return_value = self.create_connector()
+        manager.target_pool.get_connection.return_value = self.create_connector(
+            healthy=False
+        )
+
+        result = await manager.verify_connections()
+
+        assert result == {"source": True, "target": False}
+        manager.source_pool.return_connection.assert_called_once()
+        manager.target_pool.return_connection.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_verify_connections_error(self, manager):
+        """Test verification when a pool raises."""
+        manager.source_pool.get_connection.side_effect = Exception("boom")
+        manager.target_pool.get_connection.return_value = self.create_connector()
+
+        result = await manager.verify_connections()
+
+        assert result == {"source": False, "target": True}
+
+    @pytest.mark.asyncio
+    async def test_verify_connections_cached(self, manager):
+        """Test repeated verification reuses the cached result."""
+        manager.source_pool.get_connection.return_value = self.create_connector()
+        manager.target_pool.get_connection.return_value = self.create_connector()
+
+        await manager.verify_connections()
+        await manager.verify_connections()
+
+        assert manager.source_pool.get_connection.call_count == 1
+
+        await manager.verify_connections(use_cache=False)
+
+        assert manager.source_pool.get_connection.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_connections_not_initialized(self, manager):
+        """Test verification before initialization."""
+        manager._initialized = False
+
+        result = await manager.verify_connections()
+
+        assert result == {"source": False, "target": False}
+
+    @pytest.mark.asyncio
+    async def test_acquire_source_returns_on_error(self, manager):
+        """Test acquired connection is returned even when the body raises."""
+        connector = self.create_connector()
+        manager.source_pool.get_connection.return_value = connector
+
+        with pytest.raises(RuntimeError):
+            async with manager.acquire_source() as conn:
+                assert conn is connector
+                raise RuntimeError("query failed")
+
+        manager.source_pool.return_connection.assert_called_once_with(connector)
+
+    def create_verified_connector(self, version="PostgreSQL 15.4"):
+        """Create mock connector that passes initial verification."""
+        connector = self.create_connector()
+        connector.verify_all = AsyncMock(
+            return_value=VerificationResult(
+                alive=True,
+                version=PostgreSQLVersion.parse(version),
+                permissions=DatabasePermissions(
+                    can_connect=True,
+                    can_read_schema=True,
+                    can_read_tables=True,
+                    can_read_views=True,
+                    can_read_constraints=True,
+                ),
+            )
+        )
+        return connector
+
+    @pytest.mark.asyncio
+    async def test_initialize_and_close(self, manager):
+        """Test pools are created lazily and close_all drops them."""
+        manager._initialized = False
+        manager.pools.clear()
+
+        connector = self.create_verified_connector()
+
+        with patch("pgsd.database.manager.ConnectionPool") as mock_pool_class:
+            mock_pool_class.return_value.get_connection.return_value = connector
+            await manager.initialize()
+
+            assert manager._initialized
+            assert manager.pools == {}
+
+            conn = await manager.get_source_connection()
+
+        assert conn is connector
+        assert set(manager.pools) == {"source"}
+        assert manager.target_pool is None
+        assert mock_pool_class.call_count == 1
+
+        pool = manager.source_pool
+        await manager.close_all()
+        await manager.close_all()
+
+        assert manager.pools == {}
+        assert manager.source_pool is None
+        assert not manager._initialized
+        pool.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_lazy_pool_version_too_old(self, manager):
+        """Test pool is discarded when its database version is unsupported."""
+        manager.pools.clear()
+
+        connector = self.create_verified_connector("PostgreSQL 12.1")
+
+        with patch("pgsd.database.manager.ConnectionPool") as mock_pool_class:
+            mock_pool_class.return_value.get_connection.return_value = connector
+            with pytest.raises(DatabaseManagerError, match="below minimum") as exc_info:
+                await manager.get_source_connection()
+
+        assert str(exc_info.value).startswith("Source database verification failed")
+        assert manager.pools == {}
+        mock_pool_class.return_value.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_lazy_pool_discarded_when_closed_during_verification(self, manager):
+        """Test a pool verified after close_all() is closed, not stored."""
+        manager._initialized = False
+        manager.pools.clear()
+        await manager.initialize()
+
+        verifying = asyncio.Event()
+        release = asyncio.Event()
+        connector = self.create_verified_connector()
+        verified = connector.verify_all.return_value
+
+        async def slow_verify():
+            verifying.set()
+            await release.wait()
+            return verified
+
+        connector.verify_all = AsyncMock(side_effect=slow_verify)
+
+        with patch("pgsd.database.manager.ConnectionPool") as mock_pool_class:
+            mock_pool_class.return_value.get_connection.return_value = connector
+            task = asyncio.ensure_future(manager.get_source_connection())
+            await verifying.wait()
+            await manager.close_all()
+            release.set()
+
+            with pytest.raises(DatabaseManagerError, match="closed"):
+                await task
+
+        assert manager.pools == {}
+        mock_pool_class.return_value.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_initialize(self, manager):
+        """Test concurrent initialize calls only initialize once."""
+        manager._initialized = False
+
+        await asyncio.gather(manager.initialize(), manager.initialize())
+
+        assert manager._initialized
+        assert manager._finalizer is not None
+
+    @pytest.mark.asyncio
+    async def test_get_statistics_single_borrow_per_pool(self, manager):
+        """Test statistics borrow one connection per database."""
+        version = PostgreSQLVersion.parse("PostgreSQL 15.4")
+        for pool in (manager.source_pool, manager.target_pool):
+            connector = self.create_connector()
+            connector.get_version = AsyncMock(return_value=version)
+            pool.get_connection.return_value = connector
+            pool.get_statistics.return_value = {}
+
+        stats = await manager.get_statistics()
+
+        assert stats["connections"] == {"source": True, "target": True}
+        assert stats["versions"] == {"source": version, "target": version}
+        assert manager.source_pool.get_connection.call_count == 1
+        assert manager.target_pool.get_connection.call_count == 1
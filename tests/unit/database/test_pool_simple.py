@@ -6,6 +6,7 @@ import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, MagicMock
 
+from pgsd.database import pool as pool_module
 from pgsd.database.pool import PooledConnection, ConnectionPool
 from pgsd.config.schema import DatabaseConfig
 from pgsd.exceptions.database import DatabasePoolError
@@ -28,42 +29,24 @@ class TestPooledConnection:
         assert pooled_conn.in_use is False
         assert pooled_conn.is_healthy is True
         assert pooled_conn.use_count == 0
-        assert pooled_conn.lock is not None
 
-    @patch('pgsd.database.pool.datetime')
-    def test_mark_used(self, mock_datetime):
+    def test_mark_used(self):
         """Test marking connection as used."""
         mock_connection = Mock()
-        created_at = datetime(2023, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
-        used_at = datetime(2023, 1, 1, 10, 5, 0, tzinfo=timezone.utc)
-        
-        mock_datetime.now.return_value = used_at
-        
-        pooled_conn = PooledConnection(mock_connection, created_at)
+        created_at = datetime.now(timezone.utc)
+
+        with patch('pgsd.database.pool._monotonic', return_value=1000.0):
+            pooled_conn = PooledConnection(mock_connection, created_at)
         initial_count = pooled_conn.use_count
-        
-        pooled_conn.mark_used()
-        
-        assert pooled_conn.last_used == used_at
-        assert pooled_conn.use_count == initial_count + 1
 
-    def test_mark_used_thread_safety(self):
-        """Test thread safety of mark_used method."""
-        mock_connection = Mock()
-        pooled_conn = PooledConnection(mock_connection, datetime.now(timezone.utc))
-        
-        def increment_use_count():
-            for _ in range(100):
-                pooled_conn.mark_used()
-        
-        threads = [threading.Thread(target=increment_use_count) for _ in range(10)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-        
-        # Should have been called 1000 times (10 threads * 100 calls each)
-        assert pooled_conn.use_count == 1000
+        with patch('pgsd.database.pool._monotonic', return_value=1300.0):
+            pooled_conn.mark_used()
+
+        assert pooled_conn.last_used_mono == 1300.0
+        assert abs(
+            (pooled_conn.last_used - pooled_conn.created_at).total_seconds() - 300
+        ) < 1
+        assert pooled_conn.use_count == initial_count + 1
 
     def test_is_expired(self):
         """Test checking if connection is expired."""
@@ -92,6 +75,50 @@ class TestPooledConnection:
         # Should not be idle if idle timeout is 40 minutes
         assert pooled_conn.is_idle_too_long(idle_timeout=40 * 60) is False
 
+    def test_ping_idle_connection(self):
+        """Test ping accepts an idle connection without querying."""
+        mock_connection = MagicMock(closed=0)
+        mock_connection.info.transaction_status = 0
+
+        pooled_conn = PooledConnection(mock_connection, datetime.now(timezone.utc))
+
+        with patch('pgsd.database.pool.psycopg2') as mock_psycopg2:
+            mock_psycopg2.extensions.TRANSACTION_STATUS_IDLE = 0
+            assert pooled_conn.ping() is True
+
+        mock_connection.cursor.assert_not_called()
+        mock_connection.rollback.assert_not_called()
+
+    def test_ping_rolls_back_open_transaction(self):
+        """Test ping rolls back a transaction left open by a borrower."""
+        mock_connection = MagicMock(closed=0)
+        mock_connection.info.transaction_status = 2
+
+        pooled_conn = PooledConnection(mock_connection, datetime.now(timezone.utc))
+
+        with patch('pgsd.database.pool.psycopg2') as mock_psycopg2:
+            mock_psycopg2.extensions.TRANSACTION_STATUS_IDLE = 0
+            assert pooled_conn.ping() is True
+
+        mock_connection.rollback.assert_called_once()
+
+    def test_ping_closed_or_broken(self):
+        """Test ping rejects closed connections and failed rollbacks."""
+        closed = PooledConnection(MagicMock(closed=1), datetime.now(timezone.utc))
+        assert closed.ping() is False
+        assert closed.is_healthy is False
+
+        broken_connection = MagicMock(closed=0)
+        broken_connection.info.transaction_status = 3
+        broken_connection.rollback.side_effect = Exception("connection lost")
+        broken = PooledConnection(broken_connection, datetime.now(timezone.utc))
+
+        with patch('pgsd.database.pool.psycopg2') as mock_psycopg2:
+            mock_psycopg2.extensions.TRANSACTION_STATUS_IDLE = 0
+            assert broken.ping() is False
+
+        assert broken.is_healthy is False
+
     def test_close(self):
         """Test closing pooled connection."""
         mock_connection = Mock()
@@ -153,7 +180,7 @@ class TestConnectionPool:
         assert pool.min_connections == 1
         assert pool.max_connections == 5
         assert pool._pool is not None
-        assert pool._all_connections == []
+        assert pool._all_connections == set()
         assert pool._lock is not None
 
     def test_init_no_psycopg2(self):
@@ -164,6 +191,18 @@ class TestConnectionPool:
             with pytest.raises(ImportError, match="psycopg2 is required"):
                 ConnectionPool(config)
 
+    def test_psycopg2_loaded_on_first_pool(self):
+        """Test psycopg2 is imported lazily by the first pool."""
+        real_psycopg2 = pytest.importorskip("psycopg2")
+        config = self.create_test_config()
+
+        with patch('pgsd.database.pool.psycopg2', pool_module._NOT_LOADED):
+            with patch.object(ConnectionPool, '_start_warm_up_thread'):
+                pool = ConnectionPool(config)
+
+            assert pool_module.psycopg2 is real_psycopg2
+            pool.close()
+
     def test_init_custom_params(self):
         """Test ConnectionPool initialization with custom parameters."""
         config = self.create_test_config()
@@ -193,10 +232,13 @@ class TestConnectionPool:
         
         with patch('pgsd.database.pool.psycopg2', Mock()):
             pool = ConnectionPool(config)
+            pool._warm_up_thread.join(timeout=5)
             
-            # Test pool creation
+            # Test pool creation; min_connections are opened up front
             assert pool.db_config == config
-            assert len(pool._all_connections) == 0
+            assert len(pool._all_connections) == 1
+            assert len(pool._pool) == 1
+            assert pool._created_count == 1
 
     @patch('pgsd.database.pool.ConnectionFactory')
     def test_get_connection_from_pool(self, mock_factory_class):
@@ -265,6 +307,162 @@ class TestConnectionPool:
             pool = ConnectionPool(config)
             assert pool is not None
 
+    @patch('pgsd.database.pool.ConnectionFactory')
+    def test_return_connection_by_identity(self, mock_factory_class):
+        """Test returned connection is found by identity and re-queued."""
+        config = self.create_test_config()
+
+        mock_factory = Mock()
+        mock_factory_class.return_value = mock_factory
+        mock_factory.create_connection.side_effect = [
+            MagicMock(closed=0), MagicMock(closed=0)
+        ]
+
+        with patch('pgsd.database.pool.psycopg2', Mock()):
+            pool = ConnectionPool(config, min_connections=0)
+            first = pool.get_connection()
+            second = pool.get_connection()
+
+            pool.return_connection(second)
+
+            pooled = pool._by_conn_id[id(second.connection)]
+            assert pooled.connection is second.connection
+            assert pooled.in_use is False
+            assert len(pool._pool) == 1
+            assert pool._by_conn_id[id(first.connection)].in_use is True
+
+    @patch('pgsd.database.pool.ConnectionFactory')
+    def test_get_connection_skips_recent_validation(self, mock_factory_class):
+        """Test recently returned connections are reused without a probe."""
+        config = self.create_test_config()
+
+        mock_factory = Mock()
+        mock_factory_class.return_value = mock_factory
+        mock_factory.create_connection.return_value = MagicMock(closed=0)
+
+        with patch('pgsd.database.pool.psycopg2', Mock()):
+            pool = ConnectionPool(config, min_connections=0)
+            pool.return_connection(pool.get_connection())
+
+            pooled = next(iter(pool._by_conn_id.values()))
+            with patch.object(pooled, 'test_health') as mock_test_health:
+                conn = pool.get_connection()
+
+            mock_test_health.assert_not_called()
+            assert conn.connection is pooled.connection
+            assert mock_factory.create_connection.call_count == 1
+
+    @patch('pgsd.database.pool.ConnectionFactory')
+    def test_get_connection_replaces_stale_unhealthy(self, mock_factory_class):
+        """Test long-idle unhealthy connections are replaced on borrow."""
+        config = self.create_test_config()
+
+        mock_factory = Mock()
+        mock_factory_class.return_value = mock_factory
+        mock_factory.create_connection.side_effect = [
+            MagicMock(closed=0), MagicMock(closed=0)
+        ]
+
+        with patch('pgsd.database.pool.psycopg2', Mock()):
+            pool = ConnectionPool(config, min_connections=0)
+            pool.return_connection(pool.get_connection())
+
+            stale = next(iter(pool._by_conn_id.values()))
+            stale.last_used = datetime.now(timezone.utc) - timedelta(minutes=5)
+            with patch.object(stale, 'test_health', return_value=False):
+                conn = pool.get_connection()
+
+            assert conn.connection is not stale.connection
+            assert mock_factory.create_connection.call_count == 2
+
+    @patch('pgsd.database.pool.ConnectionFactory')
+    def test_get_connection_exhausted_timeout(self, mock_factory_class):
+        """Test timeout when every connection is checked out."""
+        config = self.create_test_config()
+
+        mock_factory = Mock()
+        mock_factory_class.return_value = mock_factory
+        mock_factory.create_connection.return_value = MagicMock(closed=0)
+
+        with patch('pgsd.database.pool.psycopg2', Mock()):
+            pool = ConnectionPool(config, max_connections=1, min_connections=0)
+            pool.get_connection()
+
+            with pytest.raises(DatabasePoolError, match="timeout"):
+                pool.get_connection(timeout=0.05)
+
+    @patch('pgsd.database.pool.ConnectionFactory')
+    def test_get_connection_woken_by_return(self, mock_factory_class):
+        """Test a blocked borrower is handed the next returned connection."""
+        config = self.create_test_config()
+
+        mock_factory = Mock()
+        mock_factory_class.return_value = mock_factory
+        mock_factory.create_connection.return_value = MagicMock(closed=0)
+
+        with patch('pgsd.database.pool.psycopg2', Mock()):
+            pool = ConnectionPool(config, max_connections=1, min_connections=0)
+            held = pool.get_connection()
+
+            timer = threading.Timer(0.05, pool.return_connection, args=(held,))
+            timer.start()
+            try:
+                conn = pool.get_connection(timeout=5)
+            finally:
+                timer.join()
+
+            assert conn.connection is held.connection
+            assert mock_factory.create_connection.call_count == 1
+
+    @patch('pgsd.database.pool.ConnectionFactory')
+    def test_warm_up_failure_releases_slot(self, mock_factory_class):
+        """Test a failed pre-warm leaves the pool usable."""
+        config = self.create_test_config()
+
+        mock_factory = Mock()
+        mock_factory_class.return_value = mock_factory
+        mock_factory.create_connection.side_effect = [
+            Exception("refused"), MagicMock(closed=0)
+        ]
+
+        with patch('pgsd.database.pool.psycopg2', Mock()):
+            pool = ConnectionPool(config)
+            pool._warm_up_thread.join(timeout=5)
+
+            assert pool._created_count == 0
+            assert pool.get_connection() is not None
+            assert pool._created_count == 1
+
+    @pytest.mark.parametrize("connect_fails", [False, True])
+    @patch('pgsd.database.pool.ConnectionFactory')
+    def test_close_during_warm_up_keeps_count_at_zero(
+        self, mock_factory_class, connect_fails
+    ):
+        """Test a warm-up finishing after close() does not release its slot."""
+        config = self.create_test_config()
+        connecting = threading.Event()
+        closed = threading.Event()
+
+        def create_connection(_config):
+            connecting.set()
+            closed.wait(5)
+            if connect_fails:
+                raise Exception("refused")
+            return MagicMock(closed=0)
+
+        mock_factory = Mock()
+        mock_factory_class.return_value = mock_factory
+        mock_factory.create_connection.side_effect = create_connection
+
+        with patch('pgsd.database.pool.psycopg2', Mock()):
+            pool = ConnectionPool(config)
+            assert connecting.wait(5)
+            pool.close()
+            closed.set()
+            pool._warm_up_thread.join(timeout=5)
+
+            assert pool._created_count == 0
+
     @patch('pgsd.database.pool.ConnectionFactory')
     def test_close_pool(self, mock_factory_class):
         """Test closing connection pool."""
@@ -276,24 +474,92 @@ class TestConnectionPool:
         # Create mock connections
         mock_connections = []
         for _ in range(3):
-            mock_conn = Mock()
+            mock_conn = MagicMock()
             mock_conn.closed = 0
             mock_connections.append(mock_conn)
         
         mock_factory.create_connection.side_effect = mock_connections
         
         with patch('pgsd.database.pool.psycopg2', Mock()):
-            pool = ConnectionPool(config)
+            pool = ConnectionPool(config, min_connections=0)
             assert pool is not None
 
+            held = pool.get_connection()
+            returned = pool.get_connection()
+            pool.return_connection(returned)
+
+            started = time.monotonic()
+            pool.close()
+
+            # The health check thread is woken rather than waited out
+            assert time.monotonic() - started < 1
+            assert not pool._health_check_thread.is_alive()
+            assert len(pool._pool) == 0
+            assert pool._all_connections == set()
+            assert pool._created_count == 0
+            mock_connections[0].close.assert_called_once()
+            mock_connections[1].close.assert_called_once()
+
+    @patch('pgsd.database.pool.ConnectionFactory')
+    def test_del_does_not_take_lock(self, mock_factory_class):
+        """Test the finalizer only flags shutdown."""
+        config = self.create_test_config()
+
+        mock_factory = Mock()
+        mock_factory_class.return_value = mock_factory
+        mock_connection = MagicMock(closed=0)
+        mock_factory.create_connection.return_value = mock_connection
+
+        with patch('pgsd.database.pool.psycopg2', Mock()):
+            pool = ConnectionPool(config, min_connections=0)
+            held = pool.get_connection()
+
+            # Would deadlock if __del__ still went through close()
+            with pool._lock:
+                pool.__del__()
+
+            assert pool._shutdown is True
+            assert len(pool._all_connections) == 1
+            mock_connection.close.assert_not_called()
+            assert held.connection is mock_connection
+
     def test_get_health(self):
         """Test getting pool health information."""
         config = self.create_test_config()
         
         with patch('pgsd.database.pool.psycopg2', Mock()):
-            pool = ConnectionPool(config)
+            pool = ConnectionPool(config, min_connections=0)
             assert pool is not None
 
+            healthy = PooledConnection(Mock(), datetime.now(timezone.utc))
+            healthy.in_use = True
+            failed = PooledConnection(Mock(), datetime.now(timezone.utc))
+            pool._all_connections.update([healthy, failed])
+            pool._stats["total_created"] = 2
+
+            lock_held = []
+
+            def probe(result):
+                def test_health():
+                    lock_held.append(pool._lock.locked())
+                    return result
+                return test_health
+
+            healthy.test_health = probe(True)
+            failed.test_health = probe(False)
+
+            health = pool.health_check()
+
+            # Probes run outside the pool lock
+            assert lock_held == [False, False]
+            assert isinstance(health, PoolHealth)
+            assert health.total_connections == 2
+            assert health.active_connections == 1
+            assert health.healthy_connections == 1
+            assert health.failed_connections == 1
+            assert pool._stats["total_health_checks"] == 1
+            assert pool._stats["total_health_failures"] == 1
+
     @patch('pgsd.database.pool.ConnectionFactory')
     def test_cleanup_idle_connections(self, mock_factory_class):
         """Test cleaning up idle connections."""
@@ -301,11 +567,26 @@ class TestConnectionPool:
         
         mock_factory = Mock()
         mock_factory_class.return_value = mock_factory
+        mock_factory.create_connection.side_effect = [
+            MagicMock(closed=0), MagicMock(closed=0)
+        ]
         
         with patch('pgsd.database.pool.psycopg2', Mock()):
-            pool = ConnectionPool(config)
+            pool = ConnectionPool(config, min_connections=0)
             assert pool is not None
 
+            busy = pool.get_connection()
+            pool.return_connection(pool.get_connection())
+            idle = next(
+                conn for conn in pool._all_connections if not conn.in_use
+            )
+            idle.last_used = datetime.now(timezone.utc) - timedelta(hours=1)
+
+            assert pool.cleanup_stale_connections() == 1
+            assert idle not in pool._all_connections
+            assert pool._created_count == 1
+            assert pool._by_conn_id[id(busy.connection)].in_use is True
+
     def test_is_healthy(self):
         """Test checking pool health status."""
         config = self.create_test_config()
@@ -319,5 +600,20 @@ class TestConnectionPool:
         config = self.create_test_config()
         
         with patch('pgsd.database.pool.psycopg2', Mock()):
-            pool = ConnectionPool(config)
-            assert pool is not None
\ No newline at end of file
+            pool = ConnectionPool(config, min_connections=0)
+            assert pool is not None
+
+            active = PooledConnection(Mock(), datetime.now(timezone.utc))
+            active.in_use = True
+            idle = PooledConnection(Mock(), datetime.now(timezone.utc))
+            pool._all_connections.update([active, idle])
+            pool._pool.append(idle)
+
+            # Statistics must not wait on the pool lock
+            with pool._lock:
+                stats = pool.get_statistics()
+
+            assert stats["current_connections"] == 2
+            assert stats["active_connections"] == 1
+            assert stats["pool_utilization"] == 40.0
+            assert stats["total_created"] == 0
\ No newline at end of file
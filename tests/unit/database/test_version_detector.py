@@ -2,7 +2,7 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
 
 from src.pgsd.database.version_detector import VersionDetector
@@ -170,6 +170,129 @@ class TestVersionDetector:
         ):
             await version_detector.detect_versions()
 
+    @pytest.mark.asyncio
+    async def test_detect_versions_concurrent(
+        self,
+        version_detector,
+        mock_database_manager,
+        mock_source_connector,
+        mock_target_connector,
+    ):
+        """Test source and target versions are queried concurrently."""
+        started = []
+        both_started = asyncio.Event()
+
+        def slow_version(name, version):
+            async def get_version():
+                started.append(name)
+                if len(started) == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                return PostgreSQLVersion.parse(version)
+
+            return get_version
+
+        mock_source_connector.get_version = slow_version("source", "14.5")
+        mock_target_connector.get_version = slow_version("target", "13.8")
+        mock_database_manager.get_source_connection = AsyncMock(
+            return_value=mock_source_connector
+        )
+        mock_database_manager.get_target_connection = AsyncMock(
+            return_value=mock_target_connector
+        )
+        mock_database_manager.return_source_connection = Mock()
+        mock_database_manager.return_target_connection = Mock()
+
+        versions = await version_detector.detect_versions()
+
+        assert sorted(started) == ["source", "target"]
+        assert str(versions["source"]) == "14.5.0"
+        assert str(versions["target"]) == "13.8.0"
+
+    @pytest.mark.asyncio
+    async def test_detect_versions_returns_connection_on_failure(
+        self, version_detector, mock_database_manager, mock_target_connector
+    ):
+        """Test a failed version query still returns its connection."""
+        failing_connector = Mock(spec=DatabaseConnector)
+        failing_connector.get_version = AsyncMock(side_effect=Exception("boom"))
+        mock_database_manager.get_source_connection = AsyncMock(
+            return_value=failing_connector
+        )
+        mock_database_manager.get_target_connection = AsyncMock(
+            return_value=mock_target_connector
+        )
+        mock_database_manager.return_source_connection = Mock()
+        mock_database_manager.return_target_connection = Mock()
+
+        with pytest.raises(
+            DatabaseVersionError, match="Source database version detection failed"
+        ):
+            await version_detector.detect_versions()
+
+        mock_database_manager.return_source_connection.assert_called_once_with(
+            failing_connector
+        )
+        mock_database_manager.return_target_connection.assert_called_once_with(
+            mock_target_connector
+        )
+
+    @pytest.mark.asyncio
+    async def test_detect_versions_single_flight(
+        self,
+        version_detector,
+        mock_database_manager,
+        mock_source_connector,
+        mock_target_connector,
+    ):
+        """Test concurrent callers share a single detection."""
+        mock_database_manager.get_source_connection = AsyncMock(
+            return_value=mock_source_connector
+        )
+        mock_database_manager.get_target_connection = AsyncMock(
+            return_value=mock_target_connector
+        )
+        mock_database_manager.return_source_connection = Mock()
+        mock_database_manager.return_target_connection = Mock()
+
+        results = await asyncio.gather(
+            *(version_detector.detect_versions() for _ in range(5))
+        )
+
+        assert all(str(r["source"]) == "14.5.0" for r in results)
+        assert mock_database_manager.get_source_connection.call_count == 1
+        assert mock_database_manager.get_target_connection.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_detect_versions_cache_expires(
+        self,
+        version_detector,
+        mock_database_manager,
+        mock_source_connector,
+        mock_target_connector,
+    ):
+        """Test cached versions expire after the TTL on the monotonic clock."""
+        mock_database_manager.get_source_connection = AsyncMock(
+            return_value=mock_source_connector
+        )
+        mock_database_manager.get_target_connection = AsyncMock(
+            return_value=mock_target_connector
+        )
+        mock_database_manager.return_source_connection = Mock()
+        mock_database_manager.return_target_connection = Mock()
+
+        with patch("src.pgsd.database.version_detector.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            await version_detector.detect_versions()
+
+            clock.return_value = 1000.0 + version_detector._cache_ttl - 1
+            await version_detector.detect_versions()
+            assert mock_database_manager.get_source_connection.call_count == 1
+
+            clock.return_value = 1000.0 + version_detector._cache_ttl + 1
+            await version_detector.detect_versions()
+            assert mock_database_manager.get_source_connection.call_count == 2
+
     @pytest.mark.asyncio
     async def test_check_compatibility_supported_versions(self, version_detector):
         """Test compatibility check with supported versions."""
@@ -187,6 +310,46 @@ class TestVersionDetector:
         assert "version_comparison" in compatibility
         assert "feature_differences" in compatibility
 
+    @pytest.mark.asyncio
+    async def test_check_compatibility_dedup_keeps_order(self, version_detector):
+        """Test duplicate warnings are dropped in first-seen order."""
+        version = PostgreSQLVersion.parse("12.5")
+
+        compatibility = await version_detector.check_compatibility(version, version)
+
+        manager = version_detector.version_manager
+        assert compatibility["warnings"] == (
+            manager.check_version_compatibility(version)["warnings"]
+        )
+        assert compatibility["recommendations"] == (
+            manager.get_version_recommendations(version)
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_compatibility_feature_difference_details(self, version_detector):
+        """Test feature differences list each differing source feature."""
+        compatibility = await version_detector.check_compatibility(
+            PostgreSQLVersion.parse("15.2"), PostgreSQLVersion.parse("13.8")
+        )
+
+        assert compatibility["feature_differences"] == [
+            {
+                "feature": "incremental_sorting",
+                "source_support": True,
+                "target_support": False,
+            },
+            {
+                "feature": "multirange_types",
+                "source_support": True,
+                "target_support": False,
+            },
+            {
+                "feature": "merge_command",
+                "source_support": True,
+                "target_support": False,
+            },
+        ]
+
     @pytest.mark.asyncio
     async def test_check_compatibility_unsupported_version(self, version_detector):
         """Test compatibility check with unsupported version."""
@@ -263,6 +426,87 @@ class TestVersionDetector:
         assert "version" in report["version_details"]["source"]
         assert "features" in report["version_details"]["source"]
 
+        # Changelog runs from the older target up to the newer source
+        assert report["version_changelog"][0] == "Added incremental sorting support"
+
+    @pytest.mark.asyncio
+    async def test_get_version_report_reuses_compatibility_lookups(
+        self,
+        version_detector,
+        mock_database_manager,
+        mock_source_connector,
+        mock_target_connector,
+    ):
+        """Test report details come from the compatibility check's lookups."""
+        mock_database_manager.get_source_connection = AsyncMock(
+            return_value=mock_source_connector
+        )
+        mock_database_manager.get_target_connection = AsyncMock(
+            return_value=mock_target_connector
+        )
+        mock_database_manager.return_source_connection = Mock()
+        mock_database_manager.return_target_connection = Mock()
+        mock_database_manager.get_connection_info = AsyncMock(
+            return_value={"source": None, "target": None}
+        )
+
+        manager = version_detector.version_manager
+        with patch.object(
+            manager, "get_feature_support", wraps=manager.get_feature_support
+        ) as feature_support:
+            report = await version_detector.get_version_report()
+
+        # Only compare_versions looks features up; the details reuse them
+        assert feature_support.call_count == 2
+        target = report["version_details"]["target"]
+        assert target["version"] == "13.8.0"
+        assert target["is_supported"] is True
+        assert target["features"]["multirange_types"] is False
+        assert target["recommendations"] == manager.get_version_recommendations(
+            PostgreSQLVersion.parse("13.8")
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_version_report_cached(
+        self,
+        version_detector,
+        mock_database_manager,
+        mock_source_connector,
+        mock_target_connector,
+    ):
+        """Test the report is reused until the version cache is cleared."""
+        mock_database_manager.get_source_connection = AsyncMock(
+            return_value=mock_source_connector
+        )
+        mock_database_manager.get_target_connection = AsyncMock(
+            return_value=mock_target_connector
+        )
+        mock_database_manager.return_source_connection = Mock()
+        mock_database_manager.return_target_connection = Mock()
+        mock_database_manager.get_connection_info = AsyncMock(
+            return_value={"source": None, "target": None}
+        )
+
+        first = await version_detector.get_version_report()
+        first["extra"] = "caller change"
+        first["compatibility"]["warnings"].append("caller warning")
+        first["version_details"]["source"]["features"]["multirange_types"] = False
+        with patch("src.pgsd.database.version_detector.datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value = datetime(2030, 1, 1)
+            second = await version_detector.get_version_report()
+
+        assert "extra" not in second
+        assert "caller warning" not in second["compatibility"]["warnings"]
+        assert second["version_details"]["source"]["features"]["multirange_types"]
+        assert second["report_timestamp"] == "2030-01-01T00:00:00"
+        assert first["report_timestamp"] != second["report_timestamp"]
+        assert mock_database_manager.get_connection_info.call_count == 1
+
+        version_detector.clear_cache()
+        await version_detector.get_version_report()
+
+        assert mock_database_manager.get_connection_info.call_count == 2
+
     @pytest.mark.asyncio
     async def test_validate_operation_support(
         self,
@@ -383,6 +627,15 @@ class TestVersionDetector:
         assert stats["cache_age_seconds"] >= 0
         assert len(stats["detection_results"]) > 0
 
+        # Age is measured on the monotonic clock, immune to wall-clock jumps
+        with patch(
+            "time.monotonic",
+            return_value=version_detector._last_detection_mono + 12.5,
+        ):
+            stats = version_detector.get_detection_statistics()
+
+        assert stats["cache_age_seconds"] == 12.5
+
 
 class TestVersionDetectorIntegration:
     """Integration tests for VersionDetector."""
@@ -0,0 +1,168 @@
+"""Simple tests for PostgreSQL version management."""
+
+import pytest
+
+from pgsd.database.version import VersionManager
+from pgsd.models.database import PostgreSQLVersion
+
+
+class TestVersionManager:
+    """Test cases for VersionManager class."""
+
+    @pytest.mark.parametrize(
+        "version_string, multirange, merge",
+        [
+            ("14.0", True, None),  # Exact match
+            ("13.7", False, None),  # Major version match
+            ("16.2", True, True),  # Closest lower version
+        ],
+    )
+    def test_get_feature_support(self, version_string, multirange, merge):
+        """Test feature lookup resolves to the closest known version."""
+        manager = VersionManager()
+
+        features = manager.get_feature_support(PostgreSQLVersion.parse(version_string))
+
+        assert features["multirange_types"] is multirange
+        assert features.get("merge_command") is merge
+
+    def test_get_feature_support_below_known_versions(self):
+        """Test versions older than the table get the minimal feature set."""
+        manager = VersionManager()
+
+        features = manager.get_feature_support(PostgreSQLVersion.parse("12.4"))
+
+        assert not any(features.values())
+        assert "merge_command" not in features
+
+    def test_get_feature_support_is_cached(self):
+        """Test repeated lookups for one major/minor resolve only once."""
+        manager = VersionManager()
+
+        manager.get_feature_support(PostgreSQLVersion.parse("15.1"))
+        manager.get_feature_support(PostgreSQLVersion.parse("15.1"))
+        manager.get_feature_support(PostgreSQLVersion.parse("15.4"))
+
+        info = manager._cached_feature_support.cache_info()
+        assert info.misses == 2
+        assert info.hits == 1
+
+    def test_get_feature_support_is_read_only(self):
+        """Test lookups share one immutable mapping instead of copying."""
+        manager = VersionManager()
+        version = PostgreSQLVersion.parse("14.2")
+
+        features = manager.get_feature_support(version)
+
+        assert manager.get_feature_support(version) is features
+        with pytest.raises(TypeError):
+            features["multirange_types"] = False
+
+    def test_check_version_compatibility_features_are_plain_dict(self):
+        """Test compatibility results stay mutable and serialisable."""
+        manager = VersionManager()
+
+        result = manager.check_version_compatibility(PostgreSQLVersion.parse("15.3"))
+
+        assert type(result["features"]) is dict
+        assert result["features"]["merge_command"] is True
+
+    def test_compare_versions(self):
+        """Test comparing versions across a major release."""
+        manager = VersionManager()
+
+        comparison = manager.compare_versions(
+            PostgreSQLVersion.parse("13.4.2"), PostgreSQLVersion.parse("15.1.0")
+        )
+
+        assert comparison["are_equal"] is False
+        assert comparison["version1_newer"] is False
+        assert comparison["version2_newer"] is True
+        assert comparison["major_version_diff"] is True
+        assert comparison["minor_version_diff"] is True
+        assert comparison["patch_version_diff"] is True
+        assert comparison["feature_differences"] == [
+            "incremental_sorting",
+            "multirange_types",
+        ]
+
+    def test_compare_versions_same_minor_skips_features(self):
+        """Test patch-only differences never look up feature support."""
+        manager = VersionManager()
+
+        comparison = manager.compare_versions(
+            PostgreSQLVersion.parse("14.2.1"), PostgreSQLVersion.parse("14.2.3")
+        )
+
+        assert comparison["version2_newer"] is True
+        assert comparison["patch_version_diff"] is True
+        assert comparison["compatibility_concerns"] == []
+        assert comparison["feature_differences"] == []
+        assert manager._cached_feature_support.cache_info().misses == 0
+
+    def test_get_version_recommendations_is_cached(self):
+        """Test recommendations are built once and returned as fresh lists."""
+        manager = VersionManager()
+        version = PostgreSQLVersion.parse("13.2")
+
+        first = manager.get_version_recommendations(version)
+        first.append("caller change")
+        second = manager.get_version_recommendations(version)
+
+        assert "caller change" not in second
+        assert any("multirange" in rec for rec in second)
+        assert manager._cached_recommendations.cache_info().hits == 1
+
+    def test_get_version_changelog(self):
+        """Test changelog across major versions."""
+        manager = VersionManager()
+
+        changelog = manager.get_version_changelog(
+            PostgreSQLVersion.parse("13.1"), PostgreSQLVersion.parse("15.3")
+        )
+
+        assert changelog[0] == "Added incremental sorting support"
+        assert "Added MERGE command support" in changelog
+        assert changelog[-1] == "Bug fixes and performance improvements"
+        assert manager.get_version_changelog(
+            PostgreSQLVersion.parse("15.3"), PostgreSQLVersion.parse("13.1")
+        ) == []
+
+    @pytest.mark.parametrize(
+        "version_string, operation, expected",
+        [
+            ("12.9", "table_info", False),
+            ("13.0", "table_info", True),
+            ("12.9", "partitioned_table_info", False),
+            ("13.4", "generated_column_info", True),
+            ("13.4", "multirange_type_info", False),
+            ("14.1", "multirange_type_info", True),
+            ("14.9", "merge_command_info", False),
+            ("16.0", "merge_command_info", True),
+            ("13.0", "unknown_operation", True),
+        ],
+    )
+    def test_validate_version_for_operation(self, version_string, operation, expected):
+        """Test operation gating by version capability."""
+        manager = VersionManager()
+
+        version = PostgreSQLVersion.parse(version_string)
+
+        assert manager.validate_version_for_operation(version, operation) is expected
+
+    def test_check_version_compatibility_is_cached(self):
+        """Test compatibility is built once per version and copied out."""
+        manager = VersionManager()
+        version = PostgreSQLVersion.parse("13.2.1")
+
+        first = manager.check_version_compatibility(version)
+        first["warnings"].append("caller change")
+        second = manager.check_version_compatibility(version)
+
+        assert second["is_supported"] is True
+        assert second["is_recommended"] is False
+        assert "caller change" not in second["warnings"]
+        assert second["warnings"][0] == (
+            "Version 13.2.1 is below recommended version 14.0.0"
+        )
+        assert manager._cached_compatibility.cache_info().hits == 1
@@ -0,0 +1,30 @@
+"""Simple tests for exit codes."""
+
+import pytest
+
+from pgsd.error_handling.exit_codes import ExitCode
+from pgsd.exceptions.base import PGSDError
+
+
+class TestExitCode:
+    """Test cases for ExitCode class."""
+
+    @pytest.mark.parametrize(
+        "exception, expected",
+        [
+            (KeyboardInterrupt(), ExitCode.KEYBOARD_INTERRUPT),
+            (MemoryError(), ExitCode.INSUFFICIENT_MEMORY),
+            (FileNotFoundError("missing"), ExitCode.SYSTEM_ERROR),
+            (ValueError("bad"), ExitCode.GENERAL_ERROR),
+        ],
+    )
+    def test_get_exit_code_for_exception(self, exception, expected):
+        """Test exit codes for non-PGSD exceptions."""
+        assert ExitCode.get_exit_code_for_exception(exception) == expected
+
+    def test_get_exit_code_for_pgsd_error(self):
+        """Test PGSD errors supply their own exit code."""
+        error = PGSDError("failed")
+        error.exit_code = ExitCode.DATABASE_ERROR
+
+        assert ExitCode.get_exit_code_for_exception(error) == ExitCode.DATABASE_ERROR
@@ -3,6 +3,7 @@
 import pytest
 import time
 import asyncio
+from dataclasses import FrozenInstanceError
 from unittest.mock import Mock, patch, AsyncMock
 
 from pgsd.error_handling.retry import (
@@ -67,6 +68,13 @@ class TestRetryConfig:
         with pytest.raises(ValueError, match="backoff_factor must be >= 1"):
             RetryConfig(backoff_factor=0.5)
 
+    def test_config_is_immutable(self):
+        """Test RetryConfig cannot be changed after construction."""
+        config = RetryConfig()
+
+        with pytest.raises(FrozenInstanceError):
+            config.max_attempts = 5
+
 
 class TestRetryManager:
     """Test cases for RetryManager class."""
@@ -100,18 +108,34 @@ class TestRetryManager:
         
         assert delay == 10.0
 
-    @patch('random.uniform')
-    def test_calculate_delay_with_jitter(self, mock_uniform):
+    @patch('random.random')
+    def test_calculate_delay_with_jitter(self, mock_random):
         """Test delay calculation with jitter."""
-        mock_uniform.return_value = 1.0  # Full jitter range
+        mock_random.return_value = 0.5  # Middle of the jitter range
         config = RetryConfig(base_delay=1.0, backoff_factor=2.0, jitter=True, jitter_range=(0.5, 1.5))
         manager = RetryManager(config)
         
         delay = manager.calculate_delay(2)
         
-        # Base delay would be 2.0, with jitter factor of 1.0 (mock)
+        # Base delay would be 2.0, with jitter factor of 1.0 (0.5 + 1.0 * 0.5)
         assert delay == 2.0  # 2.0 * 1.0
-        mock_uniform.assert_called_once_with(0.5, 1.5)
+        mock_random.assert_called_once_with()
+
+    def test_calculate_delay_uses_precomputed_schedule(self):
+        """Test the backoff schedule is built once from the configuration."""
+        config = RetryConfig(
+            max_attempts=4, base_delay=1.0, backoff_factor=3.0, max_delay=5.0, jitter=False
+        )
+        manager = RetryManager(config)
+
+        assert config._base_delays == (1.0, 3.0, 5.0, 5.0)
+        assert [manager.calculate_delay(attempt) for attempt in range(1, 6)] == [
+            1.0,
+            3.0,
+            5.0,
+            5.0,
+            5.0,
+        ]
 
     def test_should_retry_max_attempts(self):
         """Test should_retry with max attempts exceeded."""
@@ -136,6 +160,16 @@ class TestRetryManager:
         assert manager.should_retry(retriable_error, 1) is True
         assert manager.should_retry(non_retriable_error, 1) is False
 
+    def test_should_retry_default_exceptions(self):
+        """Test the default PGSDError-only config rejects other exceptions."""
+        manager = RetryManager(RetryConfig())
+
+        error = PGSDError("Test error")
+        error.retriable = True
+
+        assert manager.should_retry(error, 1) is True
+        assert manager.should_retry(ValueError("Invalid value"), 1) is False
+
 
 class TestRetryOnError:
     """Test cases for retry_on_error decorator."""
@@ -153,6 +187,21 @@ class TestRetryOnError:
         assert result == "success"
         assert mock_func.call_count == 1
 
+    def test_manager_built_once_per_decorated_function(self):
+        """Test the retry manager is shared across calls."""
+        with patch(
+            "pgsd.error_handling.retry.RetryManager", wraps=RetryManager
+        ) as manager_cls:
+
+            @retry_on_error()
+            def test_func():
+                return "success"
+
+            test_func()
+            test_func()
+
+        assert manager_cls.call_count == 1
+
     def test_retry_on_exception(self):
         """Test retry on exception."""
         mock_func = Mock(side_effect=[Exception("error"), "success"])
@@ -270,6 +319,30 @@ class TestRetryOnError:
         assert result == "success"
         assert mock_func.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_execute_with_retry_async_failure_then_success(self):
+        """Test execute_with_retry_async with failure then success."""
+        before_retry = Mock()
+        config = RetryConfig(
+            max_attempts=2,
+            base_delay=0.5,
+            jitter=False,
+            retriable_exceptions=(ValueError,),
+            before_retry=before_retry,
+        )
+        manager = RetryManager(config)
+
+        mock_func = AsyncMock(side_effect=[ValueError("error"), "success"])
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await manager.execute_with_retry_async(mock_func, "arg1")
+
+        assert result == "success"
+        assert mock_func.call_count == 2
+        mock_func.assert_called_with("arg1")
+        mock_sleep.assert_awaited_once_with(0.5)
+        before_retry.assert_called_once()
+
 
 class TestAsyncRetryOnError:
     """Test cases for async_retry_on_error decorator."""
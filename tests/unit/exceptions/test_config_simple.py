@@ -0,0 +1,60 @@
+"""Simple tests for configuration-related exceptions."""
+
+from pathlib import Path
+
+from pgsd.exceptions.config import (
+    InvalidConfigurationError,
+    MissingConfigurationError,
+)
+
+
+class TestInvalidConfigurationError:
+    """Test cases for InvalidConfigurationError class."""
+
+    def test_recovery_suggestions(self):
+        """Test suggestions with and without a configuration file."""
+        error = InvalidConfigurationError("port", "abc", "integer")
+        with_file = InvalidConfigurationError(
+            "port", "abc", "integer", config_file=Path("pgsd.yaml")
+        )
+
+        assert error.recovery_suggestions == [
+            "Update 'port' to a valid value: integer",
+            "Check configuration file syntax and structure",
+            "Refer to documentation for valid configuration options",
+        ]
+        assert with_file.recovery_suggestions[-1] == (
+            "Edit configuration file: pgsd.yaml"
+        )
+
+
+class TestMissingConfigurationError:
+    """Test cases for MissingConfigurationError class."""
+
+    def test_recovery_suggestions_without_file(self):
+        """Test suggestions when no configuration file is involved."""
+        error = MissingConfigurationError(["host"], config_section="database")
+
+        assert error.recovery_suggestions == [
+            "Add missing configuration keys: host",
+            "Check configuration file completeness",
+            "Create a configuration file with required settings",
+            "Ensure section '[database]' exists in configuration",
+        ]
+
+    def test_recovery_suggestions_with_file(self, tmp_path):
+        """Test suggestions distinguish existing and missing files."""
+        existing = tmp_path / "pgsd.yaml"
+        existing.write_text("database: {}\n")
+        missing = tmp_path / "missing.yaml"
+
+        edit = MissingConfigurationError(["host", "port"], config_file=existing)
+        create = MissingConfigurationError(["host"], config_file=missing)
+
+        assert edit.recovery_suggestions[2] == (
+            f"Edit existing configuration file: {existing}"
+        )
+        assert create.recovery_suggestions[2] == (
+            f"Create configuration file: {missing}"
+        )
+        assert len(edit.recovery_suggestions) == 3
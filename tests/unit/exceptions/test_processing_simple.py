@@ -137,6 +137,23 @@ class TestReportGenerationError:
         assert "Failed to generate html report" in error_message
         assert error.error_code == "REPORT_GENERATION_FAILED"
 
+    @pytest.mark.parametrize(
+        "generation_step, error_details, expected",
+        [
+            (None, None, "Failed to generate html report"),
+            ("render", None, "Failed to generate html report during render"),
+            (None, "boom", "Failed to generate html report: boom"),
+            ("render", "boom", "Failed to generate html report during render: boom"),
+        ],
+    )
+    def test_message_shapes(self, generation_step, error_details, expected):
+        """Test each combination of optional parts selects the right message."""
+        error = ReportGenerationError(
+            "html", generation_step=generation_step, error_details=error_details
+        )
+
+        assert str(error) == expected
+
     def test_init_with_output_file(self):
         """Test ReportGenerationError with output file."""
         output_file = Path("/tmp/report.json")
@@ -148,6 +165,14 @@ class TestReportGenerationError:
         
         assert "output_path" in error.technical_details
         assert error.technical_details["output_path"] == str(output_file)
+        assert error.recovery_suggestions == [
+            "Verify json format template is valid",
+            "Check available disk space and write permissions",
+            "Ensure comparison data is complete and valid",
+            "Verify output directory exists: /tmp",
+            f"Check write permissions for: {output_file}",
+            "Check for circular references in comparison data",
+        ]
 
     def test_init_with_template_error(self):
         """Test ReportGenerationError with template error."""
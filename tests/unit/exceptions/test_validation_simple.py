@@ -99,6 +99,68 @@ class TestInvalidSchemaError:
         assert error.technical_details["error_count"] == 1
         assert len(error.technical_details["validation_errors"]) == 1
 
+    def test_suggestions_from_validation_errors(self):
+        """Test each error hint adds its suggestion once, case-insensitively."""
+        validation_errors = [
+            "MISSING primary key",
+            "Foreign key points nowhere",
+            "Missing index",
+            "Check constraint is invalid",
+        ]
+        error = InvalidSchemaError("hinted_schema", validation_errors)
+
+        assert error.recovery_suggestions[3:] == [
+            "Restore missing schema objects or constraints",
+            "Review and fix constraint definitions",
+            "Check foreign key references and relationships",
+        ]
+
+    def test_no_hint_suggestions_for_unmatched_errors(self):
+        """Test unmatched errors only produce the static suggestions."""
+        error = InvalidSchemaError("plain_schema", ["Invalid column type"])
+
+        assert len(error.recovery_suggestions) == 3
+
+    def test_message_and_details_built_on_first_read(self):
+        """Test nothing is formatted until the error is inspected."""
+        error = InvalidSchemaError("lazy_schema", ["Missing index"], database="db")
+
+        assert error._message is None
+        assert error._technical_details is None
+        assert error._recovery_suggestions is None
+
+        assert str(error) == "Schema 'lazy_schema' in database 'db' failed validation"
+        assert error.technical_details == {
+            "schema_name": "lazy_schema",
+            "database": "db",
+            "validation_errors": ["Missing index"],
+            "error_count": 1,
+        }
+        assert error.to_dict()["recovery_suggestions"][-1] == (
+            "Restore missing schema objects or constraints"
+        )
+
+    def test_later_changes_to_caller_list_are_ignored(self):
+        """Test the lazily built details use the errors given at creation."""
+        validation_errors = ["Missing index"]
+        error = InvalidSchemaError("s", validation_errors)
+        validation_errors.clear()
+
+        data = error.to_dict()
+
+        assert data["technical_details"]["validation_errors"] == ["Missing index"]
+        assert data["technical_details"]["error_count"] == 1
+        assert data["recovery_suggestions"][-1] == (
+            "Restore missing schema objects or constraints"
+        )
+
+    def test_args_and_repr_show_message(self):
+        """Test the deferred message is visible through args and repr."""
+        error = InvalidSchemaError("s", ["Missing index"])
+
+        assert error.args == ("Schema 's' failed validation",)
+        assert repr(error) == "InvalidSchemaError(\"Schema 's' failed validation\")"
+
 
 class TestUnsupportedFeatureError:
     """Test cases for UnsupportedFeatureError class."""
@@ -172,4 +234,35 @@ class TestUnsupportedFeatureError:
         
         # Check workaround is in recovery suggestions
         assert any("Use functions instead" in suggestion 
-                  for suggestion in error.recovery_suggestions)
\ No newline at end of file
+                  for suggestion in error.recovery_suggestions)
+
+    def test_message_and_suggestions_built_on_first_read(self):
+        """Test the message and suggestions are formatted on demand."""
+        error = UnsupportedFeatureError(
+            "merge",
+            "command",
+            min_supported_version="15",
+            workaround_suggestion="upsert",
+        )
+
+        assert error._message is None
+        assert error._recovery_suggestions is None
+
+        assert str(error) == (
+            "Unsupported command: 'merge' (requires PostgreSQL 15 or higher)"
+        )
+        assert error.recovery_suggestions == [
+            "Consider alternative implementations for command",
+            "Review PostgreSQL version compatibility requirements",
+            "Upgrade PostgreSQL to version 15 or higher",
+            "Workaround: upsert",
+        ]
+
+    def test_args_and_repr_show_message(self):
+        """Test the deferred message is visible through args and repr."""
+        error = UnsupportedFeatureError("merge", "command")
+
+        assert error.args == ("Unsupported command: 'merge'",)
+        assert repr(error) == (
+            "UnsupportedFeatureError(\"Unsupported command: 'merge'\")"
+        )
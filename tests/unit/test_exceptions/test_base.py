@@ -3,9 +3,10 @@ Unit tests for base exception classes.
 """
 
 import json
+import sys
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from pgsd.exceptions.base import PGSDError, PGSDWarning, ErrorSeverity, ErrorCategory
 
@@ -52,7 +53,7 @@ class TestPGSDError:
         assert error.severity == ErrorSeverity.MEDIUM
         assert error.category == ErrorCategory.SYSTEM
         assert isinstance(error.id, str)
-        assert len(error.id) == 36  # UUID4 length
+        assert len(error.id) == 32  # UUID4 hex length
         assert isinstance(error.timestamp, datetime)
         assert error.technical_details == {}
         assert error.recovery_suggestions == []
@@ -132,6 +133,24 @@ class TestPGSDError:
         assert error_dict["timestamp"] == error.timestamp.isoformat()
         assert error_dict["original_error"] == "Test error"
 
+    def test_to_dict_uses_class_template(self):
+        """Test subclasses serialize from their own untouched template."""
+
+        class TemplateError(PGSDError):
+            default_error_code = "TEMPLATE_ERROR"
+            default_severity = ErrorSeverity.LOW
+
+        error_dict = TemplateError("Test error", user_action_required=False).to_dict()
+
+        assert list(error_dict) == list(PGSDError._dict_template)
+        assert error_dict["error_type"] == "TemplateError"
+        assert error_dict["error_code"] == "TEMPLATE_ERROR"
+        assert error_dict["severity"] == "low"
+        assert error_dict["user_action_required"] is False
+        assert error_dict["original_error"] is None
+        assert TemplateError._dict_template["id"] is None
+        assert TemplateError._dict_template["user_action_required"] is True
+
     def test_to_json_serialization(self):
         """Test serialization to JSON."""
         error = PGSDError(
@@ -146,6 +165,32 @@ class TestPGSDError:
         assert parsed["message"] == "Test error"
         assert parsed["technical_details"]["number"] == 42
 
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_to_json_matches_stdlib_formatting(self, indent):
+        """Test output is exactly what the stdlib encoder produces."""
+        error = PGSDError("Test error", technical_details={"number": 42})
+
+        json_str = error.to_json(indent=indent)
+
+        assert json_str == json.dumps(
+            error.to_dict(), indent=indent, ensure_ascii=False
+        )
+
+    def test_to_json_non_serializable_values(self):
+        """Test nested non-JSON values are converted instead of failing."""
+        when = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        error = PGSDError(
+            "Test error",
+            technical_details={"when": when, "nested": {"items": {1, 2}}},
+            context={"path": object()},
+        )
+
+        parsed = json.loads(error.to_json())
+
+        assert parsed["technical_details"]["when"] == "2024-01-02T03:04:05+00:00"
+        assert parsed["technical_details"]["nested"]["items"] == "{1, 2}"
+        assert parsed["context"]["path"].startswith("<object object")
+
     def test_get_exit_code(self):
         """Test exit code retrieval."""
         # Test default exit code
@@ -213,6 +258,33 @@ class TestPGSDError:
         assert error.get_retry_delay(2) == 6.0  # 2.0 * 3^1
         assert error.get_retry_delay(3) == 18.0  # 2.0 * 3^2
         assert error.get_retry_delay(4) == 30.0  # Capped at max_retry_delay
+        assert error.get_retry_delay(100) == 30.0  # Beyond the precomputed table
+        assert RetriableError._retry_delays[:4] == (2.0, 6.0, 18.0, 30.0)
+
+    def test_get_retry_delay_honours_instance_overrides(self):
+        """Test per-instance retry settings apply from the first attempt."""
+        error = PGSDError("Retriable error")
+        error.base_retry_delay = 0.5
+        error.retry_backoff_factor = 3.0
+
+        assert error.get_retry_delay(1) == 0.5
+        assert error.get_retry_delay(3) == 4.5
+        assert error.get_retry_delay(100) == 60.0
+        assert PGSDError("Other error").get_retry_delay(1) == 1.0
+
+    def test_get_retry_delay_follows_class_changes(self):
+        """Test retry settings patched on the class replace the precomputed table."""
+
+        class RetriableError(PGSDError):
+            retriable = True
+
+        error = RetriableError("Retriable error")
+
+        with patch.object(RetriableError, "base_retry_delay", 5.0):
+            assert error.get_retry_delay(1) == 5.0
+            assert error.get_retry_delay(2) == 10.0
+
+        assert error.get_retry_delay(1) == 1.0
 
     def test_timestamp_accuracy(self):
         """Test that timestamp is set accurately."""
@@ -222,6 +294,108 @@ class TestPGSDError:
 
         assert before <= error.timestamp <= after
 
+    def test_id_generated_lazily(self):
+        """Test the error ID is only generated when first read."""
+        with patch("pgsd.exceptions.base.uuid.uuid4") as uuid4:
+            uuid4.return_value.hex = "11111111222243338444555555555555"
+            error = PGSDError("Test error")
+
+            assert uuid4.call_count == 0
+            assert error.id == error.to_dict()["id"]
+            assert uuid4.call_count == 1
+
+    @pytest.mark.parametrize(
+        "timestamp_ns",
+        [1_700_000_000_123_456_789, 1_700_000_000_000_000_999, 0],
+    )
+    def test_to_dict_timestamp_matches_isoformat(self, timestamp_ns):
+        """Test serialized timestamps match datetime.isoformat()."""
+        error = PGSDError("Test error")
+        error._timestamp_ns = timestamp_ns
+
+        serialized = error.to_dict()["timestamp"]
+
+        assert serialized == error.timestamp.isoformat()
+
+    def test_error_state_kept_in_slots(self):
+        """Test standard error attributes are all stored in slots."""
+        error = PGSDError("Test error", context={"key": "value"})
+        error.to_dict()
+
+        assert getattr(error, "__dict__", {}) == {}
+
+    def test_empty_containers_allocated_on_first_use(self):
+        """Test omitted details, suggestions and context stay unallocated."""
+        error = PGSDError("Test error")
+
+        assert error._technical_details is None
+        assert error._recovery_suggestions is None
+        assert error._context is None
+
+        error.technical_details["key"] = "value"
+        error.add_context("step", "collect")
+
+        assert error.to_dict()["technical_details"] == {"key": "value"}
+        assert error.to_dict()["context"] == {"step": "collect"}
+        assert error.to_dict()["recovery_suggestions"] == []
+
+    def test_recovery_suggestions_accept_tuple(self):
+        """Test static suggestion tuples are exposed as a mutable list."""
+        suggestions = ("Retry", "Check logs")
+        error = PGSDError("Test error", recovery_suggestions=suggestions)
+
+        assert error._recovery_suggestions is suggestions
+
+        error.add_recovery_suggestion("Reconnect")
+
+        assert error.recovery_suggestions == ["Retry", "Check logs", "Reconnect"]
+        assert suggestions == ("Retry", "Check logs")
+
+    def test_add_recovery_suggestion_tracks_direct_list_changes(self):
+        """Test deduplication still sees suggestions appended to the list."""
+        error = PGSDError("Test error", recovery_suggestions=["Retry"])
+
+        error.add_recovery_suggestion("Retry")
+        error.recovery_suggestions.append("Check logs")
+        error.add_recovery_suggestion("Check logs")
+        error.recovery_suggestions = ["Reconnect"]
+        error.add_recovery_suggestion("Reconnect")
+        error.add_recovery_suggestion("Retry")
+
+        assert error.recovery_suggestions == ["Reconnect", "Retry"]
+
+    def test_add_recovery_suggestion_sees_in_place_edits(self):
+        """Test deduplication follows edits that keep the list length."""
+        error = PGSDError("Test error", recovery_suggestions=["a"])
+
+        error.add_recovery_suggestion("b")
+        error.recovery_suggestions[0] = "c"
+        error.add_recovery_suggestion("a")
+        error.add_recovery_suggestion("c")
+
+        assert error.recovery_suggestions == ["c", "b", "a"]
+
+    def test_copy_preserves_slot_state(self):
+        """Test copies carry the slotted attributes of the original."""
+        import copy
+
+        error = PGSDError("Test error", error_code="COPY_TEST")
+        error.add_context("key", "value")
+
+        copied = copy.copy(error)
+
+        assert copied.error_code == "COPY_TEST"
+        assert copied.context == {"key": "value"}
+        assert copied.timestamp == error.timestamp
+
+    def test_error_code_interned(self):
+        """Test custom error codes share one string object per value."""
+        code = "".join(["CUSTOM_", "CODE"])
+
+        error = PGSDError("Test error", error_code=code)
+
+        assert error.error_code is sys.intern("CUSTOM_CODE")
+
     def test_inheritance_defaults(self):
         """Test that subclasses can override defaults."""
 
@@ -238,6 +412,21 @@ class TestPGSDError:
         assert error.category == ErrorCategory.CONNECTION
         assert error.get_exit_code() == 99
 
+        error_dict = error.to_dict()
+        assert error_dict["severity"] == "critical"
+        assert error_dict["category"] == "connection"
+
+    def test_to_dict_reflects_reassigned_severity(self):
+        """Test severity and category changes after creation are serialized."""
+        error = PGSDError("Test error")
+
+        error.severity = ErrorSeverity.LOW
+        error.category = ErrorCategory.USER_INPUT
+
+        error_dict = error.to_dict()
+        assert error_dict["severity"] == "low"
+        assert error_dict["category"] == "user_input"
+
 
 @pytest.mark.unit
 class TestPGSDWarning:
@@ -3,6 +3,7 @@ Unit tests for database exception classes.
 """
 
 import pytest
+from typing import Optional
 from unittest.mock import Mock
 import psycopg2
 
@@ -13,6 +14,14 @@ from pgsd.exceptions.database import (
     SchemaNotFoundError,
     InsufficientPrivilegesError,
     QueryExecutionError,
+    SchemaCollectionError,
+    DatabaseVersionError,
+    DatabaseManagerError,
+    DatabasePoolError,
+    DatabaseQueryError,
+    DatabaseConfigurationError,
+    DatabasePermissionError,
+    DatabaseHealthError,
 )
 
 
@@ -41,7 +50,9 @@ class TestDatabaseConnectionError:
         """Test basic database connection error creation."""
         error = DatabaseConnectionError("localhost", 5432, "testdb")
 
-        assert "localhost:5432" in str(error)
+        assert str(error) == (
+            "Failed to connect to PostgreSQL database 'testdb' at localhost:5432"
+        )
         assert "testdb" in str(error)
         assert error.error_code == "DB_CONNECTION_FAILED"
         assert error.severity == ErrorSeverity.CRITICAL
@@ -62,13 +73,73 @@ class TestDatabaseConnectionError:
             for suggestion in error.recovery_suggestions
         )
 
+    def test_connection_error_message_formatted_lazily(self):
+        """Test the message is only built when read and survives pickling."""
+        import pickle
+
+        error = DatabaseConnectionError("localhost", 5432, "testdb", "appuser")
+
+        assert error._message is None
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert str(restored) == str(error) == (
+            "Failed to connect to PostgreSQL database 'testdb' "
+            "at localhost:5432 as user 'appuser'"
+        )
+        assert restored.technical_details["user"] == "appuser"
+
+    def test_connection_error_args_and_repr_show_message(self):
+        """Test args and repr resolve the deferred message like the baseline."""
+        message = "Failed to connect to PostgreSQL database 'd' at h:5432"
+        error = DatabaseConnectionError("h", 5432, "d")
+
+        assert error.args == (message,)
+        assert repr(error) == f"DatabaseConnectionError({message!r})"
+
+        pg_error = Mock(spec=psycopg2.OperationalError)
+        pg_error.pgcode = "08006"
+        pg_error.pgerror = "could not connect to server"
+        wrapped = DatabaseConnectionError.from_psycopg2_error(
+            pg_error, host="h", port=5432, database="d", user="u"
+        )
+
+        assert repr(wrapped) == (
+            "DatabaseConnectionError(\"Failed to connect to PostgreSQL database "
+            "'d' at h:5432 as user 'u'\")"
+        )
+        assert wrapped.args == (str(wrapped),)
+
+    def test_connection_error_details_built_lazily(self):
+        """Test details and suggestions are built from stored parameters."""
+        original = ConnectionError("Network unreachable")
+        error = DatabaseConnectionError("localhost", 5432, "testdb", None, original)
+
+        assert error._technical_details is None
+        assert error._recovery_suggestions is None
+
+        assert list(error.technical_details) == [
+            "host",
+            "port",
+            "database",
+            "user",
+            "connection_type",
+            "original_error_type",
+            "original_error_message",
+        ]
+        assert error.recovery_suggestions[-1] == (
+            "Verify that database 'testdb' exists on the server"
+        )
+        assert error.recovery_suggestions is error.recovery_suggestions
+
     def test_connection_error_with_user(self):
         """Test connection error with user information."""
         error = DatabaseConnectionError("db.example.com", 5433, "myapp", "appuser")
 
-        assert "db.example.com:5433" in str(error)
-        assert "myapp" in str(error)
-        assert "appuser" in str(error)
+        assert str(error) == (
+            "Failed to connect to PostgreSQL database 'myapp' "
+            "at db.example.com:5433 as user 'appuser'"
+        )
         assert error.technical_details["user"] == "appuser"
 
     def test_connection_error_with_original_error(self):
@@ -123,6 +194,25 @@ class TestDatabaseConnectionError:
         assert "postgres_error_code" not in error.technical_details
         assert "postgres_error_message" not in error.technical_details
 
+    def test_from_psycopg2_error_skips_missing_codes(self):
+        """Test pgcode/pgerror left as None by the driver are not recorded."""
+        pg_error = Mock(spec=psycopg2.OperationalError)
+        pg_error.pgcode = None
+        pg_error.pgerror = "server closed the connection unexpectedly"
+
+        error = DatabaseConnectionError.from_psycopg2_error(
+            pg_error, host="localhost", port=5432, database="testdb"
+        )
+
+        assert "postgres_error_code" not in error.technical_details
+        assert error.technical_details["postgres_error_message"] == (
+            "server closed the connection unexpectedly"
+        )
+        assert error.original_error is pg_error
+        assert str(error) == (
+            "Failed to connect to PostgreSQL database 'testdb' at localhost:5432"
+        )
+
 
 @pytest.mark.unit
 class TestSchemaNotFoundError:
@@ -160,7 +250,13 @@ class TestSchemaNotFoundError:
             available_schemas=available_schemas,
         )
 
-        assert error.technical_details["available_schemas"] == available_schemas
+        available_schemas.append("late_addition")
+
+        assert error.technical_details["available_schemas"] == [
+            "public",
+            "information_schema",
+            "pg_catalog",
+        ]
 
         # Should include available schemas in recovery suggestions
         assert any(
@@ -267,6 +363,29 @@ class TestQueryExecutionError:
             for suggestion in error.recovery_suggestions
         )
 
+    def test_query_error_args_and_repr_show_message(self):
+        """Test the lazily formatted message still reaches args and repr."""
+        error = QueryExecutionError("select 1", "boom")
+
+        assert error.args == ("Query execution failed: boom",)
+        assert repr(error) == "QueryExecutionError('Query execution failed: boom')"
+
+    def test_static_suggestions_not_shared(self):
+        """Test each error gets its own copy of the class-level suggestions."""
+        first = QueryExecutionError(query="SELECT 1", error_message="failed")
+        second = QueryExecutionError(query="SELECT 2", error_message="failed")
+
+        # Nothing is built until the suggestions are first read
+        assert first._recovery_suggestions is None
+        assert first._message is None
+
+        first.add_recovery_suggestion("Retry later")
+
+        assert "Retry later" not in second.recovery_suggestions
+        assert second.recovery_suggestions[:4] == list(
+            QueryExecutionError._STATIC_SUGGESTIONS
+        )
+
     def test_query_error_with_postgres_code(self):
         """Test query error with PostgreSQL error code."""
         query = "INSERT INTO table VALUES (1, 'duplicate')"
@@ -291,6 +410,24 @@ class TestQueryExecutionError:
 
         assert error.original_error == original
 
+    def test_query_error_details_kept_as_record(self):
+        """Test details are stored as a record and converted on first read."""
+        error = QueryExecutionError(
+            "SELECT 1", "boom", "42601", original_error=ValueError("bad")
+        )
+
+        assert error._technical_details is None
+        assert error._details_record.postgres_error_code == "42601"
+
+        assert error.technical_details == {
+            "query": "SELECT 1",
+            "error_message": "boom",
+            "postgres_error_code": "42601",
+            "original_error_type": "ValueError",
+            "original_error_message": "bad",
+        }
+        assert error.to_dict()["technical_details"] is error.technical_details
+
     def test_long_query_truncation(self):
         """Test that very long queries are truncated in technical details."""
         long_query = "SELECT * FROM table WHERE " + "x = 1 AND " * 100 + "y = 2"
@@ -298,9 +435,11 @@ class TestQueryExecutionError:
 
         error = QueryExecutionError(query=long_query, error_message=error_message)
 
+        assert error._details_record.query is long_query
+
         stored_query = error.technical_details["query"]
         assert len(stored_query) <= 503  # 500 + "..."
-        assert stored_query.endswith("...")
+        assert stored_query == long_query[:500] + "..."
 
     def test_short_query_not_truncated(self):
         """Test that short queries are not truncated."""
@@ -340,6 +479,72 @@ class TestDatabaseErrorIntegration:
         }
         assert len(exit_codes) == 4  # All different
 
+    @pytest.mark.parametrize(
+        "error",
+        [
+            DatabaseConnectionError("localhost", 5432, "testdb", "appuser"),
+            SchemaNotFoundError("test_schema", "testdb", ["public"]),
+            InsufficientPrivilegesError("read", ["SELECT"], "appuser", "users"),
+            QueryExecutionError("SELECT 1", "error", "42601"),
+            SchemaCollectionError("failed", schema="public", database_type="source"),
+            DatabaseVersionError("old", version="12.0", minimum_required="13.0"),
+            DatabaseManagerError("failed", operation="connect"),
+            DatabasePoolError("exhausted", pool_size=5, active_connections=5),
+            DatabaseQueryError("failed", query="SELECT 1", error_code="42601"),
+            DatabaseConfigurationError("bad", config_field="port", config_value="x"),
+            DatabasePermissionError("denied", operation="read", object_name="users"),
+            DatabaseHealthError("down", health_status="bad", failed_checks=["ping"]),
+        ],
+        ids=lambda error: type(error).__name__,
+    )
+    def test_error_fields_kept_in_slots(self, error):
+        """Test no database error stores its fields outside slots."""
+        error.to_dict()
+
+        assert getattr(error, "__dict__", {}) == {}
+
+    def test_field_constructor_builds_details_lazily(self):
+        """Test constructor fields feed attributes, details and suggestions."""
+        import pickle
+
+        error = DatabaseVersionError("too old", "12.0", minimum_required="13.0")
+
+        assert error.version == "12.0"
+        assert error.minimum_required == "13.0"
+        assert error._recovery_suggestions is None
+        assert error.technical_details == {
+            "detected_version": "12.0",
+            "minimum_required": "13.0",
+        }
+        assert error.recovery_suggestions == [
+            *DatabaseVersionError._STATIC_SUGGESTIONS,
+            "Ensure PostgreSQL version is 13.0 or higher",
+        ]
+
+        restored = pickle.loads(pickle.dumps(DatabaseManagerError("failed")))
+        assert restored.operation is None
+        assert restored.recovery_suggestions == list(
+            DatabaseManagerError._STATIC_SUGGESTIONS
+        )
+
+    def test_field_constructor_signature(self):
+        """Test field-based constructors expose their typed parameters."""
+        import inspect
+
+        parameters = inspect.signature(SchemaCollectionError).parameters
+
+        assert list(parameters) == ["message", "schema", "database_type", "kwargs"]
+        assert parameters["schema"].annotation == Optional[str]
+        with pytest.raises(TypeError):
+            DatabaseManagerError("failed", "connect", "extra")
+
+    def test_database_query_error_keeps_default_error_code(self):
+        """Test the driver error code goes to details, not error_code."""
+        error = DatabaseQueryError("failed", query="SELECT 1", error_code="42601")
+
+        assert error.error_code == "QUERY_ERROR"
+        assert error.technical_details["error_code"] == "42601"
+
     def test_retriable_vs_non_retriable(self):
         """Test retriable vs non-retriable database errors."""
         # Retriable errors
@@ -1,6 +1,7 @@
 """Tests for main entry point."""
 
 import pytest
+import logging
 import sys
 import signal
 import threading
@@ -71,6 +72,26 @@ class TestCleanupFunctionality:
         captured = capsys.readouterr()
         assert "Warning: Cleanup error: Callback error" in captured.err
 
+    def test_cleanup_tolerates_registration_during_run(self):
+        """Test callbacks may register more callbacks while cleanup runs."""
+        late_callback = Mock()
+        register_cleanup(lambda: register_cleanup(late_callback))
+
+        cleanup()
+
+        late_callback.assert_called_once()
+        assert not _cleanup_callbacks
+
+    def test_cleanup_is_idempotent(self):
+        """Test repeated cleanup calls run each callback only once."""
+        callback = Mock()
+        register_cleanup(callback)
+
+        cleanup()
+        cleanup()
+
+        callback.assert_called_once()
+
     def test_cleanup_empty_callbacks(self):
         """Test cleanup with no registered callbacks."""
         # Should not raise exception
@@ -154,19 +175,13 @@ class TestApplicationSetup:
     @patch('atexit.register')
     @patch('pgsd.main.setup_signal_handlers')
     @patch('logging.basicConfig')
-    @patch('pgsd.main.get_default_config')
-    def test_setup_application(self, mock_get_config, mock_basicConfig, mock_setup_signals, mock_atexit):
+    def test_setup_application(self, mock_basicConfig, mock_setup_signals, mock_atexit):
         """Test application setup."""
-        # Mock log config
-        mock_log_config = Mock()
-        mock_log_config.level = "WARNING"
-        mock_get_config.return_value = mock_log_config
-        
         setup_application()
         
         mock_atexit.assert_called_once_with(cleanup)
         mock_setup_signals.assert_called_once()
-        mock_basicConfig.assert_called_once()
+        mock_basicConfig.assert_called_once_with(level=logging.WARNING)
 
 
 class TestMainFunction:
@@ -324,4 +339,60 @@ class TestMainModuleExecution:
         # The __main__ block execution is tested through integration tests
         import pgsd.main
         assert hasattr(pgsd.main, 'main')
-        assert hasattr(pgsd.main, 'console_entry_point')
\ No newline at end of file
+        assert hasattr(pgsd.main, 'console_entry_point')
+    def test_main_module_import_skips_cli(self):
+        """Test importing the entry point does not pull in the CLI package."""
+        import subprocess
+
+        code = (
+            "import sys, pgsd.main; "
+            "print('pgsd.cli.main' in sys.modules, 'pgsd.core' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={"PYTHONPATH": ":".join(sys.path)},
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_cli_manager_resolved_lazily(self):
+        """Test CLIManager stays reachable on the package and entry module."""
+        import pgsd
+        import pgsd.main
+        from pgsd.cli.main import CLIManager
+
+        assert pgsd.main.CLIManager is CLIManager
+        assert pgsd.CLIManager is CLIManager
+        assert "CLIManager" in dir(pgsd)
+        with pytest.raises(AttributeError):
+            pgsd.main.NotAThing
+
+
+class TestVersionFastPath:
+    """Test the --version shortcut in main."""
+
+    @patch('pgsd.main.setup_application')
+    @patch('pgsd.main.CLIManager')
+    def test_version_skips_cli(self, mock_cli_manager, mock_setup, capsys):
+        """Test --version prints the version without building the CLI."""
+        from pgsd import __version__
+
+        assert main(['--version']) == 0
+
+        assert capsys.readouterr().out == f"pgsd {__version__}\n"
+        mock_cli_manager.assert_not_called()
+        mock_setup.assert_not_called()
+
+    def test_version_matches_cli_parser(self, capsys):
+        """Test the shortcut prints exactly what the argparse action prints."""
+        from pgsd.cli.main import CLIManager
+
+        main(['--version'])
+        fast = capsys.readouterr().out
+
+        with pytest.raises(SystemExit):
+            CLIManager().parser.parse_args(['--version'])
+
+        assert capsys.readouterr().out == fast
@@ -1,6 +1,7 @@
 """Additional tests for main.py to improve coverage."""
 
 import pytest
+import logging
 import sys
 import signal
 import threading
@@ -214,9 +215,9 @@ class TestAdvancedCleanupFunctionality:
         
         cleanup()
         
-        # Note: Current implementation doesn't clear callbacks
-        # This test documents the current behavior
-        assert len(_cleanup_callbacks) == 1
+        assert len(_cleanup_callbacks) == 0
+        cleanup()
+        callback.assert_called_once()
 
     def test_cleanup_with_exception_in_stderr_write(self):
         """Test cleanup handles stderr write exceptions."""
@@ -338,34 +339,17 @@ class TestAdvancedApplicationSetup:
     @patch('atexit.register')
     @patch('pgsd.main.setup_signal_handlers')
     @patch('logging.basicConfig')
-    @patch('pgsd.main.get_default_config')
-    def test_setup_application_logging_config(self, mock_get_config, mock_basicConfig, mock_setup_signals, mock_atexit):
-        """Test application setup with different logging configurations."""
-        # Test with different log levels
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            mock_get_config.reset_mock()
-            mock_basicConfig.reset_mock()
-            
-            mock_log_config = Mock()
-            mock_log_config.level = level
-            mock_get_config.return_value = mock_log_config
-            
-            setup_application()
-            
-            mock_basicConfig.assert_called_once()
-            call_kwargs = mock_basicConfig.call_args.kwargs
-            assert 'level' in call_kwargs
+    def test_setup_application_logging_config(self, mock_basicConfig, mock_setup_signals, mock_atexit):
+        """Test application setup configures basic WARNING-level logging."""
+        setup_application()
+        
+        mock_basicConfig.assert_called_once_with(level=logging.WARNING)
 
     @patch('atexit.register')
     @patch('pgsd.main.setup_signal_handlers', side_effect=Exception("Signal setup failed"))
     @patch('logging.basicConfig')
-    @patch('pgsd.main.get_default_config')
-    def test_setup_application_signal_setup_failure(self, mock_get_config, mock_basicConfig, mock_setup_signals, mock_atexit):
+    def test_setup_application_signal_setup_failure(self, mock_basicConfig, mock_setup_signals, mock_atexit):
         """Test application setup when signal setup fails."""
-        mock_log_config = Mock()
-        mock_log_config.level = "INFO"
-        mock_get_config.return_value = mock_log_config
-        
         # Should not raise exception even if signal setup fails
         setup_application()
         
@@ -375,13 +359,8 @@ class TestAdvancedApplicationSetup:
     @patch('atexit.register', side_effect=Exception("Atexit failed"))
     @patch('pgsd.main.setup_signal_handlers')
     @patch('logging.basicConfig')
-    @patch('pgsd.main.get_default_config')
-    def test_setup_application_atexit_failure(self, mock_get_config, mock_basicConfig, mock_setup_signals, mock_atexit):
+    def test_setup_application_atexit_failure(self, mock_basicConfig, mock_setup_signals, mock_atexit):
         """Test application setup when atexit registration fails."""
-        mock_log_config = Mock()
-        mock_log_config.level = "INFO"
-        mock_get_config.return_value = mock_log_config
-        
         # Should not raise exception even if atexit fails
         setup_application()
         
@@ -391,13 +370,8 @@ class TestAdvancedApplicationSetup:
     @patch('atexit.register')
     @patch('pgsd.main.setup_signal_handlers')
     @patch('logging.basicConfig', side_effect=Exception("Logging failed"))
-    @patch('pgsd.main.get_default_config')
-    def test_setup_application_logging_failure(self, mock_get_config, mock_basicConfig, mock_setup_signals, mock_atexit):
+    def test_setup_application_logging_failure(self, mock_basicConfig, mock_setup_signals, mock_atexit):
         """Test application setup when logging configuration fails."""
-        mock_log_config = Mock()
-        mock_log_config.level = "INFO"
-        mock_get_config.return_value = mock_log_config
-        
         # Should not raise exception even if logging setup fails
         setup_application()
         
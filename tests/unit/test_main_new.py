@@ -172,22 +172,14 @@ class TestSetupApplication:
 
     @patch('atexit.register')
     @patch('src.pgsd.main.setup_signal_handlers')
-    @patch('src.pgsd.main.get_default_config')
     @patch('logging.basicConfig')
-    def test_setup_application(self, mock_basic_config, mock_get_config, 
-                              mock_setup_signals, mock_atexit):
+    def test_setup_application(self, mock_basic_config, mock_setup_signals, mock_atexit):
         """Test application setup."""
-        # Setup mock config
-        mock_config = Mock()
-        mock_config.level = "WARNING"
-        mock_get_config.return_value = mock_config
-        
         setup_application()
         
         # Verify calls
         mock_atexit.assert_called_once_with(cleanup)
         mock_setup_signals.assert_called_once()
-        mock_get_config.assert_called_once()
         mock_basic_config.assert_called_once()
 
 
@@ -339,9 +331,7 @@ class TestMainIntegration:
         mock_cli_manager.return_value = mock_cli_instance
         
         # Execute
-        with patch('src.pgsd.main.get_default_config') as mock_config:
-            mock_config.return_value = Mock(level="WARNING")
-            result = main(['version'])
+        result = main(['version'])
         
         # Verify
         assert result == 0
@@ -243,6 +243,14 @@ class TestLoggingSetup:
         root_logger = logging.getLogger()
         assert root_logger.level == logging.DEBUG
 
+    def test_setup_logging_level_applies_to_handlers(self):
+        """Test a lower-case level name sets the root and handler levels."""
+        setup_logging(LogConfig(level="warning", console_output=True))
+
+        root_logger = logging.getLogger()
+        assert root_logger.level == logging.WARNING
+        assert root_logger.handlers[0].level == logging.WARNING
+
     def test_setup_logging_with_file_output(self):
         """Test setup_logging with file output."""
         with tempfile.TemporaryDirectory() as temp_dir: